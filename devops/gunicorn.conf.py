@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for production.
+
+Workers write metrics to PROMETHEUS_MULTIPROC_DIR so that any of them can
+serve the metrics of all of them. The directory must be set in the
+environment before gunicorn starts (see start-prod.sh).
+"""
+
+import os
+import shutil
+
+from prometheus_client import multiprocess
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+graceful_timeout = 30
+
+
+def on_starting(server):
+    """Drop metric files left behind by a previous run"""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Stop reporting live gauges of a worker that has exited"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,26 @@
+import argparse
+
+from src.services.catalog_crawler import CatalogCrawler
+
+
+def crawl_catalog(roots, full=False):
+    """Crawl storage roots into the file catalog index."""
+    for root in roots:
+        stats = CatalogCrawler(root).crawl(full=full)
+        print(
+            f"{root}: scanned {stats.directories_scanned} directories, "
+            f"skipped {stats.directories_skipped}, upserted {stats.entries_upserted}, "
+            f"deleted {stats.entries_deleted} in {stats.duration:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=crawl_catalog.__doc__)
+    parser.add_argument("roots", nargs="+", help="Storage roots to crawl")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rescan every directory, catching files edited in place",
+    )
+    args = parser.parse_args()
+    crawl_catalog(args.roots, full=args.full)
@@ -1,10 +1,170 @@
-from src.db.session import SessionLocal
+import argparse
+import itertools
+import math
+import random
+import time
+from typing import Any, Dict, Iterator, List, Optional
 
+from sqlalchemy import delete
 
-def seed_database():
-    """Seed database with initial data for development."""
-    pass
+from src.db.models.file_catalog import FileCatalogEntry
+from src.db.repositories import FileCatalogRepository
+from src.db.session import SessionLocal, engine
+
+# One unit of scale is one storage root of DIRECTORIES_PER_ROOT directories
+# holding FILES_PER_DIRECTORY files each (~100k catalog rows)
+DIRECTORIES_PER_ROOT = 100
+FILES_PER_DIRECTORY = 1_000
+SEED_ROOT_PREFIX = "/seed/root-"
+EXTENSIONS = ("csv", "json", "parquet", "txt", "log", "png", "bin")
+# Fixed clock so that every run produces identical rows
+BASE_TIME = 1_700_000_000.0
+YEAR = 365 * 24 * 3600.0
+
+
+def _entry(
+    root: str,
+    path: str,
+    parent: Optional[str],
+    size: int,
+    mtime: float,
+    is_dir: bool,
+    rng: random.Random,
+) -> Dict[str, Any]:
+    return {
+        "root": root,
+        "path": path,
+        "parent": parent,
+        "name": path.rsplit("/", 1)[-1],
+        "size": size,
+        "created": mtime - rng.random() * YEAR,
+        "last_modified": mtime,
+        "mtime_ns": int(mtime * 1_000_000_000),
+        "is_file": not is_dir,
+        "is_dir": is_dir,
+        "content_hash": None if is_dir else format(rng.getrandbits(256), "064x"),
+        "crawled_at": BASE_TIME,
+    }
+
+
+def generate_catalog_rows(scale: float, seed: int) -> Iterator[Dict[str, Any]]:
+    """Yield a deterministic synthetic file catalog, one row at a time"""
+    directories = max(1, round(scale * DIRECTORIES_PER_ROOT))
+    for root_index in range(math.ceil(directories / DIRECTORIES_PER_ROOT)):
+        rng = random.Random(f"{seed}-{root_index}")
+        root = f"{SEED_ROOT_PREFIX}{root_index:04d}"
+        in_root = min(DIRECTORIES_PER_ROOT, directories)
+        directories -= in_root
+        yield _entry(root, "", None, 4096, BASE_TIME, True, rng)
+        for dir_index in range(in_root):
+            directory = f"d{dir_index:03d}"
+            mtime = BASE_TIME - rng.random() * YEAR
+            yield _entry(root, directory, "", 4096, mtime, True, rng)
+            for file_index in range(FILES_PER_DIRECTORY):
+                extension = EXTENSIONS[rng.randrange(len(EXTENSIONS))]
+                yield _entry(
+                    root,
+                    f"{directory}/f{file_index:04d}.{extension}",
+                    directory,
+                    int(rng.lognormvariate(10, 2)),
+                    mtime - rng.random() * YEAR,
+                    False,
+                    rng,
+                )
+
+
+def _batches(
+    rows: Iterator[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    while True:
+        batch = list(itertools.islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def seed_database(
+    scale: float = 0.0,
+    seed: int = 42,
+    batch_size: int = 50_000,
+    rebuild_indexes: bool = False,
+) -> Dict[str, float]:
+    """Seed database with a deterministic synthetic file catalog."""
+    if scale <= 0:
+        print("Nothing to seed; pass --scale to load a synthetic catalog")
+        return {
+            "rows": 0,
+            "load_seconds": 0.0,
+            "index_seconds": 0.0,
+            "rows_per_second": 0.0,
+        }
+
+    table = FileCatalogEntry.__table__
+    with SessionLocal() as session:
+        session.execute(
+            delete(FileCatalogEntry).where(
+                FileCatalogEntry.root.like(f"{SEED_ROOT_PREFIX}%")
+            )
+        )
+        session.commit()
+
+    # Secondary indexes can be dropped for the load and rebuilt once at the
+    # end, which is far cheaper than maintaining them row by row. This locks
+    # the catalog, so it is only for databases nothing else is serving from
+    indexes = list(table.indexes) if rebuild_indexes else []
+    for index in indexes:
+        index.drop(engine, checkfirst=True)
+
+    rows = 0
+    started_at = time.perf_counter()
+    try:
+        for batch in _batches(generate_catalog_rows(scale, seed), batch_size):
+            with SessionLocal() as session:
+                rows += FileCatalogRepository(session).bulk_insert(batch)
+                session.commit()
+            elapsed = time.perf_counter() - started_at
+            print(f"  {rows:>12,} rows  {rows / elapsed:>12,.0f} rows/s", flush=True)
+    finally:
+        load_seconds = time.perf_counter() - started_at
+        for index in indexes:
+            index.create(engine, checkfirst=True)
+    index_seconds = time.perf_counter() - started_at - load_seconds
+
+    stats = {
+        "rows": rows,
+        "load_seconds": load_seconds,
+        "index_seconds": index_seconds,
+        "rows_per_second": rows / load_seconds if load_seconds else 0.0,
+    }
+    print(
+        f"Loaded {rows:,} rows in {load_seconds:.1f}s "
+        f"({stats['rows_per_second']:,.0f} rows/s); "
+        f"rebuilt {len(indexes)} indexes in {index_seconds:.1f}s"
+    )
+    return stats
 
 
 if __name__ == "__main__":
-    seed_database()
+    parser = argparse.ArgumentParser(description=seed_database.__doc__)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=0.0,
+        help="Dataset size; 1.0 is about 100k catalog rows, 0 seeds nothing",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument(
+        "--batch-size", type=int, default=50_000, help="Rows per COPY batch"
+    )
+    parser.add_argument(
+        "--rebuild-indexes",
+        action="store_true",
+        help="Drop the catalog indexes for the load and rebuild them afterwards",
+    )
+    args = parser.parse_args()
+    seed_database(
+        scale=args.scale,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        rebuild_indexes=args.rebuild_indexes,
+    )
@@ -7,8 +7,6 @@ python devops/scripts/wait_for_db.py
 echo "Running migrations..."
 alembic upgrade head
 
-echo "Seeding database..."
-python devops/scripts/seed_db.py
-
 echo "Starting application..."
-uvicorn src.main:app --host $HOST --port $PORT
+export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}
+exec gunicorn src.main:app --config devops/gunicorn.conf.py
@@ -7,8 +7,11 @@ python devops/scripts/wait_for_db.py
 echo "Running migrations..."
 alembic upgrade head
 
-echo "Seeding database..."
-python devops/scripts/seed_db.py
+# Synthetic catalog data is opt-in, e.g. SEED_SCALE=0.01 for ~1k rows
+if [ -n "${SEED_SCALE:-}" ]; then
+    echo "Seeding database..."
+    python devops/scripts/seed_db.py --scale "$SEED_SCALE"
+fi
 
 echo "Starting application..."
 uvicorn src.main:app --host $HOST --port $PORT --reload
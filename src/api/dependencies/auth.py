@@ -1,3 +1,4 @@
+import time
 from typing import Dict
 
 import jwt
@@ -6,38 +7,53 @@ from fastapi.security import OAuth2PasswordBearer
 
 from src.core.config import settings
 from src.core.exceptions import InvalidTokenError
+from src.core.token_cache import TOKEN_VERIFY_DURATION, get_token_cache, token_scopes
 from src.utils.response import create_error_response
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=True)
 
+REQUIRED_SCOPES = frozenset({"files:read"})
+
 
 def verify_token(token: str = Depends(oauth2_scheme)) -> Dict:
     """
     Verify JWT token and return payload if valid
+    Verified payloads are cached until the token expires, so repeated
+    requests with the same token skip signature and claim validation.
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.AUTH_SECRET_KEY,
-            algorithms=[settings.AUTH_ALGORITHM],
-            audience=settings.AUTH_TOKEN_AUDIENCE,
-            issuer=settings.AUTH_TOKEN_ISSUER,
-        )
-
-        # Verify required scope is present
-        scopes = payload.get("scope", [])
-        if "files:read" not in scopes:
-            error_response = create_error_response(
-                code="AUTH004",
-                message="Token missing required scope",
-                status_code=status.HTTP_403_FORBIDDEN,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN, detail=error_response
+    started_at = time.perf_counter()
+    cache = get_token_cache()
+    verified = cache.get(token)
+    if verified is None:
+        try:
+            payload = jwt.decode(
+                token,
+                settings.AUTH_SECRET_KEY,
+                algorithms=[settings.AUTH_ALGORITHM],
+                audience=settings.AUTH_TOKEN_AUDIENCE,
+                issuer=settings.AUTH_TOKEN_ISSUER,
             )
+        except jwt.ExpiredSignatureError:
+            raise InvalidTokenError("Token has expired")
+        except jwt.InvalidTokenError as e:
+            raise InvalidTokenError(str(e))
+        verified = payload, token_scopes(payload)
+        cache.put(token, *verified)
+        result = "miss"
+    else:
+        result = "hit"
+    payload, scopes = verified
+    TOKEN_VERIFY_DURATION.labels(cache=result).observe(time.perf_counter() - started_at)
+
+    # Verify required scope is present
+    if not REQUIRED_SCOPES <= scopes:
+        error_response = create_error_response(
+            code="AUTH004",
+            message="Token missing required scope",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail=error_response
+        )
 
-        return payload
-    except jwt.ExpiredSignatureError:
-        raise InvalidTokenError("Token has expired")
-    except jwt.InvalidTokenError as e:
-        raise InvalidTokenError(str(e))
+    return dict(payload)
@@ -0,0 +1,85 @@
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import Depends, HTTPException, Request, status
+
+from src.api.dependencies.auth import verify_token
+from src.core.rate_limit import Decision, RateLimit, get_rate_limiter
+from src.utils.response import create_error_response
+
+
+def client_address(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit_error() -> Dict[str, Any]:
+    return create_error_response(
+        code="RATE001",
+        message="Rate limit exceeded",
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+    )
+
+
+class RouteRateLimit:
+    """
+    The limit applied to one route, keyed by client IP and, for
+    authenticated routes, by token subject
+    """
+
+    def __init__(self, route: str, default: Optional[str], per_subject: bool):
+        self.route = route
+        self.default = RateLimit.parse(default) if default else None
+        self.per_subject = per_subject
+
+    def keys(self, request: Request, token_data: Optional[Dict[str, Any]]) -> List[str]:
+        keys = [f"ip:{client_address(request)}"]
+        if self.per_subject and token_data and token_data.get("sub"):
+            keys.insert(0, f"sub:{token_data['sub']}")
+        return keys
+
+    async def check(
+        self, request: Request, token_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[Decision]:
+        """Consume capacity for this request; the decision is kept for headers"""
+        decision = await get_rate_limiter().check(
+            self.route, self.keys(request, token_data), self.default
+        )
+        if decision is not None:
+            request.state.rate_limit = decision
+        return decision
+
+
+def _raise_if_limited(decision: Optional[Decision]) -> None:
+    if decision is not None and not decision.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=rate_limit_error(),
+            headers=decision.headers(),
+        )
+
+
+def rate_limit(route: str, default: Optional[str] = None) -> Callable:
+    """
+    Dependency limiting requests to `route` per client IP. The limit is
+    RATE_LIMIT_ROUTES[route], else `default`, else RATE_LIMIT_DEFAULT.
+    """
+    limit = RouteRateLimit(route, default, per_subject=False)
+
+    async def dependency(request: Request) -> None:
+        _raise_if_limited(await limit.check(request))
+
+    dependency.route_rate_limit = limit
+    return dependency
+
+
+def rate_limit_authenticated(route: str, default: Optional[str] = None) -> Callable:
+    """
+    Like `rate_limit`, but also limits each token subject, so a user's
+    allowance is the same whichever address their requests come from
+    """
+    limit = RouteRateLimit(route, default, per_subject=True)
+
+    async def dependency(request: Request, token_data=Depends(verify_token)) -> None:
+        _raise_if_limited(await limit.check(request, token_data))
+
+    dependency.route_rate_limit = limit
+    return dependency
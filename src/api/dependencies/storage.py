@@ -0,0 +1,33 @@
+from enum import Enum
+
+from fastapi import Query
+
+from src.infrastructure.storage.registry import get_storage_registry
+from src.services.file_service import FileService
+
+
+class ListingSource(str, Enum):
+    FILESYSTEM = "filesystem"
+    INDEX = "index"
+
+
+async def get_file_service(
+    base_path: str = Query(..., description="Base path for file operations"),
+) -> FileService:
+    """Shared FileService for the requested storage root"""
+    root = await get_storage_registry().get(base_path)
+    return root.file_service
+
+
+async def get_listing_service(
+    base_path: str = Query(..., description="Base path for file operations"),
+    source: ListingSource = Query(
+        ListingSource.FILESYSTEM,
+        description="Answer from the filesystem or from the crawled file catalog",
+    ),
+) -> FileService:
+    """FileService for metadata queries, backed by the filesystem or the index"""
+    root = await get_storage_registry().get(base_path)
+    if source is ListingSource.INDEX:
+        return root.catalog_service
+    return root.file_service
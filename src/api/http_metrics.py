@@ -0,0 +1,88 @@
+import time
+from typing import Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.utils.routing import route_template
+
+# Route label of requests no route matched, so that arbitrary paths sent by
+# clients share one series instead of creating one each
+UNMATCHED_ROUTE = "unmatched"
+# Other request methods are counted together for the same reason
+KNOWN_METHODS = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT"}
+)
+
+
+def parse_buckets(value: str) -> Tuple[float, ...]:
+    """Histogram bucket bounds from a comma-separated list"""
+    return tuple(sorted(float(bound) for bound in value.split(",") if bound.strip()))
+
+
+REQUEST_COUNT = Counter(
+    "http_requests_total", "Total HTTP requests", ["method", "route", "status"]
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency, until the last body chunk is sent",
+    ["method", "route"],
+    buckets=parse_buckets(settings.METRICS_LATENCY_BUCKETS),
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size",
+    ["method", "route"],
+    buckets=parse_buckets(settings.METRICS_SIZE_BUCKETS),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+
+class HTTPMetricsMiddleware:
+    """
+    Records request count, latency and response size per method and route
+    template, e.g. "/api/v1/files/{path}" rather than each concrete path.
+
+    The route is only known once the request has been routed, so requests
+    in flight are counted per method.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in KNOWN_METHODS else "OTHER"
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - started_at
+            in_flight.dec()
+            route = route_template(Request(scope)) or UNMATCHED_ROUTE
+            REQUEST_COUNT.labels(method, route, status).inc()
+            REQUEST_LATENCY.labels(method, route).observe(duration)
+            RESPONSE_SIZE.labels(method, route).observe(size)
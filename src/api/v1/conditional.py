@@ -0,0 +1,103 @@
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response, status
+
+
+def _stamp(value: float) -> str:
+    # Microsecond resolution is enough to tell stat timestamps apart and keeps
+    # tags stable across float round-trips
+    return format(round(value * 1_000_000), "x")
+
+
+def metadata_validators(metadata: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Weak ETag and Last-Modified for a metadata document. The tag covers size,
+    mtime and ctime; ctime changes whenever the inode does, including when a
+    file is replaced by rename.
+    """
+    tag = "-".join(
+        (
+            format(metadata["size"], "x"),
+            _stamp(metadata["last_modified"]),
+            _stamp(metadata["created"]),
+        )
+    )
+    return {
+        "ETag": f'W/"{tag}"',
+        "Last-Modified": formatdate(metadata["last_modified"], usegmt=True),
+    }
+
+
+def content_validators(last_modified: float, size: int) -> Dict[str, str]:
+    """Strong ETag and Last-Modified for file content"""
+    return {
+        "ETag": f'"{format(size, "x")}-{_stamp(last_modified)}"',
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+    }
+
+
+def listing_validators(version: Optional[str], *query: Any) -> Dict[str, str]:
+    """
+    Weak ETag for a listing page, derived from the directory version and the
+    query that selected the page. Unversioned directories get no validator.
+    """
+    if version is None:
+        return {}
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(version.encode())
+    for part in query:
+        digest.update(b"\0" + str(part).encode())
+    return {"ETag": f'W/"{digest.hexdigest()}"'}
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, validators: Dict[str, str]) -> bool:
+    """
+    Evaluate If-None-Match (weak comparison) or, when absent, If-Modified-Since
+    against the current validators, as specified by RFC 9110 section 13.2.2.
+    """
+    if request.method not in ("GET", "HEAD") or not validators:
+        return False
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = validators.get("ETag")
+        if etag is None:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        current = _opaque_tag(etag)
+        return any(_opaque_tag(tag) == current for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = validators.get("Last-Modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+        modified = parsedate_to_datetime(last_modified)
+    except (TypeError, ValueError):
+        return False
+    return modified <= since
+
+
+def if_range_matches(request: Request, validators: Dict[str, str]) -> bool:
+    """Whether a Range request may be honored given its If-Range precondition"""
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        # If-Range requires a strong match
+        return if_range == validators.get("ETag") and not if_range.startswith("W/")
+    return if_range == validators.get("Last-Modified")
+
+
+def not_modified_response(validators: Dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators)
@@ -1,74 +1,178 @@
+import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import (  # Added Response import for file content
     JSONResponse,
     Response,
+    StreamingResponse,
 )
 from pydantic import BaseModel  # Import for BatchRequest model
 
 from src.api.dependencies.auth import verify_token  # Fix import path
+from src.api.dependencies.rate_limit import rate_limit_authenticated
+from src.api.dependencies.storage import get_file_service, get_listing_service
+from src.api.v1.conditional import (
+    content_validators,
+    if_range_matches,
+    is_not_modified,
+    listing_validators,
+    metadata_validators,
+    not_modified_response,
+)
 from src.api.v1.decorators import handle_file_errors
 from src.api.v1.models.responses import (
+    BatchErrorResponse,
     ErrorResponse,
     FileMetadataResponse,
     PaginatedDirectoryResponse,
 )
+from src.api.v1.response_cache import CachedAPIRoute, cache_response
+from src.api.v1.streaming import build_content_response, guess_media_type
+from src.core.config import settings
 from src.core.exceptions import FileNotFoundError
-from src.core.interfaces.storage import StorageBackend
-from src.infrastructure.storage.factory import get_storage
-from src.infrastructure.storage.filesystem import FilesystemStorage
+from src.core.interfaces.storage import ListingQuery
 from src.services.file_service import FileService
 
 router = APIRouter(
-    prefix="/files", tags=["files"]
+    prefix="/files", tags=["files"], route_class=CachedAPIRoute
 )  # Make sure router is defined at module level
 
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
 class BatchRequest(BaseModel):
     paths: list[str]
 
 
-@router.get("", response_model=FileMetadataResponse)
+@router.api_route(
+    "",
+    methods=["GET", "HEAD"],
+    response_model=FileMetadataResponse,
+    dependencies=[Depends(rate_limit_authenticated("files.metadata"))],
+)
+@cache_response(ttl=settings.STORAGE_METADATA_CACHE_TTL)
 @handle_file_errors
 async def get_file_metadata(
+    request: Request,
+    response: Response,
     path: str,
-    storage: StorageBackend = Depends(get_storage),
+    file_service: FileService = Depends(get_file_service),
     token_data=Depends(verify_token),
 ):
     """Get metadata for a file"""
-    file_service = FileService(storage)
-    return file_service.get_metadata(path)
+    metadata = await file_service.get_metadata(path)
+    validators = metadata_validators(metadata)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    response.headers.update(validators)
+    return metadata
 
 
-@router.get("/content")
+@router.api_route(
+    "/content",
+    methods=["GET", "HEAD"],
+    dependencies=[Depends(rate_limit_authenticated("files.content"))],
+)
 @handle_file_errors
 async def get_file_content(
+    request: Request,
     path: str,
-    storage: StorageBackend = Depends(get_storage),
+    raw: bool = Query(False, description="Stream raw bytes instead of JSON"),
+    file_service: FileService = Depends(get_file_service),
     token_data=Depends(verify_token),
 ):
-    """Get content of a text file"""
-    file_service = FileService(storage)
-    content = file_service.read_content(path)
-    return JSONResponse(content={"content": content})
+    """
+    Get content of a file
+    JSON mode wraps text content and is capped at FILES_CONTENT_MAX_JSON_BYTES;
+    raw mode streams any file and honors single and multi-part Range requests.
+    """
+    last_modified, size = await file_service.get_validator(path)
+    validators = content_validators(last_modified, size)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
 
+    if raw:
+        if request.method == "HEAD":
+            return Response(
+                headers={
+                    **validators,
+                    "Accept-Ranges": "bytes",
+                    "Content-Length": str(size),
+                },
+                media_type=guess_media_type(path),
+            )
+        range_header = request.headers.get("range")
+        if not if_range_matches(request, validators):
+            range_header = None
+        response = await build_content_response(file_service, path, range_header)
+        response.headers.update(validators)
+        return response
 
-@router.get("/list", response_model=PaginatedDirectoryResponse)
+    if size > settings.FILES_CONTENT_MAX_JSON_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "error": {
+                    "message": f"File exceeds "
+                    f"{settings.FILES_CONTENT_MAX_JSON_BYTES} bytes, "
+                    f"use raw=true to download it"
+                }
+            },
+        )
+    content = await file_service.read_content(path)
+    return JSONResponse(content={"content": content}, headers=validators)
+
+
+@router.get(
+    "/list",
+    response_model=PaginatedDirectoryResponse,
+    dependencies=[Depends(rate_limit_authenticated("files.list"))],
+)
+@cache_response(ttl=settings.FILES_LIST_CACHE_TTL)
 async def list_directory(
+    request: Request,
+    response: Response,
     path: str = "",
-    base_path: str = Query(..., description="Base path for file operations"),
     limit: int = Query(50, ge=1, le=200),
     cursor: Optional[str] = None,
+    sort: str = Query("name", pattern="^(name|size|mtime)$"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    min_size: Optional[int] = Query(None, ge=0, description="Minimum size in bytes"),
+    modified_after: Optional[datetime] = Query(
+        None, description="Only entries modified after this time"
+    ),
+    entry_type: Optional[str] = Query(None, alias="type", pattern="^(file|dir)$"),
+    extension: Optional[str] = Query(None, description="File extension, e.g. csv"),
+    file_service: FileService = Depends(get_listing_service),
     token_data=Depends(verify_token),
 ):
-    """List contents of a directory with pagination"""
+    """
+    List contents of a directory with pagination
+    Entries can be sorted by name, size or mtime and filtered by size,
+    modification time, type and extension; only the requested page is
+    materialized.
+    """
     try:
-        storage = FilesystemStorage(Path(base_path))
-        file_service = FileService(storage)
-        return file_service.list_directory(path, limit=limit, cursor=cursor)
+        query = ListingQuery(
+            sort=sort,
+            descending=order == "desc",
+            min_size=min_size,
+            modified_after=modified_after.timestamp() if modified_after else None,
+            type=entry_type,
+            extension=extension,
+        )
+        version = await file_service.directory_version(path)
+        validators = listing_validators(version, path, limit, cursor, query)
+        if is_not_modified(request, validators):
+            return not_modified_response(validators)
+        response.headers.update(validators)
+        return await file_service.list_directory(
+            path, limit=limit, cursor=cursor, query=query
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -80,20 +184,46 @@ async def list_directory(
         )
 
 
-@router.post("/batch", response_model=list[FileMetadataResponse])
+@router.post(
+    "/batch",
+    response_model=list[Union[FileMetadataResponse, BatchErrorResponse]],
+    dependencies=[Depends(rate_limit_authenticated("files.batch", "120/minute"))],
+)
 async def batch_get_files(
     payload: BatchRequest,
-    base_path: str = Query(..., description="Base path for file operations"),
+    request: Request,
+    file_service: FileService = Depends(get_listing_service),
     token_data=Depends(verify_token),
 ):
-    """Return metadata for multiple files"""
-    storage = FilesystemStorage(Path(base_path))
-    file_service = FileService(storage)
-    results = []
-    for file_path in payload.paths:
-        try:
-            meta = file_service.get_metadata(file_path)
-            results.append(meta)
-        except FileNotFoundError as e:
-            results.append({"path": file_path, "error": str(e)})
-    return results
+    """
+    Return metadata for multiple files
+    Duplicate paths are looked up once. With `Accept: application/x-ndjson`
+    results are streamed one JSON object per line in completion order,
+    otherwise they are returned as a list in request order.
+    """
+    paths = list(dict.fromkeys(payload.paths))
+    if len(paths) > settings.FILES_BATCH_MAX_PATHS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": {
+                    "message": f"Batch exceeds the maximum of "
+                    f"{settings.FILES_BATCH_MAX_PATHS} paths"
+                }
+            },
+        )
+
+    results = file_service.iter_metadata(
+        paths, concurrency=settings.FILES_BATCH_CONCURRENCY
+    )
+
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+
+        async def ndjson_lines():
+            async for _, metadata in results:
+                yield json.dumps(metadata) + "\n"
+
+        return StreamingResponse(ndjson_lines(), media_type=NDJSON_MEDIA_TYPE)
+
+    by_path = {path: metadata async for path, metadata in results}
+    return [by_path[path] for path in paths]
@@ -1,10 +1,14 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from src.api.dependencies.rate_limit import rate_limit
+from src.api.v1.response_cache import CachedAPIRoute, cache_response
+from src.core.config import settings
 from src.services.hello import get_hello_message
 
-router = APIRouter(tags=["hello"])
+router = APIRouter(tags=["hello"], route_class=CachedAPIRoute)
 
 
-@router.get("/hello")
+@router.get("/hello", dependencies=[Depends(rate_limit("hello"))])
+@cache_response(ttl=settings.HELLO_CACHE_TTL)
 def hello_world():
     return {"message": get_hello_message()}
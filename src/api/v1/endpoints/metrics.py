@@ -1,9 +1,58 @@
+import asyncio
+import os
+import time
+from typing import Optional, Tuple
+
 from fastapi import APIRouter, Response
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+from starlette.concurrency import run_in_threadpool
+
+from src.core.config import settings
 
 router = APIRouter(tags=["metrics"])
 
+# Last rendered exposition and when it was rendered (monotonic)
+_exposition: Optional[Tuple[float, bytes]] = None
+_exposition_lock = asyncio.Lock()
+
+
+def multiprocess_enabled() -> bool:
+    """Whether workers share metrics through PROMETHEUS_MULTIPROC_DIR"""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> bytes:
+    """
+    Exposition of this process' metrics or, under a pre-fork server
+    running in multiprocess mode, of every worker's metrics combined
+    """
+    if not multiprocess_enabled():
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+async def cached_metrics() -> bytes:
+    """
+    Rendered exposition, reused for METRICS_CACHE_TTL seconds so that
+    frequent scrapes do not re-aggregate every worker's files each time
+    """
+    global _exposition
+    async with _exposition_lock:
+        now = time.monotonic()
+        if _exposition is None or now - _exposition[0] >= settings.METRICS_CACHE_TTL:
+            # Aggregation reads one file per worker and metric type
+            _exposition = (now, await run_in_threadpool(render_metrics))
+        return _exposition[1]
+
 
 @router.get("/metrics")
 async def metrics():
-    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    return Response(await cached_metrics(), media_type=CONTENT_TYPE_LATEST)
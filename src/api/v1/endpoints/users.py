@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
+from src.api.dependencies.rate_limit import rate_limit
+
 router = APIRouter(tags=["users"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
-@router.get("/users/me")
+@router.get("/users/me", dependencies=[Depends(rate_limit("users"))])
 async def read_users_me(token: str = Depends(oauth2_scheme)):
     """
     Get current user information
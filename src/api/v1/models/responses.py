@@ -15,6 +15,13 @@ class FileMetadataResponse(BaseModel):
     is_dir: bool
 
 
+class BatchErrorResponse(BaseModel):
+    """Batch entry for a path whose metadata could not be read"""
+
+    path: str
+    error: str
+
+
 class PaginationInfo(BaseModel):
     """Pagination information"""
 
@@ -0,0 +1,258 @@
+import base64
+import json
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from prometheus_client import Counter
+from starlette.responses import StreamingResponse
+
+from src.api.dependencies.auth import verify_token
+from src.api.dependencies.rate_limit import rate_limit_error
+from src.api.v1.conditional import is_not_modified, not_modified_response
+from src.core.cache import TieredCache
+from src.core.config import settings
+from src.core.exceptions import InvalidTokenError
+from src.core.token_cache import token_scopes
+from src.utils.routing import route_template
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    "http_response_cache_requests_total",
+    "Requests to cacheable routes by outcome "
+    "(hit, not_modified, revalidated, miss, bypass)",
+    ["route", "result"],
+)
+
+# Headers that describe one exchange rather than the cached representation
+EXCHANGE_HEADERS = frozenset(
+    {b"content-length", b"date", b"server-timing", b"set-cookie"}
+)
+CONDITIONAL_HEADERS = frozenset({b"if-none-match", b"if-modified-since"})
+
+Handler = Callable[[Request], Coroutine[Any, Any, Response]]
+
+
+def cache_response(ttl: float) -> Callable:
+    """
+    Opt a GET route into the response cache. Responses are reused for
+    `ttl` seconds and then revalidated with their ETag, when they have one.
+    Routers serving such routes use `CachedAPIRoute` as their route class.
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.response_cache_ttl = ttl
+        return endpoint
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        found = {}
+        for name, value in self.headers:
+            if name == b"etag":
+                found["ETag"] = value.decode("latin-1")
+            elif name == b"last-modified":
+                found["Last-Modified"] = value.decode("latin-1")
+        return found
+
+    @property
+    def weight(self) -> int:
+        return len(self.body)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "headers": [
+                [name.decode("latin-1"), value.decode("latin-1")]
+                for name, value in self.headers
+            ],
+            "body": base64.b64encode(self.body).decode("ascii"),
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CachedResponse":
+        return cls(
+            [
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in data["headers"]
+            ],
+            base64.b64decode(data["body"]),
+        )
+
+    def response(self) -> Response:
+        response = Response(content=self.body)
+        response.raw_headers = self.headers + [
+            (b"content-length", str(len(self.body)).encode())
+        ]
+        return response
+
+
+_response_cache: Optional[TieredCache] = None
+_response_cache_lock = Lock()
+
+
+def get_response_cache() -> TieredCache:
+    """Process-wide response cache, shared through Redis when CACHE_REDIS_ENABLED"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = TieredCache.create(
+                "http.responses",
+                max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+                max_weight=settings.RESPONSE_CACHE_MAX_BYTES,
+                weigh=lambda cached: cached.weight,
+                encode=CachedResponse.to_json,
+                decode=CachedResponse.from_json,
+            )
+        return _response_cache
+
+
+def _authorize(request: Request) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Whether the request's credentials, if any, verify, and their payload"""
+    authorization = request.headers.get("authorization")
+    if authorization is None:
+        return True, None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False, None
+    try:
+        return True, verify_token(token)
+    except (InvalidTokenError, HTTPException):
+        return False, None
+
+
+def _cacheable(response: Response) -> bool:
+    if response.status_code != 200 or isinstance(response, StreamingResponse):
+        return False
+    body = getattr(response, "body", None)
+    if body is None or len(body) > settings.RESPONSE_CACHE_MAX_ENTRY_BYTES:
+        return False
+    cache_control = response.headers.get("cache-control", "").lower()
+    return "no-store" not in cache_control and "set-cookie" not in response.headers
+
+
+class CachedAPIRoute(APIRoute):
+    """
+    Route that serves opted-in GET endpoints from a cache of encoded
+    responses, skipping dependency resolution, validation and serialization.
+
+    Entries are keyed by route template, normalized query string and the
+    caller's scope set. Bearer tokens are still verified (through the token
+    cache) and the route's rate limits still apply to cache hits. Expired
+    entries with an ETag are revalidated by running the route
+    conditionally; a 304 renews the entry without re-encoding it. Entries
+    are refreshed ahead of expiry with probabilistic early expiration, so
+    a popular route is refreshed by one request rather than by every
+    request arriving once it expires.
+    """
+
+    def get_route_handler(self) -> Handler:
+        handler = super().get_route_handler()
+        if getattr(self.endpoint, "response_cache_ttl", None) is None:
+            return handler
+
+        async def cached_handler(request: Request) -> Response:
+            ttl = self.endpoint.response_cache_ttl
+            if request.method != "GET" or not settings.RESPONSE_CACHE_ENABLED:
+                return await handler(request)
+            route = request.scope.get("route", self)
+            template = route_template(request) or self.path_format
+            verified, token_data = _authorize(request)
+            if not verified:
+                RESPONSE_CACHE_REQUESTS.labels(template, "bypass").inc()
+                return await handler(request)
+
+            cache = get_response_cache()
+            key = json.dumps(
+                [
+                    template,
+                    urlencode(sorted(parse_qsl(request.url.query))),
+                    " ".join(sorted(token_scopes(token_data or {}))),
+                ]
+            )
+            entry = await cache.get_entry(key)
+            if entry is not None and not entry.refresh_due(
+                cache.l1.clock(), cache.beta
+            ):
+                await _check_rate_limits(route, request, token_data)
+                return _serve(template, entry.value, request, "hit")
+
+            # Expired entries are still held in this worker's L1 until evicted
+            if entry is None:
+                entry = cache.l1.get_entry(key)
+            stale = entry.value if entry is not None else None
+            revalidating = (
+                stale is not None
+                and "ETag" in stale.validators
+                and not any(
+                    name in CONDITIONAL_HEADERS for name, _ in request.scope["headers"]
+                )
+            )
+            started_at = time.perf_counter()
+            if revalidating:
+                # Ask the route whether the stored representation is still
+                # current; it answers 304 without encoding a body when it is
+                scope = dict(request.scope)
+                scope["headers"] = scope["headers"] + [
+                    (b"if-none-match", stale.validators["ETag"].encode("latin-1"))
+                ]
+                response = await handler(Request(scope, request.receive))
+                if response.status_code == status.HTTP_304_NOT_MODIFIED:
+                    await cache.set(
+                        key, stale, ttl=ttl, delta=time.perf_counter() - started_at
+                    )
+                    return _serve(template, stale, request, "revalidated")
+            else:
+                response = await handler(request)
+
+            RESPONSE_CACHE_REQUESTS.labels(template, "miss").inc()
+            if _cacheable(response):
+                headers = [
+                    (name, value)
+                    for name, value in response.raw_headers
+                    if name.lower() not in EXCHANGE_HEADERS
+                ]
+                cached = CachedResponse(headers, bytes(response.body))
+                await cache.set(
+                    key, cached, ttl=ttl, delta=time.perf_counter() - started_at
+                )
+            return response
+
+        return cached_handler
+
+
+async def _check_rate_limits(
+    route: APIRoute, request: Request, token_data: Optional[Dict[str, Any]]
+) -> None:
+    """Apply the route's rate limit dependencies, which a cache hit skips"""
+    for dependency in route.dependencies:
+        limit = getattr(dependency.dependency, "route_rate_limit", None)
+        if limit is None:
+            continue
+        decision = await limit.check(request, token_data)
+        if decision is not None and not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=rate_limit_error(),
+                headers=decision.headers(),
+            )
+
+
+def _serve(
+    template: str, cached: CachedResponse, request: Request, result: str
+) -> Response:
+    validators = cached.validators
+    if is_not_modified(request, validators):
+        RESPONSE_CACHE_REQUESTS.labels(template, "not_modified").inc()
+        return not_modified_response(validators)
+    RESPONSE_CACHE_REQUESTS.labels(template, result).inc()
+    return cached.response()
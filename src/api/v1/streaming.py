@@ -0,0 +1,173 @@
+import mimetypes
+import secrets
+from typing import AsyncIterator, BinaryIO, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from src.services.file_service import FileService
+
+# Requests asking for more ranges than this are refused rather than letting
+# a client fan one download out into thousands of tiny parts
+MAX_RANGES = 16
+
+ByteRange = Tuple[int, int]
+
+
+class RangeNotSatisfiable(Exception):
+    """None of the requested byte ranges overlap the file"""
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[List[ByteRange]]:
+    """
+    Parse a `Range: bytes=...` header into inclusive `(start, end)` pairs
+    clamped to the file size. Returns None when the header is absent or
+    malformed, in which case the whole file is served (RFC 9110 14.2).
+    """
+    if not header:
+        return None
+    unit, _, specs = header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs.strip():
+        return None
+
+    ranges = []
+    for spec in specs.split(","):
+        first, sep, last = spec.strip().partition("-")
+        if not sep:
+            return None
+        try:
+            if first:
+                start = int(first)
+                end = size - 1
+                if last:
+                    end = int(last)
+                    # An inverted range is malformed; an open-ended one
+                    # starting past the end is merely unsatisfiable
+                    if end < start:
+                        return None
+            else:
+                suffix = int(last)
+                start, end = max(size - suffix, 0), size - 1
+                if suffix == 0:
+                    continue
+        except ValueError:
+            return None
+        if start < 0:
+            return None
+        if start < size:
+            ranges.append((start, min(end, size - 1)))
+
+    if not ranges or len(ranges) > MAX_RANGES:
+        raise RangeNotSatisfiable()
+    return ranges
+
+
+class _WholeFileResponse(FileResponse):
+    """
+    `FileResponse` that always sends the whole file. Range and If-Range are
+    already resolved by `build_content_response`, and Starlette would
+    otherwise re-parse them, refusing malformed ranges with a 400.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"range", b"if-range")
+        ]
+        await super().__call__({**scope, "headers": headers}, receive, send)
+
+
+def guess_media_type(path: str) -> str:
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+async def build_content_response(
+    file_service: FileService, path: str, range_header: Optional[str]
+) -> Response:
+    """
+    Raw file response: the whole file via `FileResponse` (zero-copy where the
+    server supports it) or chunked 206 responses for single and multi-part
+    byte ranges. The file is opened before any headers are produced so
+    missing paths still map to proper error responses.
+    """
+    handle, size = await file_service.open_content(path)
+    media_type = guess_media_type(path)
+    try:
+        ranges = parse_range_header(range_header, size)
+    except RangeNotSatisfiable:
+        await file_service.close_content(handle)
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail={"error": {"message": "Requested range not satisfiable"}},
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+
+    headers = {"Accept-Ranges": "bytes"}
+    if ranges is None:
+        local_path = file_service.storage.local_path(path)
+        if local_path is not None:
+            await file_service.close_content(handle)
+            return _WholeFileResponse(
+                local_path, media_type=media_type, headers=headers
+            )
+        ranges = [(0, size - 1)]
+        status_code = status.HTTP_200_OK
+    else:
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        if status_code == status.HTTP_206_PARTIAL_CONTENT:
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(max(end - start + 1, 0))
+        body = _stream_parts(file_service, handle, [(start, end, b"")], b"")
+        return StreamingResponse(
+            body, status_code=status_code, media_type=media_type, headers=headers
+        )
+
+    boundary = secrets.token_hex(16)
+    parts = [
+        (
+            start,
+            end,
+            (
+                f"--{boundary}\r\nContent-Type: {media_type}\r\n"
+                f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+            ).encode(),
+        )
+        for start, end in ranges
+    ]
+    trailer = f"--{boundary}--\r\n".encode()
+    headers["Content-Length"] = str(
+        sum(len(head) + (end - start + 1) + 2 for start, end, head in parts)
+        + len(trailer)
+    )
+    return StreamingResponse(
+        _stream_parts(file_service, handle, parts, trailer, separator=b"\r\n"),
+        status_code=status_code,
+        media_type=f"multipart/byteranges; boundary={boundary}",
+        headers=headers,
+    )
+
+
+async def _stream_parts(
+    file_service: FileService,
+    handle: BinaryIO,
+    parts: List[Tuple[int, int, bytes]],
+    trailer: bytes,
+    separator: bytes = b"",
+) -> AsyncIterator[bytes]:
+    try:
+        for start, end, head in parts:
+            if head:
+                yield head
+            async for chunk in file_service.iter_range(handle, start, end):
+                yield chunk
+            if separator:
+                yield separator
+        if trailer:
+            yield trailer
+    finally:
+        await file_service.close_content(handle)
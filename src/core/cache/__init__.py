@@ -0,0 +1,20 @@
+"""
+Shared caching: an in-process LRU/TTL tier (`LRUCache`), an optional
+Redis tier (`TieredCache`), and invalidation broadcast between workers.
+"""
+
+from src.core.cache.invalidation import (
+    InvalidationBus,
+    start_cache_invalidation,
+    stop_cache_invalidation,
+)
+from src.core.cache.memory import CacheEntry, LRUCache, caches_named, clear_caches
+from src.core.cache.tiered import RedisCache, TieredCache
+
+# Name of the verified-token cache (see src.core.token_cache)
+TOKEN_CACHE_NAME = "auth.tokens"
+
+
+def clear_test_tokens() -> None:
+    """Forget verified tokens so that tests do not see each other's tokens"""
+    clear_caches(TOKEN_CACHE_NAME)
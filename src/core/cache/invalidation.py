@@ -0,0 +1,132 @@
+import asyncio
+import json
+import uuid
+from typing import Any, Hashable, Optional, Set
+
+import redis.asyncio as redis
+from prometheus_client import Counter
+from redis.exceptions import RedisError
+
+from src.core.cache.memory import caches_named, set_invalidation_publisher
+from src.core.config import settings
+from src.core.redis_client import get_redis_client
+from src.utils.logging import logger
+
+CACHE_INVALIDATIONS = Counter(
+    "cache_invalidation_messages_total",
+    "Cache invalidations exchanged with other workers",
+    ["direction"],
+)
+
+# Seconds between attempts to resubscribe after losing the Redis connection
+RESUBSCRIBE_DELAY = 1.0
+# Longest wait for a message; an idle channel is not a connection error
+LISTEN_TIMEOUT = 30.0
+
+
+def _as_key(value: Any) -> Hashable:
+    """Rebuild a cache key from JSON, where tuples arrive as lists"""
+    if isinstance(value, list):
+        return tuple(_as_key(item) for item in value)
+    return value
+
+
+class InvalidationBus:
+    """
+    Broadcasts cache invalidations over Redis pub/sub so that every worker,
+    on every node, drops keys invalidated by any one of them.
+
+    Delivery is best effort: messages published while a worker is
+    disconnected are lost, and its copies stay until their TTL expires.
+    """
+
+    def __init__(self, client: redis.Redis, channel: str):
+        self.client = client
+        self.channel = channel
+        # Identifies this worker's own messages, which are already applied
+        self.origin = uuid.uuid4().hex
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._sends: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._listener = asyncio.create_task(self._listen())
+        set_invalidation_publisher(self.publish)
+
+    async def stop(self) -> None:
+        set_invalidation_publisher(None)
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+        if self._sends:
+            await asyncio.gather(*self._sends, return_exceptions=True)
+
+    def publish(self, cache: str, key: Hashable) -> None:
+        """Announce an invalidation; safe to call from any thread"""
+        message = json.dumps({"origin": self.origin, "cache": cache, "key": key})
+        self._loop.call_soon_threadsafe(self._send, message)
+
+    def _send(self, message: str) -> None:
+        task = self._loop.create_task(self._publish(message))
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def _publish(self, message: str) -> None:
+        try:
+            await self.client.publish(self.channel, message)
+            CACHE_INVALIDATIONS.labels("sent").inc()
+        except (RedisError, OSError) as e:
+            CACHE_INVALIDATIONS.labels("failed").inc()
+            logger.warning("cache_invalidation_publish_failed - error=%s", e)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                while True:
+                    # An explicit timeout overrides the client's socket
+                    # timeout and yields None instead of raising
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=LISTEN_TIMEOUT
+                    )
+                    if message is not None and message["type"] == "message":
+                        self.apply(message["data"])
+            except (RedisError, OSError) as e:
+                logger.warning("cache_invalidation_listener_lost - error=%s", e)
+                await asyncio.sleep(RESUBSCRIBE_DELAY)
+            finally:
+                await pubsub.close()
+
+    def apply(self, data: bytes) -> None:
+        """Drop the key named in a message published by another worker"""
+        try:
+            payload = json.loads(data)
+            origin, cache, key = payload["origin"], payload["cache"], payload["key"]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("cache_invalidation_malformed - error=%s", e)
+            return
+        if origin == self.origin:
+            return
+        CACHE_INVALIDATIONS.labels("received").inc()
+        key = _as_key(key)
+        for instance in caches_named(cache):
+            instance.delete(key)
+
+
+_bus: Optional[InvalidationBus] = None
+
+
+async def start_cache_invalidation() -> None:
+    global _bus
+    if _bus is None:
+        _bus = InvalidationBus(get_redis_client(), settings.CACHE_INVALIDATION_CHANNEL)
+        await _bus.start()
+
+
+async def stop_cache_invalidation() -> None:
+    global _bus
+    bus, _bus = _bus, None
+    if bus is not None:
+        await bus.stop()
@@ -0,0 +1,217 @@
+import math
+import random
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from weakref import WeakSet
+
+from prometheus_client import Counter, Gauge
+
+# Metrics are labelled by cache name and by the type of storage backend a
+# cache serves, which is empty for process-wide caches. Backend types are
+# few, unlike the base paths clients may ask for.
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Cache lookups by cache and outcome",
+    ["cache", "backend", "result"],
+)
+CACHE_EVICTIONS = Counter(
+    "cache_evictions_total",
+    "Cache entries evicted to stay within bounds",
+    ["cache", "backend"],
+)
+CACHE_WEIGHT = Gauge(
+    "cache_weight",
+    "Weight (entries, or items for weighted caches) held",
+    ["cache", "backend"],
+    multiprocess_mode="livesum",
+)
+
+# Every live cache by name, so that invalidations received from other
+# workers and test cleanup can reach all instances sharing a name
+_caches: Dict[str, "WeakSet[LRUCache]"] = defaultdict(WeakSet)
+_caches_lock = Lock()
+# Set while an invalidation bus is running (see src.core.cache.invalidation)
+_publisher: Optional[Callable[[str, Hashable], None]] = None
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    # Monotonic expiry time, None for entries that only leave by eviction
+    expires_at: Optional[float]
+    weight: int = 1
+    # Seconds it took to compute the value, used for early refresh
+    delta: float = 0.0
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+    def refresh_due(self, now: float, beta: float = 1.0) -> bool:
+        """
+        Probabilistic early expiration (XFetch): each reader refreshes ahead
+        of expiry with a probability that grows as expiry nears and with
+        the cost of recomputation, so one reader usually recomputes the
+        value before it lapses instead of all of them at once afterwards
+        """
+        if self.expires_at is None:
+            return False
+        jitter = -self.delta * beta * math.log(1.0 - random.random())
+        return now + jitter >= self.expires_at
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU with optional per-entry TTL.
+
+    Bounded by entry count and, for caches holding values of very
+    different sizes, by total entry weight. Caches are named; instances
+    sharing a name are invalidated together. Caches kept per storage root
+    also pass the backend type as `backend`, so that their metrics can be
+    told apart.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl: Optional[float] = None,
+        max_weight: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        backend: str = "",
+    ):
+        self.name = name
+        self.backend = backend
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_weight = max_weight
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._weight = 0
+        self._lock = Lock()
+        self._weight_gauge = CACHE_WEIGHT.labels(name, backend)
+        with _caches_lock:
+            _caches[name].add(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and (self.max_weight is None or self.max_weight > 0)
+
+    @property
+    def weight(self) -> int:
+        return self._weight
+
+    def record(self, result: str, count: int = 1) -> None:
+        """Count lookups resolved outside `get`, e.g. revalidated entries"""
+        if result == "miss":
+            self.misses += count
+        else:
+            self.hits += count
+        CACHE_LOOKUPS.labels(self.name, self.backend, result).inc(count)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Live value for `key`, counting the lookup as a hit or miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.expired(self.clock()):
+                self._entries.move_to_end(key)
+                value = entry.value
+            else:
+                entry = None
+        self.record("hit" if entry is not None else "miss")
+        return value if entry is not None else default
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """Entry for `key` even if expired, without counting a lookup"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        weight: int = 1,
+        delta: float = 0.0,
+    ) -> int:
+        """
+        Store `value` and return how many entries were evicted to fit it.
+        Values heavier than `max_weight` are not stored.
+        """
+        if not self.enabled or (
+            self.max_weight is not None and weight > self.max_weight
+        ):
+            return 0
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self.clock() + ttl
+        evicted = 0
+        with self._lock:
+            weight_before = self._weight
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._weight -= previous.weight
+            self._entries[key] = CacheEntry(value, expires_at, weight, delta)
+            self._weight += weight
+            while len(self._entries) > self.max_entries or (
+                self.max_weight is not None and self._weight > self.max_weight
+            ):
+                _, dropped = self._entries.popitem(last=False)
+                self._weight -= dropped.weight
+                evicted += 1
+            self.evictions += evicted
+            self._weight_gauge.inc(self._weight - weight_before)
+        if evicted:
+            CACHE_EVICTIONS.labels(self.name, self.backend).inc(evicted)
+        return evicted
+
+    def delete(self, key: Hashable) -> None:
+        """Drop `key` from this instance only"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._weight -= entry.weight
+                self._weight_gauge.dec(entry.weight)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop `key` here and in every worker listening for invalidations"""
+        self.delete(key)
+        if _publisher is not None:
+            _publisher(self.name, key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._weight_gauge.dec(self._weight)
+            self._entries.clear()
+            self._weight = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def set_invalidation_publisher(
+    publisher: Optional[Callable[[str, Hashable], None]],
+) -> None:
+    global _publisher
+    _publisher = publisher
+
+
+def caches_named(name: str) -> List[LRUCache]:
+    with _caches_lock:
+        return list(_caches.get(name, ()))
+
+
+def clear_caches(name: Optional[str] = None) -> None:
+    """Empty every cache called `name`, or every cache when no name is given"""
+    with _caches_lock:
+        names = [name] if name is not None else list(_caches)
+        caches = [cache for each in names for cache in _caches.get(each, ())]
+    for cache in caches:
+        cache.clear()
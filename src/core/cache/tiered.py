@@ -0,0 +1,186 @@
+import json
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from src.core.cache.memory import CacheEntry, LRUCache
+from src.core.config import settings
+from src.core.redis_client import get_redis_client
+from src.utils.logging import logger
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class RedisCache:
+    """
+    JSON values in Redis with a TTL, stored with their wall-clock expiry
+    and computation time so that early refresh works across tiers.
+    Values that are not JSON are stored through `encode` and `decode`.
+    Unavailability is treated as a miss.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        prefix: str,
+        encode: Callable[[Any], Any] = _identity,
+        decode: Callable[[Any], Any] = _identity,
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.encode = encode
+        self.decode = decode
+
+    async def get_entry(self, key: str) -> Optional[CacheEntry]:
+        try:
+            raw = await self.client.get(self.prefix + key)
+        except (RedisError, OSError) as e:
+            logger.warning("cache_l2_unavailable - key=%s error=%s", key, e)
+            return None
+        if raw is None:
+            return None
+        stored = json.loads(raw)
+        # Expiry is carried as wall-clock time; entries use the monotonic clock
+        remaining = stored["expires_at"] - time.time()
+        return CacheEntry(
+            self.decode(stored["value"]),
+            time.monotonic() + remaining,
+            delta=stored["delta"],
+        )
+
+    async def set(self, key: str, value: Any, ttl: float, delta: float = 0.0) -> None:
+        payload = json.dumps(
+            {
+                "value": self.encode(value),
+                "expires_at": time.time() + ttl,
+                "delta": delta,
+            }
+        )
+        try:
+            await self.client.set(
+                self.prefix + key, payload, px=max(1, int(ttl * 1000))
+            )
+        except (RedisError, OSError) as e:
+            logger.warning("cache_l2_unavailable - key=%s error=%s", key, e)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.client.delete(self.prefix + key)
+        except (RedisError, OSError) as e:
+            logger.warning("cache_l2_unavailable - key=%s error=%s", key, e)
+
+
+class TieredCache:
+    """
+    In-process L1 in front of an optional shared Redis L2, for values under
+    string keys. Weighted L1s are given `weigh` to size each value.
+
+    Reads try L1, then L2 (filling L1 with the remaining TTL). Values
+    computed through `get_or_compute` are refreshed ahead of expiry with
+    probabilistic early expiration, so a popular key is recomputed by
+    one caller rather than by every caller at the moment it expires.
+    """
+
+    def __init__(
+        self,
+        l1: LRUCache,
+        l2: Optional[RedisCache] = None,
+        beta: float = 1.0,
+        weigh: Optional[Callable[[Any], int]] = None,
+    ):
+        self.l1 = l1
+        self.l2 = l2
+        self.beta = beta
+        self.weigh = weigh
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        max_entries: int,
+        ttl: Optional[float] = None,
+        max_weight: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+        encode: Callable[[Any], Any] = _identity,
+        decode: Callable[[Any], Any] = _identity,
+    ) -> "TieredCache":
+        """Cache named `name`, with a Redis tier when CACHE_REDIS_ENABLED"""
+        l2 = None
+        if settings.CACHE_REDIS_ENABLED:
+            l2 = RedisCache(
+                get_redis_client(),
+                prefix=f"cache:{name}:",
+                encode=encode,
+                decode=decode,
+            )
+        return cls(
+            LRUCache(name, max_entries=max_entries, ttl=ttl, max_weight=max_weight),
+            l2,
+            beta=settings.CACHE_XFETCH_BETA,
+            weigh=weigh,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.l1.enabled
+
+    async def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Live entry for `key` from either tier, counting the lookup"""
+        now = self.l1.clock()
+        entry = self.l1.get_entry(key)
+        if entry is not None and not entry.expired(now):
+            self.l1.record("hit")
+            return entry
+        if self.l2 is not None:
+            entry = await self.l2.get_entry(key)
+            if entry is not None and not entry.expired(now):
+                self.l1.set(
+                    key,
+                    entry.value,
+                    ttl=entry.expires_at - now,
+                    weight=self._weight(entry.value),
+                    delta=entry.delta,
+                )
+                self.l1.record("l2_hit")
+                return entry
+        self.l1.record("miss")
+        return None
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        entry = await self.get_entry(key)
+        return default if entry is None else entry.value
+
+    async def set(
+        self, key: str, value: Any, ttl: Optional[float] = None, delta: float = 0.0
+    ) -> None:
+        ttl = self.l1.ttl if ttl is None else ttl
+        self.l1.set(key, value, ttl=ttl, weight=self._weight(value), delta=delta)
+        if self.l2 is not None:
+            await self.l2.set(key, value, ttl, delta)
+
+    def _weight(self, value: Any) -> int:
+        return 1 if self.weigh is None else self.weigh(value)
+
+    async def invalidate(self, key: str) -> None:
+        """Drop `key` from both tiers and from every other worker's L1"""
+        self.l1.invalidate(key)
+        if self.l2 is not None:
+            await self.l2.delete(key)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        entry = await self.get_entry(key)
+        if entry is not None and not entry.refresh_due(self.l1.clock(), self.beta):
+            return entry.value
+        started_at = time.perf_counter()
+        value = await compute()
+        await self.set(key, value, ttl=ttl, delta=time.perf_counter() - started_at)
+        return value
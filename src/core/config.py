@@ -33,11 +33,21 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
     POSTGRES_USER: str = "set-postgres-user"
 
+    # Database Pool Settings
+    ASYNC_DATABASE_URL: str = ""
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 3600
+    DB_SLOW_QUERY_SECONDS: float = 0.5
+    DB_N_PLUS_ONE_THRESHOLD: int = 10
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_RETRY_SECONDS: float = 30.0
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+
     # Security Settings
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     ALGORITHM: str = "HS256"
-    LOGIN_RATE_LIMIT_REQUESTS: int = 20
-    LOGIN_RATE_LIMIT_WINDOW: int = 60
     REFRESH_SECRET_KEY: str = "set-refresh-secret-key"
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     SECRET_KEY: str = "set-secret-key"
@@ -50,16 +60,63 @@ class Settings(BaseSettings):
     AUTH_SECRET_KEY: str
     AUTH_TOKEN_AUDIENCE: str = "fastapi-users"
     AUTH_TOKEN_ISSUER: str = "fastapi-auth-service"
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+    AUTH_TOKEN_CACHE_MAX_TTL: float = 300.0
 
     # CORS Configuration
     ALLOWED_ORIGINS: Optional[str] = None
 
+    # Rate Limiting
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_DEFAULT: str = "600/minute"
+    RATE_LIMIT_ROUTES: str = ""
+    RATE_LIMIT_REDIS_BATCH: int = 10
+
     # Redis Configuration
     REDIS_URL: str = "redis://redis:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 1.0
+
+    # Cache Settings
+    CACHE_REDIS_ENABLED: bool = False
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+    CACHE_XFETCH_BETA: float = 1.0
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 10_000
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_MAX_ENTRY_BYTES: int = 1024 * 1024
 
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
 
+    # Metrics Settings
+    METRICS_LATENCY_BUCKETS: str = "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10"
+    METRICS_SIZE_BUCKETS: str = "256,1024,4096,16384,65536,262144,1048576,4194304"
+    METRICS_CACHE_TTL: float = 1.0
+
+    # Storage Settings
+    STORAGE_EXECUTOR_MAX_WORKERS: int = 32
+    STORAGE_STREAMING_LISTINGS: bool = False
+    STORAGE_LISTING_CACHE_MAX_LISTINGS: int = 256
+    STORAGE_LISTING_CACHE_MAX_ITEMS: int = 250_000
+    STORAGE_METADATA_CACHE_MAX_ENTRIES: int = 100_000
+    STORAGE_METADATA_CACHE_TTL: float = 5.0
+    STORAGE_PRELOAD_ROOTS: str = ""
+    STORAGE_REGISTRY_MAX_ROOTS: int = 16
+
+    # File API Settings
+    FILES_BATCH_CONCURRENCY: int = 16
+    FILES_BATCH_MAX_PATHS: int = 10_000
+    FILES_CONTENT_MAX_JSON_BYTES: int = 10 * 1024 * 1024
+    FILES_LIST_CACHE_TTL: float = 1.0
+    HELLO_CACHE_TTL: float = 60.0
+
+    # File Catalog Settings
+    CATALOG_CRAWL_INTERVAL: float = 0.0
+    CATALOG_CRAWL_BATCH_SIZE: int = 5_000
+    CATALOG_HASH_MAX_BYTES: int = 64 * 1024 * 1024
+
     # Token type constants
     TOKEN_TYPE_ACCESS: ClassVar[str] = "access"  # nosec B105
     TOKEN_TYPE_REFRESH: ClassVar[str] = "refresh"  # nosec B105
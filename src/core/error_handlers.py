@@ -60,7 +60,11 @@ def setup_exception_handlers(app: FastAPI) -> None:
                 message=str(exc.detail),
                 status_code=exc.status_code,
             )
-        return JSONResponse(status_code=exc.status_code, content=error_response)
+        return JSONResponse(
+            status_code=exc.status_code,
+            content=error_response,
+            headers=getattr(exc, "headers", None),
+        )
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
@@ -1,12 +1,127 @@
+import heapq
+import io
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from src.core.exceptions import FileNotFoundError
+
+# Sort parameter -> metadata field
+SORT_FIELDS = {"name": "name", "size": "size", "mtime": "last_modified"}
+ENTRY_TYPES = ("file", "dir")
+
+SortKey = Tuple[Any, str]
+
+
+@dataclass(frozen=True)
+class ListingQuery:
+    """
+    Sort order and filters for a directory listing. Entries are ordered by
+    `(sort field, name)`, so keys are unique and pages resume from the key
+    of the last entry served.
+    """
+
+    sort: str = "name"
+    descending: bool = False
+    min_size: Optional[int] = None
+    modified_after: Optional[float] = None
+    type: Optional[str] = None
+    extension: Optional[str] = None
+
+    def __post_init__(self):
+        if self.sort not in SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field: {self.sort}")
+        if self.type is not None and self.type not in ENTRY_TYPES:
+            raise ValueError(f"Unsupported entry type: {self.type}")
+        if self.extension is not None:
+            object.__setattr__(self, "extension", self.extension.lstrip(".").lower())
+
+    @property
+    def is_default(self) -> bool:
+        """Plain ascending name order with no filters"""
+        return self == ListingQuery()
+
+    def matches_name(self, name: str) -> bool:
+        return not self.extension or name.lower().endswith(f".{self.extension}")
+
+    def matches(self, item: Dict[str, Any]) -> bool:
+        if self.min_size is not None and item["size"] < self.min_size:
+            return False
+        if (
+            self.modified_after is not None
+            and item["last_modified"] <= self.modified_after
+        ):
+            return False
+        if self.type == "file" and not item["is_file"]:
+            return False
+        if self.type == "dir" and not item["is_dir"]:
+            return False
+        return self.matches_name(item["name"])
+
+    def key(self, item: Dict[str, Any]) -> SortKey:
+        return item[SORT_FIELDS[self.sort]], item["name"]
+
+    def cursor_key(self, raw: Any) -> SortKey:
+        """Validate a sort key decoded from a cursor"""
+        if isinstance(raw, list) and len(raw) == 2 and isinstance(raw[1], str):
+            value = raw[0]
+            if self.sort == "name":
+                valid = isinstance(value, str)
+            else:
+                valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if valid:
+                return value, raw[1]
+        raise ValueError("Invalid cursor format")
+
+    def select(
+        self, items: Iterable[Dict[str, Any]], after: Optional[SortKey], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[SortKey]]:
+        """
+        Filter `items` and pick the `limit` entries following `after` in a
+        single pass over a bounded heap, so memory stays O(limit) however
+        many entries are scanned. Returns the page and the key to resume
+        from (None on the last page).
+        """
+        candidates = (item for item in items if self.matches(item))
+        if after is not None:
+            if self.descending:
+                candidates = (item for item in candidates if self.key(item) < after)
+            else:
+                candidates = (item for item in candidates if self.key(item) > after)
+        pick = heapq.nlargest if self.descending else heapq.nsmallest
+        selected = pick(limit + 1, candidates, key=self.key)
+        next_after = self.key(selected[limit - 1]) if len(selected) > limit else None
+        return selected[:limit], next_after
 
 
 class StorageBackend(ABC):
+    @property
+    def namespace(self) -> Optional[str]:
+        """
+        Stable identifier of the storage root, used to key caches shared
+        across backend instances. None disables shared caching.
+        """
+        return None
+
     @abstractmethod
     def get_metadata(self, path: str) -> Dict[str, Any]:
         pass
 
+    def get_metadata_many(self, paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Metadata for several paths in one call, aligned with `paths`; None for
+        paths that do not exist or cannot be read. Remote backends should
+        override this to make one round trip per batch.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        for path in paths:
+            try:
+                results.append(self.get_metadata(path))
+            except (FileNotFoundError, PermissionError):
+                results.append(None)
+        return results
+
     @abstractmethod
     def read_content(self, path: str) -> str:
         pass
@@ -14,3 +129,67 @@ class StorageBackend(ABC):
     @abstractmethod
     def list_items(self, path: str) -> List[str]:
         pass
+
+    def open_content(self, path: str) -> BinaryIO:
+        """
+        Open a file for binary, seekable reading. Backends that can stream
+        without loading the whole file should override this.
+        """
+        return io.BytesIO(self.read_content(path).encode())
+
+    def local_path(self, path: str) -> Optional[Path]:
+        """Local filesystem path of a file, for zero-copy sends, if any"""
+        return None
+
+    def get_validator(self, path: str) -> Tuple[float, int]:
+        """
+        Cheap change detector for a single path: `(last_modified, size)`,
+        matching the values reported by `get_metadata`.
+        """
+        metadata = self.get_metadata(path)
+        return metadata["last_modified"], metadata["size"]
+
+    def list_with_metadata(self, path: str) -> List[Dict[str, Any]]:
+        """
+        List a directory as metadata dicts, each with an extra `name` key, in
+        one call. Backends that can list and stat in one pass should override
+        this.
+        """
+        items = []
+        for item in self.list_items(path):
+            metadata = self.get_metadata(item)
+            metadata["name"] = item.rsplit("/", 1)[-1]
+            items.append(metadata)
+        return items
+
+    def scan_page(
+        self, path: str, after: Optional[str], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Up to `limit` entries of `list_with_metadata` whose names sort after
+        `after`, in name order, plus the name to resume from (None on the last
+        page). Backends that can avoid materializing the whole directory
+        should override this.
+        """
+        items = sorted(self.list_with_metadata(path), key=lambda item: item["name"])
+        if after is not None:
+            items = [item for item in items if item["name"] > after]
+        next_after = items[limit - 1]["name"] if len(items) > limit else None
+        return items[:limit], next_after
+
+    def query_page(
+        self, path: str, query: ListingQuery, after: Optional[SortKey], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[SortKey]]:
+        """
+        Up to `limit` entries matching `query` that follow the sort key
+        `after`, plus the key to resume from. Backends with an index should
+        push the filters and ordering down to it.
+        """
+        return query.select(self.list_with_metadata(path), after, limit)
+
+    def directory_version(self, path: str) -> Optional[str]:
+        """
+        Opaque stamp that changes whenever the directory's entries change,
+        or None when the backend cannot tell.
+        """
+        return None
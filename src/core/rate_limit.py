@@ -0,0 +1,375 @@
+import math
+import re
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+from prometheus_client import Counter
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.core.redis_client import get_redis_client
+from src.utils.logging import logger
+
+RATE_LIMIT_DECISIONS = Counter(
+    "rate_limit_decisions_total", "Rate limit decisions", ["route", "result"]
+)
+RATE_LIMIT_BACKEND_ERRORS = Counter(
+    "rate_limit_backend_errors_total",
+    "Rate limit checks answered locally because the shared backend failed",
+)
+
+PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+# Absorbs float error accumulated in TATs, which would otherwise deny the
+# last request of a burst
+_TOLERANCE = 1e-9
+_LIMIT_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d*)\s*(second|minute|hour|day)s?\s*$")
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    `rate` requests per `period` seconds, allowing bursts of up to `burst`
+    requests (defaults to `rate`)
+    """
+
+    rate: int
+    period: float
+    burst: int = 0
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parse limits such as `100/minute`, `5/second` or `1000/5minutes`"""
+        match = _LIMIT_PATTERN.match(value)
+        if match is None or int(match.group(1)) < 1:
+            raise ValueError(f"Invalid rate limit: {value!r}")
+        count, multiplier, unit = match.groups()
+        return cls(
+            rate=int(count),
+            period=PERIODS[unit] * int(multiplier or 1),
+        )
+
+    @property
+    def capacity(self) -> int:
+        return self.burst or self.rate
+
+    @property
+    def interval(self) -> float:
+        """Emission interval: time for one request's worth of capacity to return"""
+        return self.period / self.rate
+
+    @property
+    def policy(self) -> str:
+        return f"{self.rate};w={int(self.period)}"
+
+
+@dataclass(frozen=True)
+class Decision:
+    allowed: bool
+    limit: RateLimit
+    remaining: int
+    # Seconds until the full burst capacity is available again
+    reset_after: float
+    # Seconds until the next request would be allowed (0 when allowed)
+    retry_after: float = 0.0
+
+    def headers(self) -> Dict[str, str]:
+        headers = {
+            "RateLimit-Limit": str(self.limit.capacity),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(math.ceil(self.reset_after)),
+            "RateLimit-Policy": self.limit.policy,
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(self.retry_after)))
+        return headers
+
+
+def gcra(
+    tat: float, now: float, limit: RateLimit, cost: int = 1
+) -> Tuple[Decision, float]:
+    """
+    Generic cell rate algorithm. `tat` is the theoretical arrival time
+    stored for the key; returns the decision and the TAT to store.
+    """
+    interval = limit.interval
+    window = limit.capacity * interval
+    new_tat = max(tat, now) + cost * interval
+    if new_tat - now > window + _TOLERANCE:
+        return (
+            Decision(
+                allowed=False,
+                limit=limit,
+                remaining=0,
+                reset_after=max(tat, now) - now,
+                retry_after=max(0.0, new_tat - now - window),
+            ),
+            tat,
+        )
+    return (
+        Decision(
+            allowed=True,
+            limit=limit,
+            remaining=int((window - (new_tat - now)) / interval + _TOLERANCE),
+            reset_after=new_tat - now,
+        ),
+        new_tat,
+    )
+
+
+class MemoryBackend:
+    """GCRA state held in this process; exact, but per worker"""
+
+    # Keys whose capacity has fully returned are dropped once the table
+    # grows past this many entries
+    PRUNE_THRESHOLD = 100_000
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._tats: Dict[str, float] = {}
+        self._lock = Lock()
+
+    async def acquire(self, key: str, limit: RateLimit) -> Decision:
+        with self._lock:
+            now = self._clock()
+            decision, self._tats[key] = gcra(self._tats.get(key, now), now, limit)
+            if len(self._tats) > self.PRUNE_THRESHOLD:
+                self._tats = {k: t for k, t in self._tats.items() if t > now}
+        return decision
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tats.clear()
+
+    async def close(self) -> None:
+        pass
+
+
+# Reserves up to ARGV[4] requests of capacity for KEYS[1] in one step and
+# returns {granted, remaining, reset_after_ms, retry_after_ms}. Redis' own
+# clock is used so that workers on different hosts agree on time.
+GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local period = tonumber(ARGV[3])
+local wanted = tonumber(ARGV[4])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+local start = math.max(tat, now)
+local window = capacity * interval
+local available = math.floor((window - (start - now)) / interval)
+local granted = math.max(0, math.min(wanted, available))
+if granted == 0 then
+  return {0, 0, start - now, start + interval - now - window}
+end
+local new_tat = start + granted * interval
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now + period))
+return {granted, math.max(0, available - granted), new_tat - now, 0}
+"""
+
+
+@dataclass
+class _Lease:
+    tokens: int
+    remaining: int
+    reset_after: float
+    expires_at: float
+
+
+class RedisBackend:
+    """
+    GCRA state shared through Redis. Each round trip reserves up to
+    `batch` requests of capacity that this worker then hands out locally
+    until the lease runs out or expires, so only about one request in
+    `batch` reaches Redis. Leased capacity left unused on expiry is not
+    returned, which errs towards limiting early rather than late.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        batch: int,
+        lease_seconds: float = 1.0,
+        key_prefix: str = "ratelimit:",
+    ):
+        self.batch = max(1, batch)
+        self.lease_seconds = lease_seconds
+        self.key_prefix = key_prefix
+        self._script = client.register_script(GCRA_SCRIPT)
+        self._leases: Dict[str, _Lease] = {}
+        self._fallback = MemoryBackend()
+
+    def _take_lease(self, key: str, limit: RateLimit, now: float) -> Optional[Decision]:
+        lease = self._leases.get(key)
+        if lease is None or lease.tokens < 1 or lease.expires_at <= now:
+            return None
+        lease.tokens -= 1
+        return Decision(
+            allowed=True,
+            limit=limit,
+            remaining=lease.remaining + lease.tokens,
+            reset_after=lease.reset_after,
+        )
+
+    async def acquire(self, key: str, limit: RateLimit) -> Decision:
+        now = time.monotonic()
+        decision = self._take_lease(key, limit, now)
+        if decision is not None:
+            return decision
+
+        # A lease never covers more than a fraction of the burst, so that
+        # several workers sharing a small limit do not starve each other
+        wanted = max(1, min(self.batch, limit.capacity // 4))
+        try:
+            granted, remaining, reset_ms, retry_ms = await self._script(
+                keys=[self.key_prefix + key],
+                args=[
+                    limit.interval * 1000,
+                    limit.capacity,
+                    limit.period * 1000,
+                    wanted,
+                ],
+            )
+        except (RedisError, OSError) as e:
+            return await self._acquire_locally(key, limit, e)
+
+        if not granted:
+            return Decision(
+                allowed=False,
+                limit=limit,
+                remaining=0,
+                reset_after=reset_ms / 1000,
+                retry_after=retry_ms / 1000,
+            )
+        lease = _Lease(
+            tokens=int(granted) - 1,
+            remaining=int(remaining),
+            reset_after=reset_ms / 1000,
+            expires_at=now + min(self.lease_seconds, limit.interval * granted),
+        )
+        self._leases[key] = lease
+        if len(self._leases) > MemoryBackend.PRUNE_THRESHOLD:
+            self._leases = {k: v for k, v in self._leases.items() if v.expires_at > now}
+        return Decision(
+            allowed=True,
+            limit=limit,
+            remaining=lease.remaining + lease.tokens,
+            reset_after=lease.reset_after,
+        )
+
+    async def _acquire_locally(
+        self, key: str, limit: RateLimit, error: Exception
+    ) -> Decision:
+        RATE_LIMIT_BACKEND_ERRORS.inc()
+        logger.warning("rate_limit_backend_unavailable - error=%s", error)
+        return await self._fallback.acquire(key, limit)
+
+    def reset(self) -> None:
+        self._leases.clear()
+        self._fallback.reset()
+
+    async def close(self) -> None:
+        # The shared client is closed with the application
+        self._leases.clear()
+
+
+def parse_route_limits(value: str) -> Dict[str, RateLimit]:
+    """Parse `name=limit` pairs separated by commas, e.g. `files=100/minute`"""
+    limits = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, limit = item.partition("=")
+        limits[name.strip()] = RateLimit.parse(limit)
+    return limits
+
+
+class RateLimiter:
+    """Looks up the limit configured for each route and applies it per key"""
+
+    def __init__(
+        self,
+        backend,
+        default: RateLimit,
+        routes: Optional[Dict[str, RateLimit]] = None,
+        enabled: bool = True,
+    ):
+        self.backend = backend
+        self.default = default
+        self.routes = routes or {}
+        self.enabled = enabled
+
+    @classmethod
+    def from_settings(cls) -> "RateLimiter":
+        if settings.RATE_LIMIT_BACKEND == "redis":
+            backend = RedisBackend(get_redis_client(), settings.RATE_LIMIT_REDIS_BATCH)
+        elif settings.RATE_LIMIT_BACKEND == "memory":
+            backend = MemoryBackend()
+        else:
+            raise ValueError(
+                f"Unknown RATE_LIMIT_BACKEND: {settings.RATE_LIMIT_BACKEND!r}"
+            )
+        return cls(
+            backend,
+            default=RateLimit.parse(settings.RATE_LIMIT_DEFAULT),
+            routes=parse_route_limits(settings.RATE_LIMIT_ROUTES),
+            enabled=settings.RATE_LIMIT_ENABLED,
+        )
+
+    def limit_for(self, route: str, default: Optional[RateLimit] = None) -> RateLimit:
+        return self.routes.get(route) or default or self.default
+
+    async def check(
+        self, route: str, keys: List[str], default: Optional[RateLimit] = None
+    ) -> Optional[Decision]:
+        """
+        Apply the route's limit to every key, returning the most restrictive
+        decision; denied requests do not consume capacity of later keys
+        """
+        if not self.enabled:
+            return None
+        limit = self.limit_for(route, default)
+        tightest = None
+        for key in keys:
+            decision = await self.backend.acquire(f"{route}:{key}", limit)
+            if (
+                tightest is None
+                or not decision.allowed
+                or (tightest.allowed and decision.remaining < tightest.remaining)
+            ):
+                tightest = decision
+            if not decision.allowed:
+                break
+        RATE_LIMIT_DECISIONS.labels(
+            route=route, result="allowed" if tightest.allowed else "limited"
+        ).inc()
+        return tightest
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter.from_settings()
+        return _rate_limiter
+
+
+async def close_rate_limiter() -> None:
+    global _rate_limiter
+    with _rate_limiter_lock:
+        rate_limiter, _rate_limiter = _rate_limiter, None
+    if rate_limiter is not None:
+        await rate_limiter.backend.close()
+
+
+def reset_test_counters() -> None:
+    """Forget all rate limit state so tests start with full capacity"""
+    if _rate_limiter is not None:
+        _rate_limiter.backend.reset()
@@ -0,0 +1,36 @@
+from threading import Lock
+from typing import Optional
+
+import redis.asyncio as redis
+
+from src.core.config import settings
+
+_client: Optional[redis.Redis] = None
+_client_lock = Lock()
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Process-wide async Redis client. Its connection pool is shared by the
+    cache, cache invalidation and rate limiting; connections are opened on
+    first use.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = redis.Redis.from_url(
+                settings.REDIS_URL,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            )
+        return _client
+
+
+async def close_redis_client() -> None:
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        await client.close()
+        await client.connection_pool.disconnect()
@@ -0,0 +1,115 @@
+import hashlib
+import time
+from threading import Lock
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from prometheus_client import Histogram
+
+from src.core.cache import TOKEN_CACHE_NAME, LRUCache
+from src.core.config import settings
+
+TOKEN_VERIFY_DURATION = Histogram(
+    "auth_token_verify_seconds",
+    "Time spent verifying a bearer token",
+    ["cache"],
+    buckets=(0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01, 0.1),
+)
+
+Scopes = FrozenSet[str]
+VerifiedToken = Tuple[Dict[str, Any], Scopes]
+
+
+def token_scopes(payload: Dict[str, Any]) -> Scopes:
+    """Scopes granted by a token, from a list or a space-delimited string"""
+    scope = payload.get("scope", ())
+    if isinstance(scope, str):
+        return frozenset(scope.split())
+    return frozenset(scope)
+
+
+def _verification_settings() -> Tuple[str, str, str, str]:
+    return (
+        settings.AUTH_SECRET_KEY,
+        settings.AUTH_ALGORITHM,
+        settings.AUTH_TOKEN_AUDIENCE,
+        settings.AUTH_TOKEN_ISSUER,
+    )
+
+
+class TokenCache:
+    """
+    LRU cache of verified token payloads keyed by a digest of the token.
+
+    Entries expire at the token's `exp` (capped at `max_ttl`), and the whole
+    cache is dropped when the secret, algorithm, audience or issuer it was
+    verified against changes. Only successfully verified tokens are stored.
+    """
+
+    def __init__(self, max_entries: int, max_ttl: float):
+        self.max_ttl = max_ttl
+        self._cache = LRUCache(TOKEN_CACHE_NAME, max_entries=max_entries)
+        self._verified_with: Optional[Tuple[str, str, str, str]] = None
+        self._lock = Lock()
+
+    @classmethod
+    def from_settings(cls) -> "TokenCache":
+        return cls(
+            max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+            max_ttl=settings.AUTH_TOKEN_CACHE_MAX_TTL,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled and self.max_ttl > 0
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=20).digest()
+
+    def _check_settings(self) -> bool:
+        """Drop everything cached if verification settings changed"""
+        verified_with = _verification_settings()
+        with self._lock:
+            if verified_with == self._verified_with:
+                return True
+            # Secret rotated (or first use): nothing cached is trusted
+            self._cache.clear()
+            self._verified_with = verified_with
+            return False
+
+    def get(self, token: str) -> Optional[VerifiedToken]:
+        if not self.enabled:
+            return None
+        self._check_settings()
+        return self._cache.get(self._key(token))
+
+    def put(self, token: str, payload: Dict[str, Any], scopes: Scopes) -> None:
+        if not self.enabled or not self._check_settings():
+            return
+        ttl = self.max_ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+            ttl = min(ttl, exp - time.time())
+        if ttl > 0:
+            self._cache.set(self._key(token), (payload, scopes), ttl=ttl)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+token_cache = TokenCache.from_settings()
+
+
+def get_token_cache() -> TokenCache:
+    return token_cache
@@ -0,0 +1,163 @@
+import re
+import time
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from threading import Lock
+from typing import Any, List, Optional, Tuple
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.config import settings
+from src.utils.logging import logger
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Database statement latency by normalized statement",
+    ["statement"],
+)
+
+# Distinct statement labels exported before the rest are folded into one,
+# bounding metric cardinality when statements are built dynamically
+MAX_STATEMENT_LABELS = 500
+STATEMENT_LABEL_LENGTH = 200
+OTHER_STATEMENTS = "other"
+WRITE_STATEMENTS = frozenset({"INSERT", "UPDATE", "DELETE"})
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|:\w+|\$\d+|\?")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_LIST = re.compile(r"(VALUES\s*\(\?\))(?:\s*,\s*\(\?\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """
+    Statement shape with literals and bind parameters replaced by `?`, so
+    executions differing only in values share one label
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PARAMETER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _PARAMETER_LIST.sub("(?)", normalized)
+    normalized = _VALUES_LIST.sub(r"\1", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@dataclass
+class RequestQueryStats:
+    """Queries issued on behalf of one request, possibly from worker threads"""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    # Monotonic time of the last INSERT, UPDATE or DELETE
+    wrote_at: Optional[float] = None
+    statements: StatementCounter = field(default_factory=StatementCounter)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def record(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        with self._lock:
+            return [
+                (statement, count)
+                for statement, count in self.statements.items()
+                if count > threshold
+            ]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_seconds * 1000:.1f};desc="{self.count} queries"'
+
+
+_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "request_query_stats", default=None
+)
+_labels: set = set()
+_labels_lock = Lock()
+
+
+def start_request_tracking() -> RequestQueryStats:
+    """Begin counting queries for the current request context"""
+    stats = RequestQueryStats()
+    _request_stats.set(stats)
+    return stats
+
+
+def current_request_stats() -> Optional[RequestQueryStats]:
+    return _request_stats.get()
+
+
+def finish_request_tracking(stats: RequestQueryStats, endpoint: str) -> None:
+    """Warn about statements repeated often enough to suggest an N+1 pattern"""
+    for statement, count in stats.repeated(settings.DB_N_PLUS_ONE_THRESHOLD):
+        logger.warning(
+            "db_repeated_statement - endpoint=%s count=%s statement=%s",
+            endpoint,
+            count,
+            statement,
+        )
+
+
+def _statement_label(statement: str) -> str:
+    label = statement[:STATEMENT_LABEL_LENGTH]
+    with _labels_lock:
+        if label in _labels:
+            return label
+        if len(_labels) >= MAX_STATEMENT_LABELS:
+            return OTHER_STATEMENTS
+        _labels.add(label)
+    return label
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany
+) -> None:
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany
+) -> None:
+    started = conn.info.get("query_started_at")
+    if not started:
+        return
+    seconds = time.perf_counter() - started.pop()
+    normalized = normalize_statement(statement)
+    DB_QUERY_DURATION.labels(statement=_statement_label(normalized)).observe(seconds)
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(normalized, seconds)
+        if normalized[:6].upper() in WRITE_STATEMENTS:
+            stats.wrote_at = time.monotonic()
+    if seconds >= settings.DB_SLOW_QUERY_SECONDS:
+        logger.warning(
+            "db_slow_query - duration=%.3f statement=%s", seconds, normalized
+        )
+
+
+def _handle_error(exception_context: Any) -> None:
+    # Failed statements never reach after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None:
+        started = connection.info.get("query_started_at")
+        if started:
+            started.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach timing hooks to a sync engine (or an async engine's `sync_engine`)"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
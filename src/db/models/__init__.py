@@ -5,3 +5,4 @@ from sqlalchemy.orm import declarative_base
 Base: DeclarativeMeta = declarative_base()
 
 from .example_model import ExampleModel  # noqa: F401
+from .file_catalog import FileCatalogEntry  # noqa: F401
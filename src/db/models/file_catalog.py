@@ -0,0 +1,49 @@
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Float,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+
+from src.db.models import Base
+
+# Byte-wise ordering on PostgreSQL so index listings sort exactly like Python
+# strings and cursors stay interchangeable with filesystem listings
+PathString = String().with_variant(String(collation="C"), "postgresql")
+
+
+class FileCatalogEntry(Base):
+    """Indexed file or directory under a storage root"""
+
+    __tablename__ = "file_catalog"
+    __table_args__ = (
+        UniqueConstraint("root", "path", name="uq_file_catalog_root_path"),
+        Index("ix_file_catalog_root_parent_name", "root", "parent", "name"),
+        # Sorted listings walk these in (sort column, name) order
+        Index("ix_file_catalog_root_parent_size", "root", "parent", "size", "name"),
+        Index(
+            "ix_file_catalog_root_parent_mtime",
+            "root",
+            "parent",
+            "last_modified",
+            "name",
+        ),
+    )
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    root = Column(String, nullable=False)
+    path = Column(PathString, nullable=False)
+    parent = Column(PathString, nullable=True)
+    name = Column(PathString, nullable=False)
+    size = Column(BigInteger, nullable=False)
+    created = Column(Float, nullable=False)
+    last_modified = Column(Float, nullable=False)
+    mtime_ns = Column(BigInteger, nullable=False)
+    is_file = Column(Boolean, nullable=False)
+    is_dir = Column(Boolean, nullable=False)
+    content_hash = Column(String(64), nullable=True)
+    crawled_at = Column(Float, nullable=False)
@@ -0,0 +1,80 @@
+import time
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Connections the pool keeps open",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Pooled connections currently in use",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond the pool size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time to obtain a pooled connection, including opening a new one",
+    ["pool"],
+)
+
+
+class _TimedCheckout:
+    """
+    Observes how long each checkout waits on the pool, and records the
+    overflow once each checkout or return has settled it
+    """
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.labels(pool=self.logging_name or "default").observe(
+                time.perf_counter() - started_at
+            )
+            self._record_overflow()
+
+    def _do_return_conn(self, record):
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self._record_overflow()
+
+    def _record_overflow(self):
+        # overflow() counts up from -pool_size until the pool is full
+        DB_POOL_OVERFLOW.labels(pool=self.logging_name or "default").set(
+            max(self.overflow(), 0)
+        )
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_pool(pool: Pool, name: str) -> None:
+    """
+    Export the pool's size and checked-out count (overflow is recorded by
+    the timed pools). Values are written as they change rather than read at
+    scrape time, which prometheus_client's multiprocess mode cannot do.
+    """
+    if not isinstance(pool, QueuePool):
+        return
+    DB_POOL_SIZE.labels(pool=name).set(pool.size())
+    checked_out = DB_POOL_CHECKED_OUT.labels(pool=name)
+    event.listen(pool, "checkout", lambda *args: checked_out.inc())
+    event.listen(pool, "checkin", lambda *args: checked_out.dec())
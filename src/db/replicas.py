@@ -0,0 +1,86 @@
+import itertools
+import time
+from threading import Lock
+from typing import Callable, Dict, Generic, Iterator, List, Tuple, TypeVar
+
+from prometheus_client import Counter
+
+from src.utils.logging import logger
+
+E = TypeVar("E")
+
+DB_READS = Counter(
+    "db_read_sessions_total", "Read sessions opened, by serving database", ["target"]
+)
+DB_REPLICA_FAILURES = Counter(
+    "db_replica_failures_total",
+    "Replica connection failures that routed reads elsewhere",
+    ["replica"],
+)
+
+
+def parse_replica_urls(value: str) -> List[str]:
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+class ReplicaRouter(Generic[E]):
+    """
+    Round-robin selection over read replicas. Engines are created on first
+    use; a replica that fails to connect is skipped for `retry_after`
+    seconds before it is tried again.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        create_engine: Callable[[str, str], E],
+        retry_after: float,
+    ):
+        self.urls = urls
+        self.names = [f"replica-{index}" for index in range(len(urls))]
+        self.retry_after = retry_after
+        self._create_engine = create_engine
+        self._engines: Dict[int, E] = {}
+        self._down_until: Dict[int, float] = {}
+        self._turn = itertools.count()
+        self._lock = Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.urls)
+
+    def _engine(self, index: int) -> E:
+        with self._lock:
+            engine = self._engines.get(index)
+            if engine is None:
+                engine = self._create_engine(self.urls[index], self.names[index])
+                self._engines[index] = engine
+            return engine
+
+    def candidates(self) -> Iterator[Tuple[int, E]]:
+        """Healthy replicas, starting from the next one in turn"""
+        if not self.urls:
+            return
+        start = next(self._turn)
+        now = time.monotonic()
+        for offset in range(len(self.urls)):
+            index = (start + offset) % len(self.urls)
+            if self._down_until.get(index, 0.0) <= now:
+                yield index, self._engine(index)
+
+    def mark_down(self, index: int, error: Exception) -> None:
+        self._down_until[index] = time.monotonic() + self.retry_after
+        DB_REPLICA_FAILURES.labels(replica=self.names[index]).inc()
+        logger.warning(
+            "db_replica_unavailable - replica=%s retry_after=%s error=%s",
+            self.names[index],
+            self.retry_after,
+            error,
+        )
+
+    def reset(self) -> List[E]:
+        """Forget every engine, returning them for disposal"""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+            self._down_until.clear()
+        return engines
@@ -1 +1,303 @@
-from sqlalchemy.orm import Session
+import io
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from sqlalchemy import Select, delete, or_, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from src.db.models import Base
+from src.db.models.file_catalog import FileCatalogEntry
+from src.services.pagination import CursorState, PaginationResult, PaginationService
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+# Bound parameters per multi-row INSERT, under both SQLite's (32766) and
+# PostgreSQL's (65535) limits
+MAX_BIND_PARAMS = 32_000
+STREAM_BATCH_SIZE = 1_000
+
+# (size, mtime_ns, content_hash, is_dir) of an indexed entry
+ChildState = Tuple[int, int, Optional[str], bool]
+
+
+def _copy_value(value: Any) -> str:
+    # PostgreSQL COPY text format
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, float):
+        return repr(value)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards in `value`, for use with `escape="\\\\"`"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class Repository(Generic[ModelT]):
+    """
+    Data access for one model on a synchronous session.
+
+    Bulk writes take one statement per batch: on PostgreSQL rows are
+    streamed with COPY, elsewhere inserts are sent as a single executemany
+    and upserts as multi-row `INSERT ... ON CONFLICT`.
+    Reads are either keyset pages, using the same opaque cursors as
+    `PaginationService`, or server-side streams, so callers never hold a
+    whole table in memory.
+    """
+
+    model: Type[ModelT]
+
+    def __init__(self, session: Session, model: Optional[Type[ModelT]] = None):
+        self.session = session
+        if model is not None:
+            self.model = model
+
+    @property
+    def table(self):
+        return self.model.__table__
+
+    @property
+    def dialect(self) -> str:
+        return self.session.get_bind().dialect.name
+
+    def get(self, ident: Any) -> Optional[ModelT]:
+        return self.session.get(self.model, ident)
+
+    def add(self, instance: ModelT) -> ModelT:
+        self.session.add(instance)
+        return instance
+
+    # Bulk writes
+
+    def bulk_insert(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        """Insert plain row mappings, all with the same keys"""
+        if not rows:
+            return 0
+        columns = list(rows[0])
+        if self.dialect == "postgresql":
+            self._copy(self.table.name, columns, rows)
+            return len(rows)
+        # executemany: the driver batches the parameter sets of one statement
+        self.session.execute(self.table.insert(), list(rows))
+        return len(rows)
+
+    def bulk_upsert(
+        self,
+        rows: Sequence[Mapping[str, Any]],
+        conflict: Sequence[str],
+        update: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Insert rows, or update `update` columns (default: every non-conflict
+        column) where a row with the same `conflict` key exists. Rows within
+        one call must have distinct conflict keys.
+        """
+        if not rows:
+            return 0
+        columns = list(rows[0])
+        if update is None:
+            update = [column for column in columns if column not in conflict]
+
+        if self.dialect == "postgresql":
+            self._copy_upsert(columns, rows, conflict, update)
+            return len(rows)
+
+        if self.dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        for chunk in self._chunks(rows, columns):
+            statement = insert(self.table).values(chunk)
+            if update:
+                statement = statement.on_conflict_do_update(
+                    index_elements=list(conflict),
+                    set_={column: statement.excluded[column] for column in update},
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(
+                    index_elements=list(conflict)
+                )
+            self.session.execute(statement)
+        return len(rows)
+
+    @staticmethod
+    def _chunks(
+        rows: Sequence[Mapping[str, Any]], columns: List[str]
+    ) -> Iterator[Sequence[Mapping[str, Any]]]:
+        size = max(1, MAX_BIND_PARAMS // len(columns))
+        for start in range(0, len(rows), size):
+            yield rows[start : start + size]
+
+    def _quote(self, name: str) -> str:
+        return self.session.get_bind().dialect.identifier_preparer.quote(name)
+
+    def _copy(
+        self, table: str, columns: List[str], rows: Sequence[Mapping[str, Any]]
+    ) -> None:
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(_copy_value(row[column]) for column in columns))
+            buffer.write("\n")
+        buffer.seek(0)
+        column_list = ", ".join(map(self._quote, columns))
+        # Raw DBAPI connection of the session's current transaction
+        with self.session.connection().connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {self._quote(table)} ({column_list}) FROM STDIN", buffer
+            )
+
+    def _copy_upsert(
+        self,
+        columns: List[str],
+        rows: Sequence[Mapping[str, Any]],
+        conflict: Sequence[str],
+        update: Sequence[str],
+    ) -> None:
+        """COPY into a session-local staging table, then merge in one INSERT"""
+        table = self._quote(self.table.name)
+        stage = f"{self.table.name}_stage"
+        column_list = ", ".join(map(self._quote, columns))
+        conflict_list = ", ".join(map(self._quote, conflict))
+        if update:
+            action = "UPDATE SET " + ", ".join(
+                f"{self._quote(column)} = EXCLUDED.{self._quote(column)}"
+                for column in update
+            )
+        else:
+            action = "NOTHING"
+
+        self.session.connection().exec_driver_sql(
+            f"CREATE TEMP TABLE IF NOT EXISTS {self._quote(stage)} "
+            f"AS SELECT {column_list} FROM {table} WITH NO DATA"
+        )
+        self._copy(stage, columns, rows)
+        connection = self.session.connection()
+        connection.exec_driver_sql(
+            f"INSERT INTO {table} ({column_list}) "
+            f"SELECT {column_list} FROM {self._quote(stage)} "
+            f"ON CONFLICT ({conflict_list}) DO {action}"
+        )
+        connection.exec_driver_sql(f"TRUNCATE {self._quote(stage)}")
+
+    # Reads
+
+    def keyset_page(
+        self,
+        order_by: Sequence[InstrumentedAttribute],
+        limit: int,
+        cursor: Optional[str] = None,
+        where: Sequence[Any] = (),
+        descending: bool = False,
+    ) -> PaginationResult[ModelT]:
+        """
+        One page of rows ordered by `order_by`, whose values must be unique
+        together and JSON-serializable. The cursor records the key of the
+        last row served, so each page is an index range scan however deep
+        into the table it is.
+        """
+        statement = select(self.model).where(*where)
+        key = tuple_(*order_by)
+        if cursor:
+            values = PaginationService.decode_cursor(cursor).key
+            if not isinstance(values, list) or len(values) != len(order_by):
+                raise ValueError("Invalid cursor format")
+            bound = tuple_(*values)
+            statement = statement.where(key < bound if descending else key > bound)
+        ordering = [column.desc() if descending else column for column in order_by]
+        rows = list(
+            self.session.scalars(statement.order_by(*ordering).limit(limit + 1))
+        )
+
+        has_more = len(rows) > limit
+        items = rows[:limit]
+        next_cursor = None
+        if has_more:
+            next_cursor = PaginationService.encode_cursor(
+                CursorState(key=[getattr(items[-1], column.key) for column in order_by])
+            )
+        return PaginationResult(items=items, cursor=next_cursor, has_more=has_more)
+
+    def stream(
+        self,
+        statement: Optional[Select] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[ModelT]:
+        """
+        Iterate over a large result set `batch_size` rows at a time through a
+        server-side cursor, instead of buffering it client-side
+        """
+        if statement is None:
+            statement = select(self.model)
+        result = self.session.scalars(statement.execution_options(yield_per=batch_size))
+        try:
+            yield from result
+        finally:
+            result.close()
+
+
+class FileCatalogRepository(Repository[FileCatalogEntry]):
+    model = FileCatalogEntry
+
+    def upsert_entries(self, rows: Sequence[Mapping[str, Any]]) -> int:
+        return self.bulk_upsert(rows, conflict=("root", "path"))
+
+    def directory_mtimes(self, root: str) -> Dict[str, int]:
+        """Crawled mtime of every directory under `root`"""
+        rows = self.session.execute(
+            select(FileCatalogEntry.path, FileCatalogEntry.mtime_ns).where(
+                FileCatalogEntry.root == root, FileCatalogEntry.is_dir
+            )
+        )
+        return {path: mtime_ns for path, mtime_ns in rows}
+
+    def children_state(self, root: str, parent: str) -> Dict[str, ChildState]:
+        """Change-detection state of the indexed entries of one directory"""
+        rows = self.session.execute(
+            select(
+                FileCatalogEntry.name,
+                FileCatalogEntry.size,
+                FileCatalogEntry.mtime_ns,
+                FileCatalogEntry.content_hash,
+                FileCatalogEntry.is_dir,
+            ).where(FileCatalogEntry.root == root, FileCatalogEntry.parent == parent)
+        )
+        return {name: tuple(state) for name, *state in rows}
+
+    def delete_entries(
+        self, root: str, paths: Sequence[str], subtrees: Sequence[str] = ()
+    ) -> int:
+        """Delete `paths` and everything below the `subtrees` directories"""
+        conditions = [
+            FileCatalogEntry.path.like(f"{escape_like(path)}/%", escape="\\")
+            for path in subtrees
+        ]
+        if paths:
+            conditions.append(FileCatalogEntry.path.in_(paths))
+        if not conditions:
+            return 0
+        result = self.session.execute(
+            delete(FileCatalogEntry)
+            .where(FileCatalogEntry.root == root, or_(*conditions))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
@@ -1,34 +1,221 @@
-from sqlalchemy import create_engine
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
+import time
+from threading import Lock
+from typing import AsyncIterator, Iterator, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.config import settings
+from src.db.instrumentation import current_request_stats, instrument_engine
+from src.db.pool import TimedAsyncQueuePool, TimedQueuePool, instrument_pool
+from src.db.replicas import DB_READS, ReplicaRouter, parse_replica_urls
 from src.utils.logging import logger
 
+# Async drivers used in place of the configured sync driver
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def _pool_options() -> dict:
+    return {
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
+def async_database_url(url: str) -> str:
+    """`url` with its driver swapped for the matching async driver"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None or parsed.get_driver_name() == driver:
+        return url
+    return parsed.set(
+        drivername=f"{parsed.get_backend_name()}+{driver}"
+    ).render_as_string(hide_password=False)
+
+
+# Synchronous stack, used by Alembic, scripts and thread-pool workers
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=10,
-    pool_recycle=3600,
+    poolclass=TimedQueuePool,
+    pool_logging_name="sync",
+    **_pool_options(),
 )
+instrument_pool(engine.pool, "sync")
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-async def check_db_connection():
+def _create_replica_engine(url: str, name: str) -> Engine:
+    replica = create_engine(
+        url, poolclass=TimedQueuePool, pool_logging_name=name, **_pool_options()
+    )
+    instrument_pool(replica.pool, name)
+    instrument_engine(replica)
+    return replica
+
+
+def _create_async_replica_engine(url: str, name: str) -> AsyncEngine:
+    replica = create_async_engine(
+        async_database_url(url),
+        poolclass=TimedAsyncQueuePool,
+        pool_logging_name=f"{name}-async",
+        **_pool_options(),
+    )
+    instrument_pool(replica.sync_engine.pool, f"{name}-async")
+    instrument_engine(replica.sync_engine)
+    return replica
+
+
+replicas: ReplicaRouter[Engine] = ReplicaRouter(
+    parse_replica_urls(settings.DATABASE_REPLICA_URLS),
+    _create_replica_engine,
+    retry_after=settings.DB_REPLICA_RETRY_SECONDS,
+)
+async_replicas: ReplicaRouter[AsyncEngine] = ReplicaRouter(
+    parse_replica_urls(settings.DATABASE_REPLICA_URLS),
+    _create_async_replica_engine,
+    retry_after=settings.DB_REPLICA_RETRY_SECONDS,
+)
+
+
+def _use_primary(read_your_writes: bool) -> bool:
+    """
+    Whether a read must see this request's own writes: true when the
+    request wrote within DB_READ_YOUR_WRITES_SECONDS, or when there is no
+    request context to tell
+    """
+    if not read_your_writes:
+        return False
+    stats = current_request_stats()
+    if stats is None or stats.wrote_at is None:
+        return stats is None
+    return time.monotonic() - stats.wrote_at < settings.DB_READ_YOUR_WRITES_SECONDS
+
+
+def read_session(read_your_writes: bool = False) -> Session:
+    """
+    Session for read-only work, served by the next healthy replica in
+    round-robin order. Replicas that fail to connect are skipped for a
+    while; with none left, or none configured, the primary serves the read.
+    """
+    if not _use_primary(read_your_writes):
+        for index, replica in replicas.candidates():
+            session = SessionLocal(bind=replica)
+            try:
+                session.connection()
+            except DBAPIError as e:
+                session.close()
+                replicas.mark_down(index, e)
+                continue
+            DB_READS.labels(target=replicas.names[index]).inc()
+            return session
+    DB_READS.labels(target="primary").inc()
+    return SessionLocal()
+
+
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker] = None
+_async_lock = Lock()
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Process-wide async engine, created on first use so that importing this
+    module does not require the async driver
+    """
+    global _async_engine, _async_sessionmaker
+    with _async_lock:
+        if _async_engine is None:
+            _async_engine = create_async_engine(
+                settings.ASYNC_DATABASE_URL
+                or async_database_url(settings.DATABASE_URL),
+                poolclass=TimedAsyncQueuePool,
+                pool_logging_name="async",
+                **_pool_options(),
+            )
+            instrument_pool(_async_engine.sync_engine.pool, "async")
+            instrument_engine(_async_engine.sync_engine)
+            _async_sessionmaker = async_sessionmaker(
+                _async_engine, autoflush=False, expire_on_commit=False
+            )
+        return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    get_async_engine()
+    return _async_sessionmaker
+
+
+async def dispose_async_engine() -> None:
+    """Close the async pools; the next use creates fresh engines"""
+    global _async_engine, _async_sessionmaker
+    with _async_lock:
+        async_engine, _async_engine = _async_engine, None
+        _async_sessionmaker = None
+    if async_engine is not None:
+        await async_engine.dispose()
+    for replica in async_replicas.reset():
+        await replica.dispose()
+
+
+async def open_read_session(read_your_writes: bool = False) -> AsyncSession:
+    """Async counterpart of `read_session`"""
+    sessions = get_async_sessionmaker()
+    if not _use_primary(read_your_writes):
+        for index, replica in async_replicas.candidates():
+            session = sessions(bind=replica)
+            try:
+                await session.connection()
+            except (DBAPIError, OSError) as e:
+                await session.close()
+                async_replicas.mark_down(index, e)
+                continue
+            DB_READS.labels(target=async_replicas.names[index]).inc()
+            return session
+    DB_READS.labels(target="primary").inc()
+    return sessions()
+
+
+async def check_db_connection() -> bool:
     try:
-        db = SessionLocal()
-        db.execute("SELECT 1")
+        async with get_async_engine().connect() as connection:
+            await connection.execute(text("SELECT 1"))
         return True
-    except SQLAlchemyError as e:
-        logger.error("database_connection_failed", error=str(e))
+    except (SQLAlchemyError, OSError) as e:
+        logger.error("database_connection_failed - error=%s", e)
         return False
-    finally:
-        db.close()
 
 
-def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def get_read_db() -> AsyncIterator[AsyncSession]:
+    """Read-only session on a replica when one is available"""
+    async with await open_read_session() as db:
+        yield db
+
+
+async def get_read_your_writes_db() -> AsyncIterator[AsyncSession]:
+    """Read-only session that stays on the primary after this request wrote"""
+    async with await open_read_session(read_your_writes=True) as db:
+        yield db
+
+
+def get_sync_db() -> Iterator[Session]:
     db = SessionLocal()
     try:
         yield db
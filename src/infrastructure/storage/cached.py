@@ -0,0 +1,149 @@
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Hashable, List, Optional, Tuple
+
+from src.core.cache import LRUCache
+from src.core.config import settings
+from src.core.exceptions import FileNotFoundError
+from src.core.interfaces.storage import ListingQuery, SortKey, StorageBackend
+
+CacheKey = Tuple[Optional[str], str]
+
+
+class MetadataCache(LRUCache):
+    """Metadata dicts and their validators, kept for `ttl` seconds"""
+
+    def __init__(self, ttl: float, max_entries: int, backend: str = ""):
+        super().__init__(
+            "storage.metadata", max_entries=max_entries, ttl=ttl, backend=backend
+        )
+
+    @classmethod
+    def from_settings(cls, backend: str = "") -> "MetadataCache":
+        return cls(
+            ttl=settings.STORAGE_METADATA_CACHE_TTL,
+            max_entries=settings.STORAGE_METADATA_CACHE_MAX_ENTRIES,
+            backend=backend,
+        )
+
+
+class CachedStorage(StorageBackend):
+    """
+    Caches `get_metadata` of any storage backend.
+
+    Entries are served without touching storage until their TTL expires;
+    expired entries are revalidated with the backend's cheap validator (a
+    single stat on the filesystem) and only refetched when it changed.
+    `invalidate` is the hook for file-watch notifications.
+    """
+
+    def __init__(self, backend: StorageBackend, cache: MetadataCache):
+        self.backend = backend
+        self.cache = cache
+
+    @property
+    def namespace(self) -> Optional[str]:
+        return self.backend.namespace
+
+    def _key(self, path: str) -> CacheKey:
+        return (self.backend.namespace, path)
+
+    def get_metadata(self, path: str) -> Dict[str, Any]:
+        if not self.cache.enabled:
+            return self.backend.get_metadata(path)
+
+        key = self._key(path)
+        entry = self.cache.get_entry(key)
+        if entry is not None:
+            validator, metadata = entry.value
+            if not entry.expired(self.cache.clock()):
+                self.cache.record("hit")
+                return dict(metadata)
+            try:
+                current = self.backend.get_validator(path)
+            except FileNotFoundError:
+                self.cache.delete(key)
+                raise
+            if current == validator:
+                self.cache.set(key, entry.value)
+                self.cache.record("revalidated")
+                return dict(metadata)
+
+        self.cache.record("miss")
+        metadata = self.backend.get_metadata(path)
+        self._store(key, metadata)
+        return dict(metadata)
+
+    def get_metadata_many(self, paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Serve fresh entries from the cache and fetch everything else from the
+        backend in a single batched call.
+        """
+        if not self.cache.enabled:
+            return self.backend.get_metadata_many(paths)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+        pending: List[int] = []
+        now = self.cache.clock()
+        for index, path in enumerate(paths):
+            entry = self.cache.get_entry(self._key(path))
+            if entry is not None and not entry.expired(now):
+                results[index] = dict(entry.value[1])
+            else:
+                pending.append(index)
+
+        self.cache.record("hit", len(paths) - len(pending))
+        self.cache.record("miss", len(pending))
+        if not pending:
+            return results
+
+        fetched = self.backend.get_metadata_many([paths[i] for i in pending])
+        for index, metadata in zip(pending, fetched):
+            key = self._key(paths[index])
+            if metadata is None:
+                self.cache.delete(key)
+                continue
+            self._store(key, metadata)
+            results[index] = dict(metadata)
+        return results
+
+    def _store(self, key: CacheKey, metadata: Dict[str, Any]) -> None:
+        validator = (metadata["last_modified"], metadata["size"])
+        self.cache.set(key, (validator, metadata))
+
+    def get_validator(self, path: str) -> Hashable:
+        return self.backend.get_validator(path)
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drop the cached metadata for `path` in every worker, e.g. on a
+        file-watch event
+        """
+        self.cache.invalidate(self._key(path))
+
+    def read_content(self, path: str) -> str:
+        return self.backend.read_content(path)
+
+    def open_content(self, path: str) -> BinaryIO:
+        return self.backend.open_content(path)
+
+    def local_path(self, path: str) -> Optional[Path]:
+        return self.backend.local_path(path)
+
+    def list_items(self, path: str) -> List[str]:
+        return self.backend.list_items(path)
+
+    def list_with_metadata(self, path: str) -> List[Dict[str, Any]]:
+        return self.backend.list_with_metadata(path)
+
+    def scan_page(
+        self, path: str, after: Optional[str], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        return self.backend.scan_page(path, after, limit)
+
+    def query_page(
+        self, path: str, query: ListingQuery, after: Optional[SortKey], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[SortKey]]:
+        return self.backend.query_page(path, query, after, limit)
+
+    def directory_version(self, path: str) -> Optional[str]:
+        return self.backend.directory_version(path)
@@ -0,0 +1,207 @@
+import posixpath
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
+
+from src.core.exceptions import FileNotFoundError
+from src.core.interfaces.storage import ListingQuery, SortKey, StorageBackend
+from src.db.models.file_catalog import FileCatalogEntry
+from src.db.repositories import escape_like
+from src.infrastructure.storage.filesystem import FilesystemStorage
+
+METADATA_COLUMNS = (
+    FileCatalogEntry.path,
+    FileCatalogEntry.name,
+    FileCatalogEntry.size,
+    FileCatalogEntry.created,
+    FileCatalogEntry.last_modified,
+    FileCatalogEntry.is_file,
+    FileCatalogEntry.is_dir,
+)
+SORT_COLUMNS = {
+    "name": FileCatalogEntry.name,
+    "size": FileCatalogEntry.size,
+    "mtime": FileCatalogEntry.last_modified,
+}
+
+
+class CatalogStorage(StorageBackend):
+    """
+    Metadata and listings answered from the file catalog index instead of the
+    filesystem. Results are as fresh as the last crawl of the root; content
+    is still read from disk.
+    """
+
+    def __init__(self, base_path: Path, session_factory: Callable[[], Session]):
+        self.base_path = base_path
+        self.root_key = str(base_path)
+        self.session_factory = session_factory
+        self.filesystem = FilesystemStorage(base_path)
+
+    @property
+    def namespace(self) -> Optional[str]:
+        return f"catalog:{self.base_path}"
+
+    @staticmethod
+    def _catalog_path(path: str) -> str:
+        normalized = posixpath.normpath(unquote(path).strip("/") or ".")
+        return "" if normalized == "." else normalized
+
+    def _metadata(self, row: Any, with_name: bool = False) -> Dict[str, Any]:
+        metadata = {
+            "path": str(self.base_path / row.path) if row.path else self.root_key,
+            "size": row.size,
+            "created": row.created,
+            "last_modified": row.last_modified,
+            "is_file": row.is_file,
+            "is_dir": row.is_dir,
+        }
+        if with_name:
+            metadata["name"] = row.name
+        return metadata
+
+    def _entry(self, session: Session, path: str) -> Any:
+        return session.execute(
+            select(*METADATA_COLUMNS).where(
+                FileCatalogEntry.root == self.root_key,
+                FileCatalogEntry.path == self._catalog_path(path),
+            )
+        ).first()
+
+    def get_metadata(self, path: str) -> Dict[str, Any]:
+        with self.session_factory() as session:
+            row = self._entry(session, path)
+        if row is None:
+            raise FileNotFoundError(f"File not found: {path}")
+        return self._metadata(row)
+
+    def get_metadata_many(self, paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Metadata for a whole batch in one indexed query"""
+        keys = [self._catalog_path(path) for path in paths]
+        with self.session_factory() as session:
+            rows = session.execute(
+                select(*METADATA_COLUMNS).where(
+                    FileCatalogEntry.root == self.root_key,
+                    FileCatalogEntry.path.in_(set(keys)),
+                )
+            ).all()
+        found = {row.path: self._metadata(row) for row in rows}
+        return [found.get(key) for key in keys]
+
+    def read_content(self, path: str) -> str:
+        return self.filesystem.read_content(path)
+
+    def open_content(self, path: str) -> BinaryIO:
+        return self.filesystem.open_content(path)
+
+    def local_path(self, path: str) -> Optional[Path]:
+        return self.filesystem.local_path(path)
+
+    def _directory(self, session: Session, path: str) -> str:
+        row = self._entry(session, path)
+        if row is None:
+            raise FileNotFoundError(f"Directory not found: {path}")
+        if not row.is_dir:
+            raise ValueError(f"Path is not a directory: {path}")
+        return self._catalog_path(path)
+
+    def _children(self, parent: str):
+        return (
+            select(*METADATA_COLUMNS)
+            .where(
+                FileCatalogEntry.root == self.root_key,
+                FileCatalogEntry.parent == parent,
+            )
+            .order_by(FileCatalogEntry.name)
+        )
+
+    def list_items(self, path: str) -> List[str]:
+        with self.session_factory() as session:
+            parent = self._directory(session, path)
+            rows = session.execute(self._children(parent)).all()
+        return [row.path for row in rows]
+
+    def list_with_metadata(self, path: str) -> List[Dict[str, Any]]:
+        with self.session_factory() as session:
+            parent = self._directory(session, path)
+            rows = session.execute(self._children(parent)).all()
+        return [self._metadata(row, with_name=True) for row in rows]
+
+    def scan_page(
+        self, path: str, after: Optional[str], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Keyset page over the `(root, parent, name)` index"""
+        with self.session_factory() as session:
+            query = self._children(self._directory(session, path)).limit(limit + 1)
+            if after is not None:
+                query = query.where(FileCatalogEntry.name > after)
+            rows = session.execute(query).all()
+        items = [self._metadata(row, with_name=True) for row in rows[:limit]]
+        next_after = rows[limit - 1].name if len(rows) > limit else None
+        return items, next_after
+
+    def query_page(
+        self, path: str, query: ListingQuery, after: Optional[SortKey], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[SortKey]]:
+        """
+        Filters and ordering pushed down to the database: a keyset query on
+        `(sort column, name)` returning only the requested page
+        """
+        column = SORT_COLUMNS[query.sort]
+        with self.session_factory() as session:
+            statement = select(*METADATA_COLUMNS).where(
+                FileCatalogEntry.root == self.root_key,
+                FileCatalogEntry.parent == self._directory(session, path),
+            )
+            if query.min_size is not None:
+                statement = statement.where(FileCatalogEntry.size >= query.min_size)
+            if query.modified_after is not None:
+                statement = statement.where(
+                    FileCatalogEntry.last_modified > query.modified_after
+                )
+            if query.type == "file":
+                statement = statement.where(FileCatalogEntry.is_file)
+            elif query.type == "dir":
+                statement = statement.where(FileCatalogEntry.is_dir)
+            if query.extension:
+                statement = statement.where(
+                    func.lower(FileCatalogEntry.name).like(
+                        f"%.{escape_like(query.extension)}", escape="\\"
+                    )
+                )
+            key = tuple_(column, FileCatalogEntry.name)
+            if query.descending:
+                if after is not None:
+                    statement = statement.where(key < tuple_(*after))
+                statement = statement.order_by(
+                    column.desc(), FileCatalogEntry.name.desc()
+                )
+            else:
+                if after is not None:
+                    statement = statement.where(key > tuple_(*after))
+                statement = statement.order_by(column, FileCatalogEntry.name)
+            rows = session.execute(statement.limit(limit + 1)).all()
+
+        items = [self._metadata(row, with_name=True) for row in rows[:limit]]
+        next_after = query.key(items[-1]) if len(rows) > limit else None
+        return items, next_after
+
+    def directory_version(self, path: str) -> Optional[str]:
+        """
+        Crawled mtime and crawl time of the directory row, which is rewritten
+        whenever the crawler rescans the directory
+        """
+        with self.session_factory() as session:
+            row = session.execute(
+                select(FileCatalogEntry.mtime_ns, FileCatalogEntry.crawled_at).where(
+                    FileCatalogEntry.root == self.root_key,
+                    FileCatalogEntry.path == self._catalog_path(path),
+                    FileCatalogEntry.is_dir,
+                )
+            ).first()
+        if row is None:
+            return None
+        return f"{row.mtime_ns:x}-{round(row.crawled_at * 1_000_000):x}"
@@ -0,0 +1,114 @@
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Optional, TypeVar
+
+from prometheus_client import Gauge, Histogram
+
+from src.core.config import settings
+
+T = TypeVar("T")
+
+STORAGE_QUEUE_DEPTH = Gauge(
+    "storage_executor_queue_depth",
+    "Storage calls waiting for a worker thread",
+    multiprocess_mode="livesum",
+)
+STORAGE_IN_FLIGHT = Gauge(
+    "storage_executor_in_flight",
+    "Storage calls currently running on a worker",
+    multiprocess_mode="livesum",
+)
+STORAGE_WAIT_TIME = Histogram(
+    "storage_executor_wait_seconds",
+    "Time storage calls spend queued before a worker picks them up",
+)
+STORAGE_CALL_DURATION = Histogram(
+    "storage_executor_call_duration_seconds",
+    "Time spent running storage calls on a worker",
+    ["operation"],
+)
+
+
+class StorageExecutor:
+    """
+    Dedicated, bounded thread pool for blocking storage calls.
+
+    Storage backends are synchronous; running them through this executor keeps
+    slow disk or network filesystem calls off the event loop without competing
+    with the default executor used by the rest of the application.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "storage"):
+        if max_workers < 1:
+            raise ValueError("Storage executor needs at least one worker")
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.thread_name_prefix,
+                )
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking storage call on the pool and await its result"""
+        operation = getattr(func, "__name__", "call")
+        submitted_at = time.perf_counter()
+        dequeue_lock = Lock()
+        dequeued = False
+
+        def dequeue() -> bool:
+            # Whoever gets here first (worker or canceller) leaves the queue
+            nonlocal dequeued
+            with dequeue_lock:
+                if dequeued:
+                    return False
+                dequeued = True
+            STORAGE_QUEUE_DEPTH.dec()
+            return True
+
+        def call() -> T:
+            started_at = time.perf_counter()
+            dequeue()
+            STORAGE_WAIT_TIME.observe(started_at - submitted_at)
+            STORAGE_IN_FLIGHT.inc()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                STORAGE_IN_FLIGHT.dec()
+                STORAGE_CALL_DURATION.labels(operation=operation).observe(
+                    time.perf_counter() - started_at
+                )
+
+        loop = asyncio.get_running_loop()
+        # Run in the caller's context so request-scoped state (such as query
+        # tracking) follows the call onto the worker thread
+        context = contextvars.copy_context()
+        STORAGE_QUEUE_DEPTH.inc()
+        try:
+            return await loop.run_in_executor(self._get_executor(), context.run, call)
+        except asyncio.CancelledError:
+            dequeue()
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool; a later call to `run` starts a fresh one"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+storage_executor = StorageExecutor(settings.STORAGE_EXECUTOR_MAX_WORKERS)
+
+
+def get_storage_executor() -> StorageExecutor:
+    return storage_executor
@@ -1,10 +1,7 @@
-from pathlib import Path
-
-from fastapi import Depends
-
 from src.core.interfaces.storage import StorageBackend
-from src.infrastructure.storage.filesystem import FilesystemStorage
+from src.infrastructure.storage.registry import get_storage_registry
 
 
-def get_storage(base_path: str) -> StorageBackend:
-    return FilesystemStorage(Path(base_path))
+async def get_storage(base_path: str) -> StorageBackend:
+    root = await get_storage_registry().get(base_path)
+    return root.storage
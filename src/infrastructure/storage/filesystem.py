@@ -1,33 +1,107 @@
+import builtins
+import heapq
+import os
+import stat
+import time
+from collections import defaultdict
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import unquote
 
 from src.core.exceptions import FileNotFoundError
-from src.core.interfaces.storage import StorageBackend
+from src.core.interfaces.storage import ListingQuery, SortKey, StorageBackend
+
+# Coarsest mtime granularity we expect from the filesystems we serve (NFS can
+# round to the second)
+MTIME_SETTLE_NS = 2_000_000_000
+
+
+def _metadata_from_stat(path: str, stats: os.stat_result) -> Dict[str, Any]:
+    return {
+        "path": path,
+        "size": stats.st_size,
+        "created": stats.st_ctime,
+        "last_modified": stats.st_mtime,
+        "is_file": stat.S_ISREG(stats.st_mode),
+        "is_dir": stat.S_ISDIR(stats.st_mode),
+    }
 
 
 class FilesystemStorage(StorageBackend):
     def __init__(self, base_path: Path):
         self.base_path = base_path
 
+    @property
+    def namespace(self) -> Optional[str]:
+        return str(self.base_path)
+
     def _resolve_path(self, path: str) -> Path:
         decoded_path = unquote(path)
         return self.base_path / decoded_path
 
     def get_metadata(self, path: str) -> Dict[str, Any]:
         full_path = self._resolve_path(path)
-        if not full_path.exists():
+        try:
+            stats = full_path.stat()
+        except (builtins.FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f"File not found: {path}")
+        return _metadata_from_stat(str(full_path), stats)
+
+    def get_metadata_many(self, paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Stat many paths, grouped by parent directory: each directory is opened
+        once and its entries are statted relative to that descriptor, so the
+        kernel walks each parent path once per batch rather than once per file.
+        """
+        full_paths = [self._resolve_path(path) for path in paths]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+        if os.stat not in os.supports_dir_fd:
+            for index, full_path in enumerate(full_paths):
+                results[index] = self._stat_metadata(full_path)
+            return results
 
-        stats = full_path.stat()
-        return {
-            "path": str(full_path),
-            "size": stats.st_size,
-            "created": stats.st_ctime,
-            "last_modified": stats.st_mtime,
-            "is_file": full_path.is_file(),
-            "is_dir": full_path.is_dir(),
-        }
+        by_parent: Dict[Path, List[int]] = defaultdict(list)
+        for index, full_path in enumerate(full_paths):
+            if full_path.name:
+                by_parent[full_path.parent].append(index)
+            else:
+                results[index] = self._stat_metadata(full_path)
+
+        for parent, indexes in by_parent.items():
+            try:
+                dir_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                # Missing or unreadable parent: fall back to plain stats so
+                # results match get_metadata exactly
+                for index in indexes:
+                    results[index] = self._stat_metadata(full_paths[index])
+                continue
+            try:
+                for index in indexes:
+                    full_path = full_paths[index]
+                    try:
+                        stats = os.stat(full_path.name, dir_fd=dir_fd)
+                    except OSError:
+                        continue
+                    results[index] = _metadata_from_stat(str(full_path), stats)
+            finally:
+                os.close(dir_fd)
+        return results
+
+    @staticmethod
+    def _stat_metadata(full_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return _metadata_from_stat(str(full_path), full_path.stat())
+        except OSError:
+            return None
+
+    def get_validator(self, path: str) -> Tuple[float, int]:
+        try:
+            stats = self._resolve_path(path).stat()
+        except (builtins.FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {path}")
+        return stats.st_mtime, stats.st_size
 
     def read_content(self, path: str) -> str:
         full_path = self._resolve_path(path)
@@ -35,6 +109,18 @@ class FilesystemStorage(StorageBackend):
             raise FileNotFoundError(f"File not found: {path}")
         return full_path.read_text()
 
+    def open_content(self, path: str) -> BinaryIO:
+        full_path = self._resolve_path(path)
+        try:
+            return full_path.open("rb")
+        except (builtins.FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {path}")
+        except IsADirectoryError:
+            raise ValueError(f"Path is not a file: {path}")
+
+    def local_path(self, path: str) -> Optional[Path]:
+        return self._resolve_path(path)
+
     def list_items(self, path: str) -> List[str]:
         full_path = self._resolve_path(path)
         if not full_path.exists():
@@ -42,3 +128,93 @@ class FilesystemStorage(StorageBackend):
         if not full_path.is_dir():
             raise ValueError(f"Path is not a directory: {path}")
         return [str(p.relative_to(self.base_path)) for p in full_path.iterdir()]
+
+    def directory_version(self, path: str) -> Optional[str]:
+        """
+        Directory inode and mtime; adding, removing or renaming entries bumps
+        it. Directories modified within the timestamp granularity window are
+        left unversioned, since a further change could keep the same mtime.
+        """
+        try:
+            stats = self._resolve_path(path).stat()
+        except OSError:
+            return None
+        if time.time_ns() - stats.st_mtime_ns < MTIME_SETTLE_NS:
+            return None
+        return f"{stats.st_ino:x}-{stats.st_mtime_ns:x}"
+
+    def _scandir(self, path: str) -> Iterator[os.DirEntry]:
+        full_path = self._resolve_path(path)
+        try:
+            scanner = os.scandir(full_path)
+        except builtins.FileNotFoundError:
+            raise FileNotFoundError(f"Directory not found: {path}")
+        except NotADirectoryError:
+            raise ValueError(f"Path is not a directory: {path}")
+        with scanner:
+            yield from scanner
+
+    @staticmethod
+    def _entry_metadata(entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        try:
+            stats = entry.stat()
+        except OSError:
+            # Removed mid-scan, a dangling or looping symlink, or unreadable;
+            # one bad entry must not fail the whole listing
+            return None
+        metadata = _metadata_from_stat(entry.path, stats)
+        metadata["name"] = entry.name
+        return metadata
+
+    def list_with_metadata(self, path: str) -> List[Dict[str, Any]]:
+        """
+        List a directory with metadata in a single `os.scandir` pass.
+        Each entry's stat result is taken from the cached `DirEntry`, so no
+        per-item path rebuild or existence checks are needed.
+        """
+        items = []
+        for entry in self._scandir(path):
+            metadata = self._entry_metadata(entry)
+            if metadata is not None:
+                items.append(metadata)
+        return items
+
+    def scan_page(
+        self, path: str, after: Optional[str], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Return up to `limit` entries whose names sort after `after`, in order,
+        plus the name to resume from (None on the last page). One scandir pass
+        feeds a bounded heap, so memory stays O(limit) however large the
+        directory is, and only the selected entries are statted.
+        """
+        entries = self._scandir(path)
+        if after is not None:
+            entries = (entry for entry in entries if entry.name > after)
+        selected = heapq.nsmallest(limit + 1, entries, key=attrgetter("name"))
+
+        next_after = selected[limit - 1].name if len(selected) > limit else None
+        items = []
+        for entry in selected[:limit]:
+            metadata = self._entry_metadata(entry)
+            if metadata is not None:
+                items.append(metadata)
+        return items, next_after
+
+    def query_page(
+        self, path: str, query: ListingQuery, after: Optional[SortKey], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[SortKey]]:
+        """
+        Sorted, filtered page in one scandir pass feeding a bounded top-k
+        heap. Extension filters are applied on names before anything is
+        statted.
+        """
+        entries = (
+            entry for entry in self._scandir(path) if query.matches_name(entry.name)
+        )
+        items = (
+            metadata
+            for metadata in map(self._entry_metadata, entries)
+            if metadata is not None
+        )
+        return query.select(items, after, limit)
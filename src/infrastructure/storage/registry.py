@@ -0,0 +1,148 @@
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, List, Optional
+
+from prometheus_client import Counter, Gauge
+
+from src.core.config import settings
+from src.db.session import read_session
+from src.infrastructure.storage.cached import CachedStorage, MetadataCache
+from src.infrastructure.storage.catalog import CatalogStorage
+from src.infrastructure.storage.executor import StorageExecutor, get_storage_executor
+from src.infrastructure.storage.filesystem import FilesystemStorage
+from src.services.file_service import FileService
+from src.services.listing_cache import ListingCache
+from src.utils.logging import logger
+
+STORAGE_ROOTS = Gauge(
+    "storage_registry_roots",
+    "Storage roots currently registered",
+    multiprocess_mode="livesum",
+)
+STORAGE_ROOT_EVICTIONS = Counter(
+    "storage_registry_evictions_total", "Storage roots evicted by LRU"
+)
+
+# Distinct spellings of a base path remembered per registered root
+ALIASES_PER_ROOT = 8
+
+
+@dataclass
+class StorageRoot:
+    """Long-lived backend, caches and service for one canonical base path"""
+
+    base_path: Path
+    storage: CachedStorage
+    metadata_cache: MetadataCache
+    listing_cache: ListingCache
+    file_service: FileService
+    catalog_service: FileService
+
+    @classmethod
+    def create(cls, base_path: Path, executor: StorageExecutor) -> "StorageRoot":
+        backend = FilesystemStorage(base_path)
+        # Cache metrics are labelled with the backend type, not the base
+        # path, which is client supplied and unbounded
+        label = type(backend).__name__
+        metadata_cache = MetadataCache.from_settings(backend=label)
+        listing_cache = ListingCache.from_settings(backend=label)
+        storage = CachedStorage(backend, metadata_cache)
+        return cls(
+            base_path=base_path,
+            storage=storage,
+            metadata_cache=metadata_cache,
+            listing_cache=listing_cache,
+            file_service=FileService(
+                storage, executor=executor, listing_cache=listing_cache
+            ),
+            # Index pages are keyset queries, so there is nothing to snapshot
+            catalog_service=FileService(
+                CatalogStorage(base_path, read_session),
+                executor=executor,
+                streaming=True,
+                listing_cache=listing_cache,
+            ),
+        )
+
+    def close(self) -> None:
+        self.metadata_cache.clear()
+        self.listing_cache.clear()
+
+
+class StorageRegistry:
+    """
+    Process-wide registry of storage roots keyed by canonical base path.
+
+    Every request for the same root shares one backend, its metadata and
+    listing caches and its FileService. The number of roots is bounded;
+    the least recently used root is evicted and its caches released.
+    """
+
+    def __init__(self, max_roots: int, executor: Optional[StorageExecutor] = None):
+        if max_roots < 1:
+            raise ValueError("Storage registry needs room for at least one root")
+        self.max_roots = max_roots
+        self.executor = executor or get_storage_executor()
+        self._roots: "OrderedDict[Path, StorageRoot]" = OrderedDict()
+        self._aliases: "OrderedDict[str, Path]" = OrderedDict()
+        self._lock = Lock()
+
+    async def get(self, base_path: str) -> StorageRoot:
+        """Root for `base_path`, registering it on first use"""
+        alias = os.path.normpath(base_path)
+        with self._lock:
+            canonical = self._aliases.get(alias)
+            if canonical is not None:
+                self._aliases.move_to_end(alias)
+        if canonical is None:
+            # Symlink resolution touches the filesystem; do it once per alias
+            canonical = await self.executor.run(Path(alias).resolve)
+            with self._lock:
+                self._aliases[alias] = canonical
+                while len(self._aliases) > self.max_roots * ALIASES_PER_ROOT:
+                    self._aliases.popitem(last=False)
+        return self._get_root(canonical)
+
+    def _get_root(self, canonical: Path) -> StorageRoot:
+        evicted: List[StorageRoot] = []
+        with self._lock:
+            root = self._roots.get(canonical)
+            if root is not None:
+                self._roots.move_to_end(canonical)
+                return root
+            root = StorageRoot.create(canonical, self.executor)
+            self._roots[canonical] = root
+            while len(self._roots) > self.max_roots:
+                _, oldest = self._roots.popitem(last=False)
+                evicted.append(oldest)
+            STORAGE_ROOTS.set(len(self._roots))
+        for oldest in evicted:
+            STORAGE_ROOT_EVICTIONS.inc()
+            logger.info("storage_root_evicted - base_path=%s", oldest.base_path)
+            oldest.close()
+        return root
+
+    async def startup(self, base_paths: Iterable[str] = ()) -> None:
+        """Register the given roots ahead of the first request"""
+        for base_path in base_paths:
+            await self.get(base_path)
+
+    def shutdown(self) -> None:
+        """Release every root and its caches"""
+        with self._lock:
+            roots = list(self._roots.values())
+            self._roots.clear()
+            self._aliases.clear()
+            STORAGE_ROOTS.set(0)
+        for root in roots:
+            root.close()
+
+
+storage_registry = StorageRegistry(max_roots=settings.STORAGE_REGISTRY_MAX_ROOTS)
+
+
+def get_storage_registry() -> StorageRegistry:
+    return storage_registry
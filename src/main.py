@@ -1,27 +1,56 @@
-import time
+import asyncio
+from contextlib import asynccontextmanager
 
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.responses import JSONResponse
-from prometheus_client import Counter, Histogram
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
+from src.api.http_metrics import HTTPMetricsMiddleware
 from src.api.v1.routers import api_router
+from src.core.cache import start_cache_invalidation, stop_cache_invalidation
 from src.core.config import settings
 from src.core.error_handlers import setup_exception_handlers
-
-# Metrics
-REQUEST_COUNT = Counter(
-    "http_requests_total", "Total HTTP requests", ["method", "endpoint", "status"]
-)
-REQUEST_LATENCY = Histogram("http_request_duration_seconds", "HTTP request latency")
+from src.core.rate_limit import close_rate_limiter
+from src.core.redis_client import close_redis_client
+from src.db.instrumentation import finish_request_tracking, start_request_tracking
+from src.db.session import dispose_async_engine
+from src.infrastructure.storage.executor import get_storage_executor
+from src.infrastructure.storage.registry import get_storage_registry
+from src.services.catalog_crawler import run_periodic_crawls
 
 # Structured logging
 logger = structlog.get_logger()
-limiter = Limiter(key_func=get_remote_address)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    preload_roots = [
+        root.strip()
+        for root in settings.STORAGE_PRELOAD_ROOTS.split(",")
+        if root.strip()
+    ]
+    if settings.CACHE_REDIS_ENABLED:
+        await start_cache_invalidation()
+    await get_storage_registry().startup(preload_roots)
+    crawl_task = None
+    if settings.CATALOG_CRAWL_INTERVAL > 0 and preload_roots:
+        crawl_task = asyncio.create_task(
+            run_periodic_crawls(preload_roots, settings.CATALOG_CRAWL_INTERVAL)
+        )
+    yield
+    if crawl_task is not None:
+        crawl_task.cancel()
+        # Wait for the crawl to wind down before the engine is disposed
+        await asyncio.gather(crawl_task, return_exceptions=True)
+    get_storage_registry().shutdown()
+    get_storage_executor().shutdown(wait=True)
+    await dispose_async_engine()
+    await close_rate_limiter()
+    await stop_cache_invalidation()
+    await close_redis_client()
 
 
 def create_app() -> FastAPI:
@@ -39,6 +68,7 @@ def create_app() -> FastAPI:
         - Database Integration
         - Error Handling
         """,
+        lifespan=lifespan,
     )
 
     # Configure CORS
@@ -55,18 +85,28 @@ def create_app() -> FastAPI:
     app.include_router(api_router)
 
     @app.middleware("http")
-    async def metrics_middleware(request: Request, call_next):
-        start_time = time.time()
+    async def db_timing_middleware(request: Request, call_next):
+        stats = start_request_tracking()
+        response = await call_next(request)
+        if stats.count:
+            response.headers.append("Server-Timing", stats.server_timing())
+            finish_request_tracking(stats, request.url.path)
+        return response
+
+    @app.middleware("http")
+    async def rate_limit_headers_middleware(request: Request, call_next):
+        # Set here rather than in the dependency so that handlers returning
+        # their own Response objects still carry the headers
         response = await call_next(request)
-        # Record metrics
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=response.status_code,
-        ).inc()
-        REQUEST_LATENCY.observe(time.time() - start_time)
+        decision = getattr(request.state, "rate_limit", None)
+        if decision is not None:
+            for name, value in decision.headers().items():
+                response.headers.setdefault(name, value)
         return response
 
+    # Outermost, so that it times the other middleware too
+    app.add_middleware(HTTPMetricsMiddleware)
+
     @app.get("/health")
     async def health_check():
         return JSONResponse({"status": "healthy"})
@@ -0,0 +1,48 @@
+"""file catalog
+
+Revision ID: 4b7d2e91c3a5
+Revises: 62af5c82d8c9
+Create Date: 2026-10-18 09:12:44.204118
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4b7d2e91c3a5"
+down_revision = "62af5c82d8c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "file_catalog",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("root", sa.String(), nullable=False),
+        sa.Column("path", sa.String(collation="C"), nullable=False),
+        sa.Column("parent", sa.String(collation="C"), nullable=True),
+        sa.Column("name", sa.String(collation="C"), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("created", sa.Float(), nullable=False),
+        sa.Column("last_modified", sa.Float(), nullable=False),
+        sa.Column("mtime_ns", sa.BigInteger(), nullable=False),
+        sa.Column("is_file", sa.Boolean(), nullable=False),
+        sa.Column("is_dir", sa.Boolean(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+        sa.Column("crawled_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("root", "path", name="uq_file_catalog_root_path"),
+    )
+    op.create_index(
+        "ix_file_catalog_root_parent_name",
+        "file_catalog",
+        ["root", "parent", "name"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_file_catalog_root_parent_name", table_name="file_catalog")
+    op.drop_table("file_catalog")
@@ -0,0 +1,33 @@
+"""file catalog sort indexes
+
+Revision ID: 9c1f5a07e2d4
+Revises: 4b7d2e91c3a5
+Create Date: 2026-10-18 11:37:02.518310
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c1f5a07e2d4"
+down_revision = "4b7d2e91c3a5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_file_catalog_root_parent_size",
+        "file_catalog",
+        ["root", "parent", "size", "name"],
+    )
+    op.create_index(
+        "ix_file_catalog_root_parent_mtime",
+        "file_catalog",
+        ["root", "parent", "last_modified", "name"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_file_catalog_root_parent_mtime", table_name="file_catalog")
+    op.drop_index("ix_file_catalog_root_parent_size", table_name="file_catalog")
@@ -0,0 +1,285 @@
+import asyncio
+import hashlib
+import os
+import posixpath
+import stat
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.db.repositories import ChildState, FileCatalogRepository
+from src.db.session import SessionLocal
+from src.utils.logging import logger
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class CrawlStats:
+    directories_scanned: int = 0
+    directories_skipped: int = 0
+    entries_upserted: int = 0
+    entries_deleted: int = 0
+    files_hashed: int = 0
+    duration: float = 0.0
+
+
+def _join(parent: str, name: str) -> str:
+    return posixpath.join(parent, name) if parent else name
+
+
+class CatalogCrawler:
+    """
+    Incrementally mirrors a storage root into the `file_catalog` table.
+
+    Directory mtimes change whenever an entry is added, removed or renamed,
+    so directories whose stored mtime still matches are not rescanned; the
+    crawler only descends through them using the child directories already
+    in the catalog. In-place edits of a file do not touch its directory, so
+    they are picked up on the next rescan of that directory or by a `full`
+    crawl. Content hashes are only recomputed when a file's size or mtime
+    changed.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: Optional[int] = None,
+        hash_max_bytes: Optional[int] = None,
+    ):
+        self.root = Path(root).resolve()
+        self.root_key = str(self.root)
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.CATALOG_CRAWL_BATCH_SIZE
+        self.hash_max_bytes = (
+            settings.CATALOG_HASH_MAX_BYTES
+            if hash_max_bytes is None
+            else hash_max_bytes
+        )
+
+    def crawl(
+        self, full: bool = False, stop: Optional[threading.Event] = None
+    ) -> CrawlStats:
+        """
+        Bring the catalog for this root up to date with the filesystem.
+        Setting `stop` ends the walk after the current directory, keeping
+        what was crawled so far; the next crawl picks up the rest.
+        """
+        started_at = time.perf_counter()
+        stats = CrawlStats()
+        with self.session_factory() as session:
+            known = FileCatalogRepository(session).directory_mtimes(self.root_key)
+            children: Dict[str, List[str]] = defaultdict(list)
+            for path in known:
+                if path:
+                    children[posixpath.dirname(path)].append(path)
+
+            # Keyed by path: a directory's own row (written when it is
+            # rescanned) supersedes the one queued by its parent's scan
+            pending: Dict[str, Dict[str, Any]] = {}
+            stack = [""]
+            while stack and not (stop is not None and stop.is_set()):
+                rel = stack.pop()
+                try:
+                    dir_stat = os.stat(self.root / rel)
+                except OSError:
+                    # Removed since its parent was read (the parent's next
+                    # rescan drops it from the catalog) or unreadable
+                    continue
+                if not stat.S_ISDIR(dir_stat.st_mode):
+                    continue
+
+                if not full and known.get(rel) == dir_stat.st_mtime_ns:
+                    stats.directories_skipped += 1
+                    stack.extend(children.get(rel, ()))
+                    continue
+
+                stats.directories_scanned += 1
+                subdirs = self._rescan(session, rel, dir_stat, pending, stats)
+                stack.extend(subdirs)
+                if len(pending) >= self.batch_size:
+                    self._flush(session, pending, stats)
+
+            self._flush(session, pending, stats)
+
+        stats.duration = time.perf_counter() - started_at
+        logger.info(
+            "catalog_crawl_complete - root=%s scanned=%s skipped=%s upserted=%s "
+            "deleted=%s hashed=%s duration=%.3f",
+            self.root_key,
+            stats.directories_scanned,
+            stats.directories_skipped,
+            stats.entries_upserted,
+            stats.entries_deleted,
+            stats.files_hashed,
+            stats.duration,
+        )
+        return stats
+
+    def _rescan(
+        self,
+        session: Session,
+        rel: str,
+        dir_stat: os.stat_result,
+        pending: Dict[str, Dict[str, Any]],
+        stats: CrawlStats,
+    ) -> List[str]:
+        """Queue rows for one directory's entries and drop vanished ones"""
+        previous = FileCatalogRepository(session).children_state(self.root_key, rel)
+
+        crawled_at = time.time()
+        subdirs = []
+        seen = set()
+        # Directories whose catalog subtree is stale: removed or replaced
+        stale_trees = []
+        try:
+            scanner = os.scandir(self.root / rel)
+        except OSError as e:
+            logger.warning(
+                "catalog_scan_failed - root=%s path=%s error=%s", self.root_key, rel, e
+            )
+            return []
+        with scanner as entries:
+            for entry in entries:
+                try:
+                    entry_stat = entry.stat()
+                    # Only real directories are descended into, so symlink
+                    # loops cannot trap the crawler
+                    real_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    # Removed since the listing, a symlink loop or unreadable
+                    continue
+                seen.add(entry.name)
+                path = _join(rel, entry.name)
+                before = previous.get(entry.name)
+                if before is not None and before[3] and not real_dir:
+                    stale_trees.append(path)
+                content_hash = None
+                if stat.S_ISREG(entry_stat.st_mode):
+                    content_hash = self._content_hash(
+                        entry.path, entry_stat, before, stats
+                    )
+                elif real_dir:
+                    subdirs.append(path)
+                row = self._row(
+                    path, rel, entry.name, entry_stat, content_hash, crawled_at
+                )
+                if real_dir:
+                    # Only a directory's own rescan stamps its mtime, so a
+                    # crawl stopped before reaching it still rescans it next
+                    # time; until then keep the stamp of its last rescan
+                    row["mtime_ns"] = before[1] if before and before[3] else 0
+                pending[path] = row
+
+        # The directory itself, stamped with the mtime taken before the scan
+        # so changes made during the scan trigger another rescan next time
+        pending[rel] = self._row(
+            rel,
+            posixpath.dirname(rel) if rel else None,
+            posixpath.basename(rel),
+            dir_stat,
+            None,
+            crawled_at,
+        )
+
+        vanished = []
+        for name, (_, _, _, is_dir) in previous.items():
+            if name not in seen:
+                vanished.append(_join(rel, name))
+                if is_dir:
+                    stale_trees.append(_join(rel, name))
+        if vanished or stale_trees:
+            stats.entries_deleted += FileCatalogRepository(session).delete_entries(
+                self.root_key, vanished, stale_trees
+            )
+        return subdirs
+
+    def _content_hash(
+        self,
+        full_path: str,
+        entry_stat: os.stat_result,
+        previous: Optional[ChildState],
+        stats: CrawlStats,
+    ) -> Optional[str]:
+        if previous is not None:
+            size, mtime_ns, content_hash, _ = previous
+            if size == entry_stat.st_size and mtime_ns == entry_stat.st_mtime_ns:
+                return content_hash
+        if entry_stat.st_size > self.hash_max_bytes:
+            return None
+        digest = hashlib.sha256()
+        try:
+            with open(full_path, "rb") as handle:
+                for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        stats.files_hashed += 1
+        return digest.hexdigest()
+
+    def _row(
+        self,
+        path: str,
+        parent: Optional[str],
+        name: str,
+        entry_stat: os.stat_result,
+        content_hash: Optional[str],
+        crawled_at: float,
+    ) -> Dict[str, Any]:
+        return {
+            "root": self.root_key,
+            "path": path,
+            "parent": parent,
+            "name": name,
+            "size": entry_stat.st_size,
+            "created": entry_stat.st_ctime,
+            "last_modified": entry_stat.st_mtime,
+            "mtime_ns": entry_stat.st_mtime_ns,
+            "is_file": stat.S_ISREG(entry_stat.st_mode),
+            "is_dir": stat.S_ISDIR(entry_stat.st_mode),
+            "content_hash": content_hash,
+            "crawled_at": crawled_at,
+        }
+
+    def _flush(
+        self, session: Session, pending: Dict[str, Dict[str, Any]], stats: CrawlStats
+    ) -> None:
+        if pending:
+            FileCatalogRepository(session).upsert_entries(list(pending.values()))
+            stats.entries_upserted += len(pending)
+            pending.clear()
+        session.commit()
+
+
+async def run_periodic_crawls(roots: Iterable[str], interval: float) -> None:
+    """
+    Incrementally crawl each root every `interval` seconds until cancelled.
+    Crawls run in the default thread pool so they never hold storage
+    executor workers for the length of a walk.
+    """
+    crawlers = [CatalogCrawler(Path(root)) for root in roots]
+    stop = threading.Event()
+    while True:
+        for crawler in crawlers:
+            crawl = asyncio.ensure_future(asyncio.to_thread(crawler.crawl, stop=stop))
+            try:
+                await asyncio.shield(crawl)
+            except asyncio.CancelledError:
+                # Cancelling does not stop the thread: ask the walk to stop
+                # and wait for it, so shutdown cannot dispose of the engine
+                # while a crawl still holds a session
+                stop.set()
+                await asyncio.gather(crawl, return_exceptions=True)
+                raise
+            except Exception as e:
+                logger.error(
+                    "catalog_crawl_failed - root=%s error=%s", crawler.root_key, e
+                )
+        await asyncio.sleep(interval)
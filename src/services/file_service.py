@@ -1,38 +1,283 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import io
+from operator import itemgetter
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Tuple
 
-from src.api.v1.models.responses import PaginatedDirectoryResponse, PaginationInfo
-from src.core.interfaces.storage import StorageBackend
-from src.services.pagination import PaginationService
+from src.api.v1.models.responses import (
+    FileMetadataResponse,
+    PaginatedDirectoryResponse,
+    PaginationInfo,
+)
+from src.core.config import settings
+from src.core.interfaces.storage import ListingQuery, SortKey, StorageBackend
+from src.infrastructure.storage.executor import StorageExecutor, get_storage_executor
+from src.services.listing_cache import ListingCache, Snapshot
+from src.services.pagination import CursorState, PaginationService
+from src.services.single_flight import SingleFlight
+
+# Upper bound on paths handled per storage call in a batch, so results keep
+# streaming back while the rest of the batch is still being looked up
+MAX_BATCH_CHUNK = 64
+CONTENT_CHUNK_SIZE = 64 * 1024
 
 
 class FileService:
-    def __init__(self, storage: StorageBackend):
+    def __init__(
+        self,
+        storage: StorageBackend,
+        executor: Optional[StorageExecutor] = None,
+        streaming: Optional[bool] = None,
+        listing_cache: Optional[ListingCache] = None,
+    ):
         self.storage = storage
+        self.executor = executor or get_storage_executor()
         self.pagination = PaginationService()
+        self.listing_cache = (
+            ListingCache.from_settings() if listing_cache is None else listing_cache
+        )
+        self.streaming = (
+            settings.STORAGE_STREAMING_LISTINGS if streaming is None else streaming
+        )
+        # Identical concurrent reads against this backend share one call
+        self.single_flight = SingleFlight()
 
-    def get_metadata(self, path: str) -> Dict[str, Any]:
+    async def get_metadata(self, path: str) -> Dict[str, Any]:
         """Get metadata for a file or directory"""
-        return self.storage.get_metadata(path)
+        return await self.single_flight.do(
+            "get_metadata",
+            path,
+            lambda: self.executor.run(self.storage.get_metadata, path),
+        )
+
+    async def get_validator(self, path: str) -> Tuple[float, int]:
+        """Fresh `(last_modified, size)` of a file, bypassing metadata caches"""
+        return await self.executor.run(self.storage.get_validator, path)
+
+    async def directory_version(self, path: str) -> Optional[str]:
+        return await self.single_flight.do(
+            "directory_version",
+            path,
+            lambda: self.executor.run(self._listing_version, path),
+        )
+
+    async def iter_metadata(
+        self, paths: List[str], concurrency: int
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield `(path, metadata)` for each path in completion order, with at
+        most `concurrency` batched storage calls in flight. Paths that cannot
+        be read yield `{"path": ..., "error": ...}` as metadata.
+        """
+        if not paths:
+            return
+        chunk_size = min(MAX_BATCH_CHUNK, -(-len(paths) // concurrency))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def lookup(chunk: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+            async with semaphore:
+                found = await self.executor.run(self.storage.get_metadata_many, chunk)
+            return [
+                (path, metadata or {"path": path, "error": f"File not found: {path}"})
+                for path, metadata in zip(chunk, found)
+            ]
 
-    def read_content(self, path: str) -> str:
+        tasks = [
+            asyncio.create_task(lookup(paths[i : i + chunk_size]))
+            for i in range(0, len(paths), chunk_size)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def read_content(self, path: str) -> str:
         """Read content from a text file"""
-        return self.storage.read_content(path)
+        return await self.single_flight.do(
+            "read_content",
+            path,
+            lambda: self.executor.run(self.storage.read_content, path),
+        )
+
+    async def open_content(self, path: str) -> Tuple[BinaryIO, int]:
+        """Open a file for streaming; returns the handle and its current size"""
+        return await self.executor.run(self._open_sized, path)
+
+    def _open_sized(self, path: str) -> Tuple[BinaryIO, int]:
+        handle = self.storage.open_content(path)
+        try:
+            size = handle.seek(0, io.SEEK_END)
+        except BaseException:
+            handle.close()
+            raise
+        return handle, size
+
+    async def iter_range(
+        self, handle: BinaryIO, start: int, end: int
+    ) -> AsyncIterator[bytes]:
+        """Yield bytes `start`..`end` (inclusive) of an open file in chunks"""
+        await self.executor.run(handle.seek, start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await self.executor.run(
+                handle.read, min(CONTENT_CHUNK_SIZE, remaining)
+            )
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+    async def close_content(self, handle: BinaryIO) -> None:
+        await self.executor.run(handle.close)
+
+    async def list_directory(
+        self,
+        path: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        query: Optional[ListingQuery] = None,
+    ) -> PaginatedDirectoryResponse:
+        if query is not None and query.is_default:
+            query = None
+        return await self.single_flight.do(
+            "list_directory",
+            (path, limit, cursor, query),
+            lambda: self._list_directory(path, limit, cursor, query),
+        )
 
-    def list_directory(
-        self, path: str, limit: int = 50, cursor: Optional[str] = None
+    async def _list_directory(
+        self,
+        path: str,
+        limit: int,
+        cursor: Optional[str],
+        query: Optional[ListingQuery],
     ) -> PaginatedDirectoryResponse:
-        items = self.storage.list_items(path)
-        sorted_items = sorted(items)
+        if query is not None:
+            return await self._query_directory(path, limit, cursor, query)
+        if self.streaming:
+            return await self._list_directory_streaming(path, limit, cursor)
+
+        snapshot = await self.executor.run(self._snapshot, path)
 
         pagination_result = self.pagination.paginate(
-            items=sorted_items, limit=limit, cursor=cursor
+            items=snapshot.listing,
+            limit=limit,
+            cursor=cursor,
+            get_key=itemgetter("name"),
+            version=snapshot.version,
+        )
+
+        return self._page_response(
+            pagination_result.items,
+            pagination_result.cursor,
+            pagination_result.has_more,
         )
 
-        contents = [self.get_metadata(item) for item in pagination_result.items]
+    async def _list_directory_streaming(
+        self, path: str, limit: int, cursor: Optional[str]
+    ) -> PaginatedDirectoryResponse:
+        """
+        Serve one page without materializing the directory: the storage
+        backend selects the next `limit` names in a single bounded pass.
+        Cursors stay interchangeable with the sorted mode since both are
+        keyed on the entry name.
+        """
+        after = None
+        if cursor:
+            after = self.pagination.decode_cursor(cursor).key
+            if not isinstance(after, str):
+                raise ValueError("Invalid cursor format")
+
+        items, next_after = await self.executor.run(
+            self.storage.scan_page, path, after, limit
+        )
+
+        next_cursor = None
+        if next_after is not None:
+            next_cursor = self.pagination.encode_cursor(CursorState(key=next_after))
+        return self._page_response(items, next_cursor, next_after is not None)
+
+    async def _query_directory(
+        self, path: str, limit: int, cursor: Optional[str], query: ListingQuery
+    ) -> PaginatedDirectoryResponse:
+        """
+        Sorted and filtered page. Cursors carry the `(sort value, name)` key
+        of the last entry served and are only valid for the same query.
+        """
+        after = None
+        if cursor:
+            after = query.cursor_key(self.pagination.decode_cursor(cursor).key)
 
+        if self.streaming:
+            items, next_after = await self.executor.run(
+                self.storage.query_page, path, query, after, limit
+            )
+        else:
+            items, next_after = await self.executor.run(
+                self._query_snapshot, path, query, after, limit
+            )
+
+        next_cursor = None
+        if next_after is not None:
+            next_cursor = self.pagination.encode_cursor(
+                CursorState(key=list(next_after))
+            )
+        return self._page_response(items, next_cursor, next_after is not None)
+
+    def _query_snapshot(
+        self, path: str, query: ListingQuery, after: Optional[SortKey], limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[SortKey]]:
+        # Reuses the cached name-sorted listing rather than rescanning
+        return query.select(self._snapshot(path).listing, after, limit)
+
+    @staticmethod
+    def _page_response(
+        items: List[Dict[str, Any]], cursor: Optional[str], has_more: bool
+    ) -> PaginatedDirectoryResponse:
         return PaginatedDirectoryResponse(
-            contents=contents,
-            pagination=PaginationInfo(
-                cursor=pagination_result.cursor, has_more=pagination_result.has_more
-            ),
+            contents=[FileMetadataResponse.model_validate(item) for item in items],
+            pagination=PaginationInfo(cursor=cursor, has_more=has_more),
         )
+
+    def _listing_version(self, path: str) -> Optional[str]:
+        """
+        Version of the listings served for `path`. Sorted listings come from
+        a cached snapshot, which may predate in-place edits of its entries,
+        so the snapshot's digest is part of the version.
+        """
+        if (
+            self.streaming
+            or self.storage.namespace is None
+            or not self.listing_cache.enabled
+        ):
+            return self.storage.directory_version(path)
+        snapshot = self._snapshot(path)
+        if snapshot.digest is None:
+            return snapshot.version
+        return f"{snapshot.version}-{snapshot.digest}"
+
+    def _snapshot(self, path: str) -> Snapshot:
+        """
+        Sorted listing of `path` and the directory version it reflects.
+        Runs on the storage executor; unchanged directories are served from
+        the listing cache so later pages are a slice rather than a rescan.
+        """
+        # The version is read before scanning so a concurrent change is never
+        # stamped with the pre-change version
+        version = self.storage.directory_version(path)
+        namespace = self.storage.namespace
+        cacheable = (
+            version is not None and namespace is not None and self.listing_cache.enabled
+        )
+        if cacheable:
+            cached = self.listing_cache.get((namespace, path), version)
+            if cached is not None:
+                return cached
+
+        items = self.storage.list_with_metadata(path)
+        items.sort(key=itemgetter("name"))
+        if cacheable:
+            return self.listing_cache.put((namespace, path), version, items)
+        return Snapshot(version, items)
@@ -0,0 +1,104 @@
+import hashlib
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from src.core.cache import LRUCache
+from src.core.config import settings
+
+CacheKey = Tuple[str, str]
+Listing = List[Dict[str, Any]]
+
+
+def listing_digest(listing: Listing) -> str:
+    """Digest of the names, sizes and mtimes of a listing's entries"""
+    digest = hashlib.blake2b(digest_size=8)
+    for item in listing:
+        entry = (item.get("name"), item.get("size"), item.get("last_modified"))
+        digest.update(repr(entry).encode())
+    return digest.hexdigest()
+
+
+class Snapshot(NamedTuple):
+    """Sorted listing and the directory version it was built at"""
+
+    version: Optional[str]
+    listing: Listing
+    # Set for cached snapshots (see `listing_digest`)
+    digest: Optional[str] = None
+
+
+class ListingCache:
+    """
+    LRU cache of sorted directory listings, validated against the directory
+    version (inode + mtime) they were built from.
+
+    Listings are shared between requests and must be treated as read-only.
+    A file whose content changes in place does not change the directory
+    version, so listings are also dropped after `ttl` seconds, bounding how
+    long such a file keeps its cached size and mtime.
+    """
+
+    def __init__(
+        self,
+        max_listings: int,
+        max_items: int,
+        ttl: Optional[float] = None,
+        backend: str = "",
+    ):
+        self.max_listings = max_listings
+        self.max_items = max_items
+        # Listings weigh their entry count, bounding the total across listings
+        self._cache = LRUCache(
+            "storage.listing",
+            max_entries=max_listings,
+            ttl=ttl,
+            max_weight=max_items,
+            backend=backend,
+        )
+
+    @classmethod
+    def from_settings(cls, backend: str = "") -> "ListingCache":
+        return cls(
+            max_listings=settings.STORAGE_LISTING_CACHE_MAX_LISTINGS,
+            max_items=settings.STORAGE_LISTING_CACHE_MAX_ITEMS,
+            ttl=settings.STORAGE_METADATA_CACHE_TTL,
+            backend=backend,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    @property
+    def hits(self) -> int:
+        return self._cache.hits
+
+    @property
+    def misses(self) -> int:
+        return self._cache.misses
+
+    @property
+    def evictions(self) -> int:
+        return self._cache.evictions
+
+    def get(self, key: CacheKey, version: str) -> Optional[Snapshot]:
+        cached = self._cache.get_entry(key)
+        if (
+            cached is None
+            or cached.expired(self._cache.clock())
+            or cached.value.version != version
+        ):
+            self._cache.record("miss")
+            return None
+        self._cache.record("hit")
+        return cached.value
+
+    def put(self, key: CacheKey, version: str, listing: Listing) -> Snapshot:
+        snapshot = Snapshot(version, listing, listing_digest(listing))
+        self._cache.set(key, snapshot, weight=len(listing))
+        return snapshot
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
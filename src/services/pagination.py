@@ -1,6 +1,8 @@
+import json
 from base64 import b64decode, b64encode
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Any, Callable, Generic, List, TypeVar
+from typing import Any, Callable, Generic, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -12,31 +14,95 @@ class PaginationResult(Generic[T]):
     has_more: bool
 
 
+@dataclass
+class CursorState:
+    """Decoded cursor: last key served, position hint and collection version"""
+
+    key: Any
+    position: Optional[int] = None
+    version: Optional[str] = None
+
+
 class PaginationService:
+    @staticmethod
+    def encode_cursor(state: CursorState) -> str:
+        payload = {"k": state.key}
+        if state.position is not None:
+            payload["p"] = state.position
+        if state.version is not None:
+            payload["v"] = state.version
+        return b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> CursorState:
+        try:
+            payload = json.loads(b64decode(cursor.encode(), validate=True).decode())
+            if not isinstance(payload, dict) or "k" not in payload:
+                raise ValueError
+            position = payload.get("p")
+            version = payload.get("v")
+            if position is not None and (
+                not isinstance(position, int) or isinstance(position, bool)
+            ):
+                raise ValueError
+            if version is not None and not isinstance(version, str):
+                raise ValueError
+        except Exception:
+            raise ValueError("Invalid cursor format")
+        return CursorState(key=payload["k"], position=position, version=version)
+
+    @staticmethod
+    def seek(
+        items: List[T],
+        state: CursorState,
+        get_key: Callable[[T], Any],
+        version: Optional[str] = None,
+    ) -> int:
+        """
+        Index of the first item after the cursor in a list sorted by `get_key`.
+        The position hint is trusted in O(1) when the collection version still
+        matches; otherwise the key is located by binary search.
+        """
+        position = state.position
+        if (
+            version is not None
+            and state.version == version
+            and position is not None
+            and 0 < position <= len(items)
+            and get_key(items[position - 1]) == state.key
+        ):
+            return position
+        try:
+            return bisect_right(items, state.key, key=get_key)
+        except TypeError:
+            raise ValueError("Invalid cursor format")
+
     @staticmethod
     def paginate(
         items: List[T],
         limit: int,
         cursor: str | None = None,
-        get_key: Callable[[T], str] = lambda x: str(x),
+        get_key: Callable[[T], Any] = lambda x: str(x),
+        version: Optional[str] = None,
     ) -> PaginationResult[T]:
+        """
+        Paginate `items`, which must already be sorted by `get_key`.
+        `version` identifies the snapshot the list was built from and lets
+        cursors issued against the same snapshot resume without a search.
+        """
+        start = 0
         if cursor:
-            try:
-                cursor_key = b64decode(cursor.encode()).decode()
-                start_idx = next(
-                    (i for i, item in enumerate(items) if get_key(item) > cursor_key),
-                    len(items),
-                )
-                items = items[start_idx:]
-            except Exception:
-                raise ValueError("Invalid cursor format")
-
-        page_items = items[:limit]
-        has_more = len(items) > limit
+            state = PaginationService.decode_cursor(cursor)
+            start = PaginationService.seek(items, state, get_key, version)
+
+        end = start + limit
+        page_items = items[start:end]
+        has_more = len(items) > end
 
         next_cursor = None
         if has_more and page_items:
-            last_key = get_key(page_items[-1])
-            next_cursor = b64encode(last_key.encode()).decode()
+            next_cursor = PaginationService.encode_cursor(
+                CursorState(key=get_key(page_items[-1]), position=end, version=version)
+            )
 
         return PaginationResult(items=page_items, cursor=next_cursor, has_more=has_more)
@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from prometheus_client import Counter, Gauge
+
+SINGLE_FLIGHT_CALLS = Counter(
+    "single_flight_calls_total",
+    "Coalesced operations by role: leaders run the operation, waiters share it",
+    ["operation", "role"],
+)
+SINGLE_FLIGHT_IN_FLIGHT = Gauge(
+    "single_flight_in_flight",
+    "Distinct coalesced operations currently running",
+    multiprocess_mode="livesum",
+)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical operations: while an operation for a
+    key is running, later callers with the same key await its outcome
+    instead of starting their own, so a burst of identical requests costs
+    one storage call. Results and errors are shared by every caller and
+    must be treated as read-only.
+
+    The operation runs as its own task, so a caller that is cancelled (for
+    instance by a client disconnect) does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(
+        self, operation: str, key: Hashable, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        key = (operation, key)
+        task = self._calls.get(key)
+        if task is None:
+            SINGLE_FLIGHT_CALLS.labels(operation, "leader").inc()
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            SINGLE_FLIGHT_IN_FLIGHT.inc()
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            SINGLE_FLIGHT_CALLS.labels(operation, "waiter").inc()
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        SINGLE_FLIGHT_IN_FLIGHT.dec()
+        if not task.cancelled():
+            # Marks the error retrieved when every caller has gone away
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,44 @@
+from threading import Lock
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from fastapi.routing import iter_route_contexts
+from starlette.requests import Request
+from starlette.routing import BaseRoute
+
+# Full templates (prefixes included) of each route, by the route's id
+_templates: Dict[int, List[Tuple[Pattern, str]]] = {}
+_templates_lock = Lock()
+
+
+def _index(routes: List[BaseRoute]) -> Dict[int, List[Tuple[Pattern, str]]]:
+    index: Dict[int, List[Tuple[Pattern, str]]] = {}
+    for context in iter_route_contexts(routes):
+        if context.path_format is None or context.path_regex is None:
+            continue
+        index.setdefault(id(context.original_route), []).append(
+            (context.path_regex, context.path_format)
+        )
+    return index
+
+
+def route_template(request: Request) -> Optional[str]:
+    """
+    Template of the route serving `request`, e.g. "/api/v1/files/{path:path}",
+    or None before routing and for unmatched requests.
+
+    Included routers keep their routes unprefixed, so the template is
+    looked up among the application's effective routes.
+    """
+    route = request.scope.get("route")
+    if route is None:
+        return None
+    with _templates_lock:
+        candidates = _templates.get(id(route))
+        if candidates is None:
+            _templates.update(_index(request.app.routes))
+            candidates = _templates.setdefault(id(route), [])
+    path = request.scope.get("path", "")
+    for path_regex, template in candidates:
+        if len(candidates) == 1 or path_regex.match(path):
+            return template
+    return getattr(route, "path_format", None)
@@ -4,11 +4,13 @@ import jwt
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from src.core.config import settings
 from src.db.models import Base
-from src.db.session import get_db
+from src.db.session import async_database_url, get_db, get_sync_db
 from src.main import app
 
 
@@ -24,9 +26,20 @@ def test_db():
 
 @pytest.fixture
 def client(test_db):
-    """Create test client with database session"""
+    """Create test client with async and sync database sessions"""
+    # Unpooled, so no connection outlives the test client's event loop
+    async_engine = create_async_engine(
+        async_database_url(settings.DATABASE_URL), poolclass=NullPool
+    )
+    TestingAsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
 
-    def override_get_db():
+    def override_get_sync_db():
         try:
             db = test_db()
             yield db
@@ -34,6 +47,7 @@ def client(test_db):
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_sync_db] = override_get_sync_db
 
     with TestClient(app) as test_client:
         yield test_client
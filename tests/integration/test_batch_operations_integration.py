@@ -85,3 +85,81 @@ def test_batch_empty_paths(client, auth_headers, tmp_path):
     data = response.json()
     assert isinstance(data, list), "Expected response to be a list"
     assert len(data) == 0, f"Expected empty array, got array of length {len(data)}"
+
+
+def test_batch_deduplicates_and_reports_missing(client, auth_headers, tmp_path):
+    """
+    BATCH-005: Validate duplicate and missing paths in one batch
+
+    Expected:
+    - Response status code is 200 OK
+    - Duplicate paths are returned once, in request order
+    - Missing paths are reported with an error entry
+    """
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+
+    response = client.post(
+        "/api/v1/files/batch",
+        json={"paths": ["b.txt", "a.txt", "b.txt", "missing.txt"]},
+        headers=auth_headers,
+        params={"base_path": str(tmp_path)},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 3
+    assert data[0]["path"].endswith("b.txt")
+    assert data[1]["path"].endswith("a.txt")
+    assert data[2] == {
+        "path": "missing.txt",
+        "error": "File not found: missing.txt",
+    }
+
+
+def test_batch_streams_ndjson(client, auth_headers, tmp_path):
+    """
+    BATCH-006: Validate NDJSON streaming of batch results
+
+    Expected:
+    - Response is application/x-ndjson with one JSON object per path
+    """
+    import json
+
+    paths = [f"file_{i}.txt" for i in range(20)]
+    for name in paths:
+        (tmp_path / name).write_text(name)
+
+    response = client.post(
+        "/api/v1/files/batch",
+        json={"paths": paths},
+        headers={**auth_headers, "Accept": "application/x-ndjson"},
+        params={"base_path": str(tmp_path)},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(item["path"].rsplit("/", 1)[-1] for item in lines) == sorted(paths)
+
+
+def test_batch_rejects_oversized_batches(client, auth_headers, tmp_path, monkeypatch):
+    """
+    BATCH-007: Validate the maximum batch size
+
+    Expected:
+    - Response status code is 400 Bad Request when the limit is exceeded
+    """
+    from src.core.config import settings
+
+    monkeypatch.setattr(settings, "FILES_BATCH_MAX_PATHS", 2)
+
+    response = client.post(
+        "/api/v1/files/batch",
+        json={"paths": ["a", "b", "c"]},
+        headers=auth_headers,
+        params={"base_path": str(tmp_path)},
+    )
+
+    assert response.status_code == 400
+    assert "maximum of 2 paths" in response.json()["error"]["message"]
@@ -268,3 +268,248 @@ def test_list_nonexistent_directory(client, auth_headers, tmp_path):
     assert "message" in error_data["error"]
     assert "not found" in error_data["error"]["message"].lower()
     assert nested_path in error_data["error"]["message"]
+
+
+def test_get_raw_file_content_with_ranges(client, auth_headers, tmp_path):
+    """
+    FILE-007: Validate raw content streaming and HTTP Range support
+
+    Expected:
+    - Full download returns the exact bytes with Content-Length
+    - Single range returns 206 with Content-Range
+    - Multiple ranges return a multipart/byteranges body
+    - Unsatisfiable range returns 416 with Content-Range: bytes */size
+    """
+    payload = bytes(range(256)) * 4
+    (tmp_path / "blob.bin").write_bytes(payload)
+    params = {"path": "blob.bin", "base_path": str(tmp_path), "raw": "true"}
+
+    response = client.get("/api/v1/files/content", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.content == payload
+    assert response.headers["content-length"] == str(len(payload))
+    assert response.headers["accept-ranges"] == "bytes"
+
+    response = client.get(
+        "/api/v1/files/content",
+        params=params,
+        headers={**auth_headers, "Range": "bytes=10-19"},
+    )
+    assert response.status_code == 206
+    assert response.content == payload[10:20]
+    assert response.headers["content-range"] == f"bytes 10-19/{len(payload)}"
+
+    response = client.get(
+        "/api/v1/files/content",
+        params=params,
+        headers={**auth_headers, "Range": "bytes=0-1,-2"},
+    )
+    assert response.status_code == 206
+    assert response.headers["content-type"].startswith("multipart/byteranges")
+    assert response.headers["content-length"] == str(len(response.content))
+    assert payload[:2] in response.content and payload[-2:] in response.content
+
+    response = client.get(
+        "/api/v1/files/content",
+        params=params,
+        headers={**auth_headers, "Range": f"bytes={len(payload)}-"},
+    )
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(payload)}"
+    assert "error" in response.json()
+
+
+def test_unsatisfiable_open_range_on_streamed_backend(
+    client, auth_headers, tmp_path, monkeypatch
+):
+    """
+    FILE-011: Validate open-ended ranges past the end of a streamed file
+
+    Expected:
+    - Backends without a local path answer `bytes=<size>-` with 416 and a
+      JSON error body rather than the whole file
+    """
+    from src.infrastructure.storage.filesystem import FilesystemStorage
+
+    monkeypatch.setattr(FilesystemStorage, "local_path", lambda self, path: None)
+    payload = b"x" * 100
+    (tmp_path / "blob.bin").write_bytes(payload)
+
+    response = client.get(
+        "/api/v1/files/content",
+        params={"path": "blob.bin", "base_path": str(tmp_path), "raw": "true"},
+        headers={**auth_headers, "Range": f"bytes={len(payload)}-"},
+    )
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(payload)}"
+    assert "error" in response.json()
+
+
+def test_ignored_ranges_on_local_file(client, auth_headers, tmp_path):
+    """
+    FILE-012: Validate malformed and ignored ranges on a local file
+
+    Expected:
+    - Malformed ranges, other range units and ranges whose If-Range does
+      not match return 200 with the whole file
+    """
+    payload = bytes(range(256))
+    (tmp_path / "blob.bin").write_bytes(payload)
+    params = {"path": "blob.bin", "base_path": str(tmp_path), "raw": "true"}
+
+    for headers in (
+        {"Range": "bytes=abc"},
+        {"Range": "bytes=5-3"},
+        {"Range": "items=0-1"},
+        {"Range": "bytes=0-1", "If-Range": '"stale"'},
+    ):
+        response = client.get(
+            "/api/v1/files/content",
+            params=params,
+            headers={**auth_headers, **headers},
+        )
+        assert response.status_code == 200, headers
+        assert response.content == payload
+        assert "content-range" not in response.headers
+
+
+def test_json_content_size_cap(client, auth_headers, tmp_path, monkeypatch):
+    """
+    FILE-008: Validate the JSON content size cap
+
+    Expected:
+    - Files larger than FILES_CONTENT_MAX_JSON_BYTES return 413 in JSON mode
+    """
+    from src.core.config import settings
+
+    monkeypatch.setattr(settings, "FILES_CONTENT_MAX_JSON_BYTES", 4)
+    (tmp_path / "big.txt").write_text("too large")
+
+    response = client.get(
+        "/api/v1/files/content",
+        params={"path": "big.txt", "base_path": str(tmp_path)},
+        headers=auth_headers,
+    )
+    assert response.status_code == 413
+
+
+def test_conditional_requests(client, auth_headers, tmp_path):
+    """
+    FILE-009: Validate ETag / Last-Modified validators and 304 responses
+
+    Expected:
+    - Metadata, content and listings carry validators
+    - Matching If-None-Match or If-Modified-Since returns 304 Not Modified
+    - HEAD on raw content returns headers with the file length and no body
+    """
+    import os
+    import time
+
+    (tmp_path / "a.txt").write_text("hello")
+    settled = time.time() - 60
+    os.utime(tmp_path, (settled, settled))
+    base = {"base_path": str(tmp_path)}
+
+    for url, params in [
+        ("/api/v1/files", {**base, "path": "a.txt"}),
+        ("/api/v1/files/content", {**base, "path": "a.txt"}),
+        ("/api/v1/files/list", {**base, "path": ""}),
+    ]:
+        response = client.get(url, params=params, headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = client.get(
+            url, params=params, headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    response = client.get(
+        "/api/v1/files",
+        params={**base, "path": "a.txt"},
+        headers=auth_headers,
+    )
+    response = client.get(
+        "/api/v1/files",
+        params={**base, "path": "a.txt"},
+        headers={
+            **auth_headers,
+            "If-Modified-Since": response.headers["last-modified"],
+        },
+    )
+    assert response.status_code == 304
+
+    response = client.head(
+        "/api/v1/files/content",
+        params={**base, "path": "a.txt", "raw": "true"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-length"] == "5"
+    assert response.content == b""
+
+
+def test_list_and_batch_from_catalog_index(client, auth_headers, test_db, tmp_path):
+    """
+    DIR-008: Validate listings and batch lookups answered from the file catalog
+
+    Expected:
+    - With source=index, /files/list pages through crawled entries by name
+    - /files/batch returns indexed metadata and reports unindexed paths
+    - Entries created after the crawl only appear once the root is recrawled
+    """
+    from src.services.catalog_crawler import CatalogCrawler
+
+    for name in ("b.txt", "a.txt", "c.txt"):
+        (tmp_path / name).write_text(name)
+    crawler = CatalogCrawler(tmp_path, session_factory=test_db)
+    crawler.crawl()
+    (tmp_path / "d.txt").write_text("d")
+    params = {"base_path": str(tmp_path), "source": "index"}
+
+    response = client.get(
+        "/api/v1/files/list",
+        params={**params, "path": "", "limit": 2},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["path"].rsplit("/", 1)[-1] for item in data["contents"]] == [
+        "a.txt",
+        "b.txt",
+    ]
+    response = client.get(
+        "/api/v1/files/list",
+        params={
+            **params,
+            "path": "",
+            "limit": 2,
+            "cursor": data["pagination"]["cursor"],
+        },
+        headers=auth_headers,
+    )
+    assert [
+        item["path"].rsplit("/", 1)[-1] for item in response.json()["contents"]
+    ] == ["c.txt"]
+
+    response = client.post(
+        "/api/v1/files/batch",
+        json={"paths": ["a.txt", "d.txt"]},
+        params=params,
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    found, missing = response.json()
+    assert found["size"] == 5
+    assert missing["error"] == "File not found: d.txt"
+
+    crawler.crawl(full=True)
+    response = client.post(
+        "/api/v1/files/batch",
+        json={"paths": ["d.txt"]},
+        params=params,
+        headers=auth_headers,
+    )
+    assert response.json()[0]["size"] == 1
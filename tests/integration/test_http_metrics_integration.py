@@ -0,0 +1,55 @@
+from src.api.http_metrics import (
+    REQUEST_COUNT,
+    REQUEST_LATENCY,
+    RESPONSE_SIZE,
+    UNMATCHED_ROUTE,
+    parse_buckets,
+)
+
+CONTENT_ROUTE = "/api/v1/files/content"
+
+
+def _requests(route, status, method="GET"):
+    return REQUEST_COUNT.labels(method, route, status)._value.get()
+
+
+def _size_sum(route):
+    return RESPONSE_SIZE.labels("GET", route)._sum.get()
+
+
+def test_metrics_labeled_by_route_template(client, auth_headers, tmp_path):
+    """
+    Test ID: METRICS-001
+    Category: Monitoring
+    Description: HTTP metrics use route templates, not request paths
+    Expected Result: Requests for different files share the route's series
+        with their latency and body size recorded; unknown paths and
+        methods fall into shared unmatched and OTHER series
+    Type: Integration
+    """
+    (tmp_path / "a.txt").write_text("a" * 10)
+    (tmp_path / "b.txt").write_text("b" * 20)
+    served, sizes = _requests(CONTENT_ROUTE, 200), _size_sum(CONTENT_ROUTE)
+    latencies = REQUEST_LATENCY.labels("GET", CONTENT_ROUTE)._sum.get()
+    unmatched = _requests(UNMATCHED_ROUTE, 404)
+    other = _requests(UNMATCHED_ROUTE, 404, method="OTHER")
+
+    bodies = 0
+    for name in ("a.txt", "b.txt"):
+        response = client.get(
+            CONTENT_ROUTE,
+            params={"base_path": str(tmp_path), "path": name},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        bodies += len(response.content)
+    client.get("/api/v1/no-such-route/1")
+    client.get("/api/v1/no-such-route/2")
+    client.request("PURGE", "/api/v1/no-such-route/3")
+
+    assert _requests(CONTENT_ROUTE, 200) == served + 2
+    assert _size_sum(CONTENT_ROUTE) == sizes + bodies
+    assert REQUEST_LATENCY.labels("GET", CONTENT_ROUTE)._sum.get() > latencies
+    assert _requests(UNMATCHED_ROUTE, 404) == unmatched + 2
+    assert _requests(UNMATCHED_ROUTE, 404, method="OTHER") == other + 1
+    assert parse_buckets("1, 0.5,") == (0.5, 1.0)
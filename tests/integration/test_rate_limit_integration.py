@@ -0,0 +1,38 @@
+from src.core.rate_limit import RateLimit, get_rate_limiter
+
+
+def test_rate_limited_route_returns_429(client, auth_headers, tmp_path, monkeypatch):
+    """
+    Test ID: RATE-003
+    Category: Rate Limiting
+    Description: Route-level rate limits on authenticated endpoints
+    Expected Result: Allowed responses carry RateLimit headers; once the
+        route's limit is used up the API returns 429 with Retry-After,
+        while other routes are unaffected
+    Type: Integration
+    """
+    (tmp_path / "test.txt").write_text("Test content")
+    monkeypatch.setitem(
+        get_rate_limiter().routes, "files.list", RateLimit.parse("2/minute")
+    )
+    params = {"base_path": str(tmp_path), "path": ""}
+
+    response = client.get("/api/v1/files/list", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["RateLimit-Limit"] == "2"
+    assert response.headers["RateLimit-Remaining"] == "1"
+    assert response.headers["RateLimit-Policy"] == "2;w=60"
+
+    client.get("/api/v1/files/list", params=params, headers=auth_headers)
+    response = client.get("/api/v1/files/list", params=params, headers=auth_headers)
+    assert response.status_code == 429
+    assert response.json()["error"]["code"] == "RATE001"
+    assert int(response.headers["Retry-After"]) >= 1
+    assert response.headers["RateLimit-Remaining"] == "0"
+
+    response = client.get(
+        "/api/v1/files",
+        params={"base_path": str(tmp_path), "path": "test.txt"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
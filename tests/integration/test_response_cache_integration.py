@@ -0,0 +1,118 @@
+import os
+import time
+
+from src.api.v1 import response_cache
+from src.api.v1.endpoints import files
+from src.api.v1.response_cache import RESPONSE_CACHE_REQUESTS
+from src.core.cache import clear_caches, tiered
+from src.core.cache.memory import CACHE_LOOKUPS
+from src.core.config import settings
+from tests.conftest import create_test_token
+
+LIST_ROUTE = "/api/v1/files/list"
+
+
+def _count(result):
+    return RESPONSE_CACHE_REQUESTS.labels(LIST_ROUTE, result)._value.get()
+
+
+def test_listing_served_from_response_cache(
+    client, auth_headers, tmp_path, monkeypatch
+):
+    """
+    Test ID: RESP-001
+    Category: Performance
+    Description: Response cache for directory listings
+    Expected Result: A repeated listing is served from the cache with the
+        same body and ETag, a matching If-None-Match gets 304, callers with
+        a different scope set get their own entry, and an expired entry is
+        revalidated with its ETag instead of being re-encoded
+    Type: Integration
+    """
+    (tmp_path / "a.txt").write_text("a")
+    settled = time.time() - 60
+    os.utime(tmp_path, (settled, settled))
+    params = {"base_path": str(tmp_path), "path": "", "limit": 10}
+    hits, misses = _count("hit"), _count("miss")
+
+    first = client.get(LIST_ROUTE, params=params, headers=auth_headers)
+    second = client.get(LIST_ROUTE, params=params, headers=auth_headers)
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    # Hits still count against the route's rate limit
+    remaining = int(first.headers["RateLimit-Remaining"])
+    assert int(second.headers["RateLimit-Remaining"]) == remaining - 1
+    assert (_count("hit"), _count("miss")) == (hits + 1, misses + 1)
+
+    conditional = client.get(
+        LIST_ROUTE,
+        params=params,
+        headers={**auth_headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert conditional.status_code == 304
+
+    token = create_test_token(scopes=["files:read", "files:write"])
+    client.get(LIST_ROUTE, params=params, headers={"Authorization": f"Bearer {token}"})
+    assert _count("miss") == misses + 2
+
+    monkeypatch.setattr(files.list_directory, "response_cache_ttl", 0.0)
+    client.get(LIST_ROUTE, params={**params, "limit": 5}, headers=auth_headers)
+    revalidated = _count("revalidated")
+    response = client.get(
+        LIST_ROUTE, params={**params, "limit": 5}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["contents"][0]["path"].endswith("a.txt")
+    assert _count("revalidated") == revalidated + 1
+
+
+class FakeRedis:
+    """Just enough of the async Redis client for the shared cache tier"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, px=None):
+        self.values[key] = value
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+
+def test_response_cache_shared_through_redis(
+    client, auth_headers, tmp_path, monkeypatch
+):
+    """
+    Test ID: RESP-002
+    Category: Performance
+    Description: Response cache with the Redis tier enabled
+    Expected Result: A response cached by one worker is served to a worker
+        whose in-process cache does not hold it, byte for byte
+    Type: Integration
+    """
+    redis = FakeRedis()
+    monkeypatch.setattr(settings, "CACHE_REDIS_ENABLED", True)
+    monkeypatch.setattr(tiered, "get_redis_client", lambda: redis)
+    monkeypatch.setattr(response_cache, "_response_cache", None)
+    (tmp_path / "a.txt").write_text("a")
+    settled = time.time() - 60
+    os.utime(tmp_path, (settled, settled))
+    params = {"base_path": str(tmp_path), "path": "", "limit": 10}
+
+    first = client.get(LIST_ROUTE, params=params, headers=auth_headers)
+    assert first.status_code == 200
+    assert len(redis.values) == 1
+
+    # Another worker starts with an empty in-process tier
+    clear_caches("http.responses")
+    hits = _count("hit")
+    second = client.get(LIST_ROUTE, params=params, headers=auth_headers)
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert _count("hit") == hits + 1
+    assert CACHE_LOOKUPS.labels("http.responses", "", "l2_hit")._value.get() >= 1
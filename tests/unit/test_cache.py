@@ -0,0 +1,140 @@
+import asyncio
+import json
+import random
+
+from src.core.cache import InvalidationBus, LRUCache, TieredCache, clear_caches
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_cache_expiry_weight_and_shared_invalidation():
+    """
+    Test ID: CACHE-005
+    Category: Performance
+    Description: In-process cache tier and cross-worker invalidation
+    Expected Result: Entries expire after their TTL, the cache stays
+        within its entry and weight bounds, and an invalidation published
+        by another worker drops the key from every cache of that name
+        while the worker's own messages are ignored
+    Type: Unit
+    """
+    clock = FakeClock()
+    cache = LRUCache("test.lru", max_entries=3, ttl=10, max_weight=5, clock=clock)
+    cache.set("a", 1)
+    cache.set(("root", "b"), 2, ttl=30, weight=3)
+    assert cache.get("a") == 1
+    clock.now += 20
+    assert cache.get("a") is None
+    assert cache.get(("root", "b")) == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    assert cache.set("c", 3, weight=3) == 2
+    assert len(cache) == 1 and cache.weight == 3
+    assert cache.set("huge", 0, weight=6) == 0
+    assert cache.get("huge") is None
+
+    other = LRUCache("test.lru", max_entries=3)
+    cache.set(("root", "b"), 2)
+    other.set(("root", "b"), 2)
+    bus = InvalidationBus(client=None, channel="test")
+    message = {"origin": bus.origin, "cache": "test.lru", "key": ["root", "b"]}
+    bus.apply(json.dumps(message))
+    assert other.get(("root", "b")) == 2
+
+    bus.apply(json.dumps({**message, "origin": "another-worker"}))
+    assert cache.get(("root", "b")) is None
+    assert other.get(("root", "b")) is None
+
+    clear_caches("test.lru")
+    assert len(cache) == 0
+
+
+async def test_tiered_cache_refreshes_before_expiry(monkeypatch):
+    """
+    Test ID: CACHE-006
+    Category: Performance
+    Description: Stampede protection in get_or_compute
+    Expected Result: Values are computed once while fresh; as expiry
+        approaches, an expensive value is recomputed early by a single
+        caller, and an expired value is always recomputed
+    Type: Unit
+    """
+    monkeypatch.setattr(random, "random", lambda: 0.5)
+    clock = FakeClock()
+    cache = TieredCache(LRUCache("test.tiered", max_entries=10, ttl=60, clock=clock))
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        return {"calls": calls}
+
+    assert await cache.get_or_compute("key", compute) == {"calls": 1}
+    assert await cache.get_or_compute("key", compute) == {"calls": 1}
+
+    # Recomputing took "10 seconds", so a refresh is due well before expiry
+    await cache.set("key", {"calls": calls}, ttl=60, delta=10.0)
+    clock.now += 59
+    assert await cache.get_or_compute("key", compute) == {"calls": 2}
+
+    clock.now += 61
+    assert await cache.get_or_compute("key", compute) == {"calls": 3}
+    assert calls == 3
+
+
+class IdlePubSub:
+    """Pub/sub that times out twice before delivering one message"""
+
+    def __init__(self, data):
+        self.replies = [None, None, {"type": "message", "data": data}]
+        self.subscriptions = 0
+
+    async def subscribe(self, channel):
+        self.subscriptions += 1
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        if self.replies:
+            return self.replies.pop(0)
+        await asyncio.sleep(3600)
+
+    async def close(self):
+        pass
+
+
+class IdleClient:
+    def __init__(self, pubsub):
+        self._pubsub = pubsub
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return self._pubsub
+
+
+async def test_invalidation_listener_survives_idle_channel():
+    """
+    Test ID: CACHE-007
+    Category: Reliability
+    Description: Invalidation listener on a channel with no traffic
+    Expected Result: Reads that time out on an idle channel do not drop
+        the subscription, and a later invalidation is still applied
+    Type: Unit
+    """
+    cache = LRUCache("test.idle", max_entries=3)
+    cache.set("k", 1)
+    message = json.dumps({"origin": "another-worker", "cache": "test.idle", "key": "k"})
+    pubsub = IdlePubSub(message)
+    bus = InvalidationBus(client=IdleClient(pubsub), channel="test")
+
+    listener = asyncio.create_task(bus._listen())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    listener.cancel()
+    await asyncio.gather(listener, return_exceptions=True)
+
+    assert cache.get("k") is None
+    assert pubsub.subscriptions == 1
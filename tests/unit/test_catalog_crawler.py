@@ -0,0 +1,156 @@
+import asyncio
+import os
+import threading
+
+from src.db.models.file_catalog import FileCatalogEntry
+from src.infrastructure.storage.catalog import CatalogStorage
+from src.services.catalog_crawler import CatalogCrawler, run_periodic_crawls
+
+
+def _settle(path, seconds_ago=10):
+    # Backdate so a later change is guaranteed to bump the directory mtime
+    stamp = os.stat(path).st_mtime - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+def test_crawler_only_rescans_changed_directories(test_db, tmp_path):
+    """
+    Test ID: CAT-001
+    Category: Performance
+    Description: Incremental crawl after adding, editing and removing entries
+    Expected Result: Unchanged directories are skipped, new and changed rows
+        upserted, removed directories dropped with their subtree, and content
+        hashes kept for unchanged files
+    Type: Unit
+    """
+    (tmp_path / "a" / "deep").mkdir(parents=True)
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "deep" / "x.txt").write_text("x")
+    (tmp_path / "b" / "y.txt").write_text("y")
+    (tmp_path / "top.txt").write_text("top")
+    for path in (tmp_path / "a" / "deep", tmp_path / "a", tmp_path / "b", tmp_path):
+        _settle(path)
+
+    crawler = CatalogCrawler(tmp_path, session_factory=test_db)
+    first = crawler.crawl()
+    assert first.directories_scanned == 4
+    assert first.files_hashed == 3
+
+    again = crawler.crawl()
+    assert again.directories_scanned == 0
+    assert again.directories_skipped == 4
+
+    (tmp_path / "b" / "z.txt").write_text("z")
+    (tmp_path / "a" / "deep" / "x.txt").unlink()
+    (tmp_path / "a" / "deep").rmdir()
+    incremental = crawler.crawl()
+    assert incremental.directories_scanned == 2  # a and b; root is unchanged
+    assert incremental.files_hashed == 1
+
+    with test_db() as session:
+        paths = {
+            entry.path: entry
+            for entry in session.query(FileCatalogEntry).filter_by(
+                root=str(tmp_path.resolve())
+            )
+        }
+    assert sorted(paths) == ["", "a", "b", "b/y.txt", "b/z.txt", "top.txt"]
+    assert paths["b/z.txt"].parent == "b"
+    assert paths["top.txt"].content_hash is not None
+
+
+def test_catalog_storage_answers_from_index(test_db, tmp_path):
+    """
+    Test ID: CAT-002
+    Category: Performance
+    Description: Metadata, batch lookups and keyset pages served by the catalog
+    Expected Result: Same metadata as the filesystem, one page at a time in
+        name order, missing paths reported as None
+    Type: Unit
+    """
+    for name in ("c.txt", "a.txt", "b.txt"):
+        (tmp_path / name).write_text(name)
+    CatalogCrawler(tmp_path, session_factory=test_db).crawl()
+    storage = CatalogStorage(tmp_path.resolve(), test_db)
+
+    metadata = storage.get_metadata("a.txt")
+    assert metadata["path"] == str(tmp_path.resolve() / "a.txt")
+    assert metadata["size"] == 5 and metadata["is_file"]
+
+    found = storage.get_metadata_many(["b.txt", "missing.txt", "/c.txt"])
+    assert found[0]["size"] == 5 and found[1] is None and found[2] is not None
+
+    page, after = storage.scan_page("", None, 2)
+    assert [item["name"] for item in page] == ["a.txt", "b.txt"]
+    page, after = storage.scan_page("", after, 2)
+    assert [item["name"] for item in page] == ["c.txt"] and after is None
+
+
+async def test_cancelled_periodic_crawl_waits_for_running_crawl(tmp_path, monkeypatch):
+    """
+    Test ID: CAT-003
+    Category: Reliability
+    Description: Shutdown while a periodic crawl is running
+    Expected Result: Cancelling the crawl loop asks the running crawl to
+        stop and only completes once the crawl thread has returned
+    Type: Unit
+    """
+    started = threading.Event()
+    finished = threading.Event()
+
+    def crawl(self, full=False, stop=None):
+        started.set()
+        stop.wait(5)
+        finished.set()
+
+    monkeypatch.setattr(CatalogCrawler, "crawl", crawl)
+    task = asyncio.create_task(run_periodic_crawls([str(tmp_path)], 60))
+    await asyncio.to_thread(started.wait, 5)
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    assert task.cancelled()
+    assert finished.is_set()
+
+
+def test_stopped_crawl_is_resumed(test_db, tmp_path, monkeypatch):
+    """
+    Test ID: CAT-004
+    Category: Reliability
+    Description: Crawl stopped after the root scan, then crawled again, with
+        a symlink loop in the tree
+    Expected Result: Directories queued but never scanned are rescanned by
+        the next crawl; unreadable entries are skipped without ending it
+    Type: Unit
+    """
+    (tmp_path / "a" / "deep").mkdir(parents=True)
+    (tmp_path / "a" / "y.txt").write_text("y")
+    (tmp_path / "a" / "deep" / "x.txt").write_text("x")
+    (tmp_path / "loop").symlink_to("loop")
+    for path in (tmp_path / "a" / "deep", tmp_path / "a", tmp_path):
+        _settle(path)
+
+    crawler = CatalogCrawler(tmp_path, session_factory=test_db)
+    stop = threading.Event()
+    rescan = crawler._rescan
+
+    def rescan_once(*args):
+        stop.set()
+        return rescan(*args)
+
+    monkeypatch.setattr(crawler, "_rescan", rescan_once)
+    assert crawler.crawl(stop=stop).directories_scanned == 1
+    monkeypatch.undo()
+
+    resumed = crawler.crawl()
+    assert resumed.directories_scanned == 2  # a and a/deep; root is unchanged
+    assert crawler.crawl().directories_scanned == 0
+
+    with test_db() as session:
+        paths = sorted(
+            entry.path
+            for entry in session.query(FileCatalogEntry).filter_by(
+                root=str(tmp_path.resolve())
+            )
+        )
+    assert paths == ["", "a", "a/deep", "a/deep/x.txt", "a/y.txt"]
@@ -0,0 +1,65 @@
+import logging
+
+from sqlalchemy import text
+
+from src.core.config import settings
+from src.db.instrumentation import (
+    finish_request_tracking,
+    normalize_statement,
+    start_request_tracking,
+)
+from src.db.session import SessionLocal
+
+
+def test_normalize_statement():
+    """
+    Test ID: DB-003
+    Category: Database
+    Description: Statements differing only in literals or parameters
+    Expected Result: Normalized to one shape, with IN lists and VALUES
+        tuples collapsed
+    Type: Unit
+    """
+    assert (
+        normalize_statement(
+            "SELECT *  FROM t1 WHERE id = 5 AND name = 'it''s' AND x IN (?, ?, ?)"
+        )
+        == "SELECT * FROM t1 WHERE id = ? AND name = ? AND x IN (?)"
+    )
+    assert (
+        normalize_statement(
+            "INSERT INTO t (a, b) VALUES (%(a_0)s, %(b_0)s), (%(a_1)s, %(b_1)s)"
+        )
+        == "INSERT INTO t (a, b) VALUES (?)"
+    )
+    assert normalize_statement("SELECT $1, :name") == "SELECT ?, ?"
+
+
+def test_request_query_tracking(monkeypatch, caplog):
+    """
+    Test ID: DB-004
+    Category: Database
+    Description: Queries counted per request context
+    Expected Result: Count and DB time feed the Server-Timing value; slow
+        and repeated statements are logged
+    Type: Unit
+    """
+    monkeypatch.setattr(settings, "DB_N_PLUS_ONE_THRESHOLD", 3)
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_SECONDS", 0.0)
+    stats = start_request_tracking()
+
+    with caplog.at_level(logging.INFO), SessionLocal() as session:
+        for i in range(5):
+            session.execute(text(f"SELECT {i}"))
+        finish_request_tracking(stats, "/test")
+
+    assert stats.count == 5
+    assert stats.statements["SELECT ?"] == 5
+    assert stats.server_timing().startswith("db;dur=")
+    assert stats.server_timing().endswith('desc="5 queries"')
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(m.startswith("db_slow_query") for m in messages)
+    assert any(
+        m == "db_repeated_statement - endpoint=/test count=5 statement=SELECT ?"
+        for m in messages
+    )
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+from src.api.v1.endpoints import metrics
+
+WORKER = """
+import os
+from sqlalchemy import create_engine
+from src.db.pool import TimedQueuePool, instrument_pool
+engine = create_engine(
+    "sqlite://",
+    poolclass=TimedQueuePool,
+    pool_size=1,
+    max_overflow=2,
+    pool_logging_name="mp",
+)
+instrument_pool(engine.pool, "mp")
+held = [engine.connect() for _ in range({held})]
+returned = [engine.connect() for _ in range({returned})]
+for connection in returned:
+    connection.close()
+# Leave without returning the held connections, as a worker still serving
+os._exit(0)
+"""
+
+
+def _sample(exposition, name):
+    prefix = f'{name}{{pool="mp"}} '
+    for line in exposition.splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix) :])
+    return None
+
+
+def test_pool_gauges_in_multiprocess_mode(tmp_path, monkeypatch):
+    """
+    Test ID: DB-006
+    Category: Database
+    Description: Pool gauges under a pre-fork server
+    Expected Result: With PROMETHEUS_MULTIPROC_DIR set, the exposition sums
+        the pool size, checked-out and overflow counts of every worker,
+        with returned connections no longer counted
+    Type: Unit
+    """
+    for held, returned in ((2, 1), (1, 0)):
+        subprocess.run(
+            [sys.executable, "-c", WORKER.format(held=held, returned=returned)],
+            env={"PROMETHEUS_MULTIPROC_DIR": str(tmp_path), "PYTHONPATH": "."},
+            check=True,
+        )
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    exposition = metrics.render_metrics().decode()
+
+    assert _sample(exposition, "db_pool_size") == 2
+    assert _sample(exposition, "db_pool_checked_out") == 3
+    assert _sample(exposition, "db_pool_overflow") == 2
@@ -0,0 +1,59 @@
+import sqlite3
+
+from sqlalchemy import text
+
+from src.core.config import settings
+from src.db import session as db_session
+from src.db.instrumentation import start_request_tracking
+from src.db.replicas import ReplicaRouter
+
+
+def _served_by(session):
+    try:
+        return session.execute(text("SELECT name FROM which")).scalar()
+    except Exception:
+        return "primary"
+    finally:
+        session.close()
+
+
+def test_read_sessions_round_robin_and_fail_over(tmp_path, monkeypatch):
+    """
+    Test ID: DB-005
+    Category: Database
+    Description: Read sessions routed across replicas
+    Expected Result: Healthy replicas are used in turn, an unreachable
+        replica is skipped, the primary serves reads when no replica is
+        left, and read-your-writes stays on the primary after a write
+    Type: Unit
+    """
+    urls = []
+    for name in ("replica-a", "replica-b"):
+        path = tmp_path / f"{name}.db"
+        with sqlite3.connect(path) as connection:
+            connection.execute("CREATE TABLE which (name TEXT)")
+            connection.execute("INSERT INTO which VALUES (?)", (name,))
+        urls.append(f"sqlite:///{path}")
+    urls.insert(1, f"sqlite:///{tmp_path}/missing/unreachable.db")
+
+    router = ReplicaRouter(urls, db_session._create_replica_engine, retry_after=60)
+    monkeypatch.setattr(db_session, "replicas", router)
+
+    served = [_served_by(db_session.read_session()) for _ in range(4)]
+    assert served == ["replica-a", "replica-b", "replica-b", "replica-a"]
+
+    stats = start_request_tracking()
+    assert _served_by(db_session.read_session(read_your_writes=True)) != "primary"
+    with db_session.SessionLocal() as primary:
+        primary.execute(text("CREATE TEMP TABLE scratch (x INTEGER)"))
+        primary.execute(text("INSERT INTO scratch VALUES (1)"))
+    assert stats.wrote_at is not None
+    assert _served_by(db_session.read_session(read_your_writes=True)) == "primary"
+    monkeypatch.setattr(settings, "DB_READ_YOUR_WRITES_SECONDS", 0.0)
+    assert _served_by(db_session.read_session(read_your_writes=True)) != "primary"
+
+    for index in (0, 2):
+        router.mark_down(index, RuntimeError("down"))
+    assert _served_by(db_session.read_session()) == "primary"
+    for replica in router.reset():
+        replica.dispose()
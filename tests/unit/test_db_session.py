@@ -0,0 +1,58 @@
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from src.db.session import (
+    async_database_url,
+    check_db_connection,
+    dispose_async_engine,
+    get_db,
+)
+
+
+def test_async_database_url_swaps_driver():
+    """
+    Test ID: DB-001
+    Category: Database
+    Description: Async engine URL derived from the sync DATABASE_URL
+    Expected Result: PostgreSQL and SQLite URLs use asyncpg and aiosqlite,
+        credentials are preserved and async URLs are left untouched
+    Type: Unit
+    """
+    assert (
+        async_database_url("postgresql+psycopg2://user:secret@db:5432/app")
+        == "postgresql+asyncpg://user:secret@db:5432/app"
+    )
+    assert async_database_url("postgresql://db/app") == "postgresql+asyncpg://db/app"
+    assert (
+        async_database_url("sqlite:////tmp/app.db") == "sqlite+aiosqlite:////tmp/app.db"
+    )
+    assert (
+        async_database_url("postgresql+asyncpg://db/app")
+        == "postgresql+asyncpg://db/app"
+    )
+
+
+async def test_async_session_dependency_and_pool_metrics():
+    """
+    Test ID: DB-002
+    Category: Database
+    Description: Async get_db dependency and connection check
+    Expected Result: Queries run on an AsyncSession without blocking the
+        loop, the connection check passes and pool metrics are exported
+    Type: Unit
+    """
+    try:
+        assert await check_db_connection()
+
+        sessions = get_db()
+        db = await sessions.__anext__()
+        assert (await db.execute(text("SELECT 1"))).scalar() == 1
+        assert REGISTRY.get_sample_value("db_pool_checked_out", {"pool": "async"}) == 1
+        await sessions.aclose()
+
+        assert REGISTRY.get_sample_value("db_pool_checked_out", {"pool": "async"}) == 0
+        assert REGISTRY.get_sample_value(
+            "db_pool_wait_seconds_count", {"pool": "async"}
+        )
+    finally:
+        await dispose_async_engine()
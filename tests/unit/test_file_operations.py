@@ -22,3 +22,141 @@ def test_empty_directory(client, auth_headers, tmp_path):
     data = response.json()
     assert "contents" in data
     assert len(data["contents"]) == 0
+
+
+def test_list_with_metadata_matches_get_metadata(tmp_path):
+    """
+    Test ID: DIR-006
+    Category: File Operations
+    Description: Single-pass directory scan returns the same metadata as stat
+    Expected Result: Every scanned entry equals get_metadata for that entry,
+        dangling symlinks and entries that cannot be statted are skipped
+    Type: Unit
+    """
+    from src.infrastructure.storage.filesystem import FilesystemStorage
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_text("abc")
+    (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+    # Stat fails with ELOOP rather than FileNotFoundError
+    (tmp_path / "loop").symlink_to(tmp_path / "loop")
+
+    storage = FilesystemStorage(tmp_path)
+    items = {item.pop("name"): item for item in storage.list_with_metadata("")}
+
+    assert set(items) == {"sub", "a.txt"}
+    page, _ = storage.scan_page("", None, 10)
+    assert [item["name"] for item in page] == ["a.txt", "sub"]
+    assert items["a.txt"] == storage.get_metadata("a.txt")
+    assert items["sub"] == storage.get_metadata("sub")
+    assert items["sub"]["is_dir"] and not items["sub"]["is_file"]
+
+
+async def test_streaming_listing_pages_match_sorted_listing(tmp_path):
+    """
+    Test ID: DIR-007
+    Category: File Operations
+    Description: Bounded-memory streaming listing
+    Expected Result: Paging in streaming mode yields the same entries in the
+        same order as the sorted mode, with no duplicates
+    Type: Unit
+    """
+    from src.infrastructure.storage.filesystem import FilesystemStorage
+    from src.services.file_service import FileService
+
+    for i in range(23):
+        (tmp_path / f"file_{i:03d}.txt").write_text("x")
+
+    sorted_service = FileService(FilesystemStorage(tmp_path), streaming=False)
+    sorted_page = await sorted_service.list_directory("", limit=100)
+    expected = [item.path for item in sorted_page.contents]
+
+    service = FileService(FilesystemStorage(tmp_path), streaming=True)
+    seen, cursor = [], None
+    while True:
+        page = await service.list_directory("", limit=5, cursor=cursor)
+        seen.extend(item.path for item in page.contents)
+        if not page.pagination.has_more:
+            break
+        cursor = page.pagination.cursor
+
+    assert seen == expected
+
+
+def test_get_metadata_many_matches_get_metadata(tmp_path):
+    """
+    Test ID: FILE-010
+    Category: File Operations
+    Description: Batched metadata lookup
+    Expected Result: Results are aligned with the requested paths, equal to
+        get_metadata for existing paths and None for missing ones
+    Type: Unit
+    """
+    from src.infrastructure.storage.filesystem import FilesystemStorage
+
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "b.txt").write_text("b")
+    (tmp_path / "a.txt").write_text("a")
+
+    storage = FilesystemStorage(tmp_path)
+    paths = ["a.txt", "dir/b.txt", "dir", "", "missing.txt", "nope/c.txt"]
+    results = storage.get_metadata_many(paths)
+
+    assert results[:4] == [storage.get_metadata(path) for path in paths[:4]]
+    assert results[4:] == [None, None]
+
+
+async def test_sorted_filtered_listing_pages(test_db, tmp_path):
+    """
+    Test ID: DIR-009
+    Category: File Operations
+    Description: Listing sorted by size and mtime with filters, paged
+    Expected Result: Streaming scan, cached snapshot and catalog index all
+        return the same filtered entries in the same order, page by page
+    Type: Unit
+    """
+    import os
+
+    from src.core.interfaces.storage import ListingQuery
+    from src.infrastructure.storage.catalog import CatalogStorage
+    from src.infrastructure.storage.filesystem import FilesystemStorage
+    from src.services.catalog_crawler import CatalogCrawler
+    from src.services.file_service import FileService
+
+    (tmp_path / "sub").mkdir()
+    for i in range(12):
+        path = tmp_path / f"f{i:02d}.{'csv' if i % 3 else 'txt'}"
+        path.write_text("x" * (i % 5))
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+    CatalogCrawler(tmp_path, session_factory=test_db).crawl()
+
+    services = [
+        FileService(FilesystemStorage(tmp_path), streaming=True),
+        FileService(FilesystemStorage(tmp_path), streaming=False),
+        FileService(CatalogStorage(tmp_path.resolve(), test_db), streaming=True),
+    ]
+    queries = {
+        ListingQuery(sort="size", descending=True, extension=".CSV"): [
+            f"f{i:02d}.csv" for i in (4, 8, 7, 2, 11, 1, 10, 5)
+        ],
+        ListingQuery(sort="mtime", min_size=2, modified_after=1_000_003): [
+            "f04.csv",
+            "f07.csv",
+            "f08.csv",
+            "f09.txt",
+            "sub",
+        ],
+        ListingQuery(type="dir"): ["sub"],
+    }
+    for query, expected in queries.items():
+        for service in services:
+            seen, cursor = [], None
+            while True:
+                page = await service.list_directory(
+                    "", limit=3, cursor=cursor, query=query
+                )
+                seen.extend(item.path.rsplit("/", 1)[-1] for item in page.contents)
+                if not page.pagination.has_more:
+                    break
+                cursor = page.pagination.cursor
+            assert seen == expected, (query, service.storage)
@@ -0,0 +1,105 @@
+import os
+import time
+
+from src.infrastructure.storage.filesystem import FilesystemStorage
+from src.services.file_service import FileService
+from src.services.listing_cache import ListingCache
+
+
+async def test_listing_is_reused_until_directory_changes(tmp_path):
+    """
+    Test ID: CACHE-001
+    Category: Performance
+    Description: Paging an unchanged directory reuses one sorted snapshot
+    Expected Result: Second page is served from cache; adding an entry
+        invalidates the snapshot, and recently modified directories are
+        not cached
+    Type: Unit
+    """
+    for i in range(6):
+        (tmp_path / f"file_{i}.txt").write_text("x")
+    settled = time.time() - 60
+    os.utime(tmp_path, (settled, settled))
+
+    storage = FilesystemStorage(tmp_path)
+    calls = 0
+    list_with_metadata = storage.list_with_metadata
+
+    def counting_scan(path):
+        nonlocal calls
+        calls += 1
+        return list_with_metadata(path)
+
+    storage.list_with_metadata = counting_scan
+    cache = ListingCache(max_listings=4, max_items=100)
+    service = FileService(storage, streaming=False, listing_cache=cache)
+
+    first = await service.list_directory("", limit=3)
+    await service.list_directory("", limit=3, cursor=first.pagination.cursor)
+    assert calls == 1
+
+    (tmp_path / "file_9.txt").write_text("x")
+    listing = await service.list_directory("", limit=10)
+    assert calls == 2
+    assert len(listing.contents) == 7
+
+    await service.list_directory("", limit=10)
+    assert calls == 3
+
+
+def test_listing_cache_evicts_least_recently_used():
+    """
+    Test ID: CACHE-002
+    Category: Performance
+    Description: Cache bounded by listing count and total entries
+    Expected Result: Least recently used listings are evicted first;
+        listings larger than the item budget are never cached
+    Type: Unit
+    """
+    cache = ListingCache(max_listings=2, max_items=5)
+    cache.put(("root", "a"), "v1", [{"name": "x"}])
+    cache.put(("root", "b"), "v1", [{"name": "y"}])
+    assert cache.get(("root", "a"), "v1") is not None
+
+    cache.put(("root", "c"), "v1", [{"name": "z"}])
+    assert cache.get(("root", "b"), "v1") is None
+    assert cache.get(("root", "a"), "v1") is not None
+    assert cache.get(("root", "a"), "v2") is None
+
+    cache.put(("root", "big"), "v1", [{"name": str(i)} for i in range(6)])
+    assert cache.get(("root", "big"), "v1") is None
+
+
+async def test_listing_expires_after_in_place_edit(tmp_path):
+    """
+    Test ID: CACHE-008
+    Category: Performance
+    Description: File edited in place, which leaves the directory version
+        unchanged
+    Expected Result: The cached listing and its version are kept until the
+        TTL has passed; the rebuilt listing shows the new size under a new
+        version
+    Type: Unit
+    """
+    (tmp_path / "log.txt").write_text("x")
+    settled = time.time() - 60
+    os.utime(tmp_path, (settled, settled))
+
+    now = 100.0
+    cache = ListingCache(max_listings=4, max_items=100, ttl=5)
+    cache._cache.clock = lambda: now
+    service = FileService(
+        FilesystemStorage(tmp_path), streaming=False, listing_cache=cache
+    )
+    version = await service.directory_version("")
+    assert (await service.list_directory("")).contents[0].size == 1
+
+    with open(tmp_path / "log.txt", "a") as log:
+        log.write("yz")
+    os.utime(tmp_path, (settled, settled))
+    assert await service.directory_version("") == version
+    assert (await service.list_directory("")).contents[0].size == 1
+
+    now += 5
+    assert await service.directory_version("") != version
+    assert (await service.list_directory("")).contents[0].size == 3
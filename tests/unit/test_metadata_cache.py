@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from src.core.cache.memory import CACHE_LOOKUPS
+from src.core.exceptions import FileNotFoundError
+from src.infrastructure.storage.cached import CachedStorage, MetadataCache
+from src.infrastructure.storage.filesystem import FilesystemStorage
+
+
+class CountingStorage(FilesystemStorage):
+    def __init__(self, base_path):
+        super().__init__(base_path)
+        self.metadata_calls = 0
+        self.validator_calls = 0
+
+    def get_metadata(self, path):
+        self.metadata_calls += 1
+        return super().get_metadata(path)
+
+    def get_validator(self, path):
+        self.validator_calls += 1
+        return super().get_validator(path)
+
+
+def test_metadata_served_from_cache_within_ttl(tmp_path):
+    """
+    Test ID: CACHE-003
+    Category: Performance
+    Description: Repeated metadata lookups within the TTL
+    Expected Result: Backend is hit once, with lookups counted against the
+        backend type; invalidate forces a refetch
+    Type: Unit
+    """
+    (tmp_path / "a.txt").write_text("abc")
+    backend = CountingStorage(tmp_path)
+    storage = CachedStorage(
+        backend, MetadataCache(ttl=60, max_entries=10, backend="CountingStorage")
+    )
+
+    def lookups(result):
+        return CACHE_LOOKUPS.labels(
+            "storage.metadata", "CountingStorage", result
+        )._value.get()
+
+    assert storage.get_metadata("a.txt") == storage.get_metadata("a.txt")
+    assert backend.metadata_calls == 1
+    assert (lookups("hit"), lookups("miss")) == (1, 1)
+
+    storage.invalidate("a.txt")
+    storage.get_metadata("a.txt")
+    assert backend.metadata_calls == 2
+
+
+def test_expired_metadata_is_revalidated(tmp_path):
+    """
+    Test ID: CACHE-004
+    Category: Performance
+    Description: Lookups after the TTL expired
+    Expected Result: Unchanged files are revalidated with a single stat,
+        changed files are refetched, deleted files raise FileNotFoundError
+    Type: Unit
+    """
+    test_file = tmp_path / "a.txt"
+    test_file.write_text("abc")
+    backend = CountingStorage(tmp_path)
+    storage = CachedStorage(backend, MetadataCache(ttl=0, max_entries=10))
+
+    storage.get_metadata("a.txt")
+    storage.get_metadata("a.txt")
+    assert (backend.metadata_calls, backend.validator_calls) == (1, 1)
+
+    test_file.write_text("abcdef")
+    os.utime(test_file, (1, 1))
+    assert storage.get_metadata("a.txt")["size"] == 6
+    assert backend.metadata_calls == 2
+
+    test_file.unlink()
+    with pytest.raises(FileNotFoundError):
+        storage.get_metadata("a.txt")
@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+from src.api.v1.endpoints import metrics
+from src.core.config import settings
+
+WORKER = """
+from prometheus_client import Counter
+Counter("worker_jobs_total", "Jobs handled").inc({count})
+"""
+
+
+async def test_metrics_aggregate_workers_and_are_cached(tmp_path, monkeypatch):
+    """
+    Test ID: METRICS-002
+    Category: Monitoring
+    Description: Metrics exposition under a pre-fork server
+    Expected Result: With PROMETHEUS_MULTIPROC_DIR set, the exposition sums
+        the counters of every worker process; a rendered exposition is
+        reused until METRICS_CACHE_TTL has passed
+    Type: Unit
+    """
+    for count in (2, 3):
+        subprocess.run(
+            [sys.executable, "-c", WORKER.format(count=count)],
+            env={"PROMETHEUS_MULTIPROC_DIR": str(tmp_path)},
+            check=True,
+        )
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    assert "worker_jobs_total 5.0" in metrics.render_metrics().decode()
+
+    renders = 0
+
+    def counting_render():
+        nonlocal renders
+        renders += 1
+        return str(renders).encode()
+
+    monkeypatch.setattr(metrics, "render_metrics", counting_render)
+    monkeypatch.setattr(metrics, "_exposition", None)
+    monkeypatch.setattr(settings, "METRICS_CACHE_TTL", 60.0)
+    assert await metrics.cached_metrics() == await metrics.cached_metrics() == b"1"
+
+    monkeypatch.setattr(settings, "METRICS_CACHE_TTL", 0.0)
+    assert await metrics.cached_metrics() == b"2"
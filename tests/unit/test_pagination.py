@@ -0,0 +1,58 @@
+import pytest
+
+from src.services.pagination import CursorState, PaginationService
+
+
+def test_cursor_resumes_from_position_hint():
+    """
+    Test ID: PAGE-001
+    Category: Pagination
+    Description: Cursor issued against an unchanged snapshot
+    Expected Result: Next page starts right after the last item served
+    Type: Unit
+    """
+    items = [f"file_{i:03d}" for i in range(10)]
+    first = PaginationService.paginate(items, limit=4, version="v1")
+    second = PaginationService.paginate(
+        items, limit=4, cursor=first.cursor, version="v1"
+    )
+
+    assert first.items == items[:4]
+    assert second.items == items[4:8]
+    assert PaginationService.decode_cursor(first.cursor) == CursorState(
+        key="file_003", position=4, version="v1"
+    )
+
+
+def test_cursor_falls_back_to_bisect_when_version_changes():
+    """
+    Test ID: PAGE-002
+    Category: Pagination
+    Description: Entries are added before the cursor between two pages
+    Expected Result: Next page still starts after the last key served
+    Type: Unit
+    """
+    items = ["b", "d", "f", "h"]
+    first = PaginationService.paginate(items, limit=2, version="v1")
+
+    changed = ["a", "b", "c", "d", "e", "f", "h"]
+    second = PaginationService.paginate(
+        changed, limit=2, cursor=first.cursor, version="v2"
+    )
+
+    assert first.items == ["b", "d"]
+    assert second.items == ["e", "f"]
+    assert second.has_more is True
+
+
+@pytest.mark.parametrize("cursor", ["invalid_cursor", "e30=", "WzFd"])
+def test_invalid_cursor_is_rejected(cursor):
+    """
+    Test ID: PAGE-003
+    Category: Pagination
+    Description: Malformed or foreign cursor
+    Expected Result: ValueError
+    Type: Unit
+    """
+    with pytest.raises(ValueError):
+        PaginationService.paginate(["a"], limit=1, cursor=cursor)
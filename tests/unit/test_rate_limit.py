@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from src.core.rate_limit import (
+    MemoryBackend,
+    RateLimit,
+    RateLimiter,
+    parse_route_limits,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_gcra_allows_bursts_then_paces_requests():
+    """
+    Test ID: RATE-001
+    Category: Rate Limiting
+    Description: GCRA limiting with the in-memory backend
+    Expected Result: A full burst is allowed, the next request is denied
+        with a Retry-After of one emission interval, capacity returns at
+        the configured rate, and keys are limited independently
+    Type: Unit
+    """
+    clock = FakeClock()
+    limiter = RateLimiter(MemoryBackend(clock), default=RateLimit.parse("5/second"))
+
+    def check(key="ip:a"):
+        return asyncio.run(limiter.check("hello", [key]))
+
+    decisions = [check() for _ in range(5)]
+    assert all(decision.allowed for decision in decisions)
+    assert [decision.remaining for decision in decisions] == [4, 3, 2, 1, 0]
+
+    denied = check()
+    assert not denied.allowed
+    assert denied.retry_after == pytest.approx(0.2)
+    assert denied.headers()["Retry-After"] == "1"
+    assert denied.headers()["RateLimit-Limit"] == "5"
+    assert check("ip:b").allowed
+
+    clock.now += 0.2
+    assert check().allowed
+    assert not check().allowed
+
+
+def test_route_limits_and_multiple_keys():
+    """
+    Test ID: RATE-002
+    Category: Rate Limiting
+    Description: Per-route limits applied to several keys
+    Expected Result: Route overrides take precedence over the default,
+        the most restrictive key decides, and invalid limits are rejected
+    Type: Unit
+    """
+    routes = parse_route_limits("files.batch=2/minute, files.list=100/2hours")
+    assert routes["files.list"] == RateLimit(rate=100, period=7200.0)
+    limiter = RateLimiter(
+        MemoryBackend(FakeClock()), default=RateLimit.parse("10/second"), routes=routes
+    )
+
+    first = asyncio.run(limiter.check("files.batch", ["sub:a", "ip:1"]))
+    assert first.allowed and first.remaining == 1
+    asyncio.run(limiter.check("files.batch", ["sub:a", "ip:2"]))
+    # The subject is out of capacity even though this address is not
+    assert not asyncio.run(limiter.check("files.batch", ["sub:a", "ip:3"])).allowed
+    assert asyncio.run(limiter.check("files.list", ["sub:a", "ip:3"])).allowed
+
+    with pytest.raises(ValueError):
+        RateLimit.parse("ten/minute")
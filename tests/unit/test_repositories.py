@@ -0,0 +1,65 @@
+from src.db.models import ExampleModel
+from src.db.repositories import Repository
+
+
+def test_bulk_insert_and_upsert(test_db):
+    """
+    Test ID: REPO-001
+    Category: Database
+    Description: Bulk insert followed by an upsert overlapping existing rows
+    Expected Result: New rows inserted, conflicting rows updated in place,
+        batches larger than the bind parameter limit split transparently
+    Type: Unit
+    """
+    with test_db() as session:
+        repository = Repository(session, ExampleModel)
+        rows = [{"id": i, "name": f"row-{i}"} for i in range(20_000)]
+        assert repository.bulk_insert(rows) == 20_000
+        repository.bulk_upsert(
+            [{"id": 1, "name": "updated"}, {"id": 20_000, "name": "new"}],
+            conflict=("id",),
+        )
+        session.commit()
+
+        assert session.query(ExampleModel).count() == 20_001
+        assert repository.get(1).name == "updated"
+        assert repository.get(20_000).name == "new"
+
+
+def test_keyset_pages_and_streaming(test_db):
+    """
+    Test ID: REPO-002
+    Category: Database
+    Description: Keyset pagination and server-side streaming over a table
+    Expected Result: Pages in both directions visit every matching row once
+        in order; streaming yields all rows; malformed cursors are rejected
+    Type: Unit
+    """
+    import pytest
+
+    with test_db() as session:
+        repository = Repository(session, ExampleModel)
+        repository.bulk_insert([{"id": i, "name": f"n{i % 3}"} for i in range(1, 26)])
+        session.commit()
+
+        for descending in (False, True):
+            seen, cursor = [], None
+            while True:
+                page = repository.keyset_page(
+                    order_by=[ExampleModel.name, ExampleModel.id],
+                    limit=4,
+                    cursor=cursor,
+                    where=[ExampleModel.id > 5],
+                    descending=descending,
+                )
+                seen.extend((row.name, row.id) for row in page.items)
+                if not page.has_more:
+                    break
+                cursor = page.cursor
+            expected = sorted((f"n{i % 3}", i) for i in range(6, 26))
+            assert seen == (expected[::-1] if descending else expected)
+
+        assert [row.id for row in repository.stream(batch_size=7)] == list(range(1, 26))
+
+        with pytest.raises(ValueError):
+            repository.keyset_page(order_by=[ExampleModel.id], limit=4, cursor=cursor)
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.infrastructure.storage.filesystem import FilesystemStorage
+from src.services.file_service import FileService
+from src.services.listing_cache import ListingCache
+from src.services.single_flight import SINGLE_FLIGHT_CALLS, SingleFlight
+
+
+def _waiters(operation):
+    return SINGLE_FLIGHT_CALLS.labels(operation, "waiter")._value.get()
+
+
+async def test_identical_listings_share_one_scan(tmp_path):
+    """
+    Test ID: FLIGHT-001
+    Category: Performance
+    Description: Concurrent identical listings are coalesced
+    Expected Result: A burst of identical list requests runs one directory
+        scan, every caller gets the same page and the waiters are counted;
+        a different page runs its own scan
+    Type: Unit
+    """
+    for i in range(3):
+        (tmp_path / f"file_{i}.txt").write_text("x")
+    storage = FilesystemStorage(tmp_path)
+    release = threading.Event()
+    calls = 0
+    list_with_metadata = storage.list_with_metadata
+
+    def slow_scan(path):
+        nonlocal calls
+        calls += 1
+        release.wait(5)
+        return list_with_metadata(path)
+
+    storage.list_with_metadata = slow_scan
+    service = FileService(
+        storage,
+        streaming=False,
+        listing_cache=ListingCache(max_listings=0, max_items=0),
+    )
+    waiters = _waiters("list_directory")
+
+    tasks = [asyncio.create_task(service.list_directory("", limit=2)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    release.set()
+    pages = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert all(page is pages[0] for page in pages)
+    assert _waiters("list_directory") == waiters + 4
+    assert len(service.single_flight) == 0
+
+    await service.list_directory("", limit=3)
+    assert calls == 2
+
+
+async def test_errors_reach_every_caller_and_cancellation_is_isolated():
+    """
+    Test ID: FLIGHT-002
+    Category: Reliability
+    Description: Failures and cancellation of coalesced operations
+    Expected Result: An error is raised to every caller sharing the call;
+        cancelling the caller that started a call does not cancel it for
+        the callers waiting on it
+    Type: Unit
+    """
+    flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise FileNotFoundError("gone")
+
+    tasks = [asyncio.create_task(flight.do("read", "a", failing)) for _ in range(3)]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, FileNotFoundError) for result in results)
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.create_task(flight.do("read", "b", slow))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(flight.do("read", "b", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await waiter == "done"
+    assert len(flight) == 0
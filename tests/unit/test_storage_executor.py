@@ -0,0 +1,68 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.infrastructure.storage.executor import StorageExecutor
+
+
+async def test_storage_calls_run_off_the_event_loop():
+    """
+    Test ID: PERF-EXEC-001
+    Category: Performance
+    Description: Storage calls run on the dedicated storage pool
+    Expected Result: Call executes on a storage worker thread, loop thread is free
+    Type: Unit
+    """
+    executor = StorageExecutor(max_workers=2, thread_name_prefix="storage-test")
+    try:
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+        assert thread_name.startswith("storage-test")
+        assert thread_name != threading.current_thread().name
+    finally:
+        executor.shutdown()
+
+
+async def test_storage_executor_is_bounded():
+    """
+    Test ID: PERF-EXEC-002
+    Category: Performance
+    Description: Pool never runs more calls than its configured size
+    Expected Result: Peak concurrency equals max_workers
+    Type: Unit
+    """
+    executor = StorageExecutor(max_workers=2)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def blocking_call():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        release.wait(timeout=5)
+        with lock:
+            running -= 1
+
+    try:
+        tasks = [asyncio.create_task(executor.run(blocking_call)) for _ in range(5)]
+        await asyncio.sleep(0.1)
+        release.set()
+        await asyncio.gather(*tasks)
+        assert peak == 2
+    finally:
+        executor.shutdown()
+
+
+def test_storage_executor_rejects_empty_pool():
+    """
+    Test ID: PERF-EXEC-003
+    Category: Performance
+    Description: Executor configured without workers
+    Expected Result: ValueError
+    Type: Unit
+    """
+    with pytest.raises(ValueError):
+        StorageExecutor(max_workers=0)
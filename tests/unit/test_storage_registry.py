@@ -0,0 +1,52 @@
+from src.infrastructure.storage.registry import StorageRegistry
+
+
+async def test_registry_shares_roots_across_spellings(tmp_path):
+    """
+    Test ID: REG-001
+    Category: Performance
+    Description: Same base path requested under different spellings
+    Expected Result: One shared root (backend, caches, service) per
+        canonical path, including through symlinks; cache metrics are
+        labelled with the backend type rather than the path
+    Type: Unit
+    """
+    (tmp_path / "data").mkdir()
+    (tmp_path / "alias").symlink_to(tmp_path / "data")
+    registry = StorageRegistry(max_roots=4)
+
+    root = await registry.get(str(tmp_path / "data"))
+    assert await registry.get(f"{tmp_path}/data/") is root
+    assert await registry.get(f"{tmp_path}/./data") is root
+    assert await registry.get(str(tmp_path / "alias")) is root
+    assert root.file_service.storage is root.storage
+    assert root.metadata_cache.backend == "FilesystemStorage"
+
+
+async def test_registry_evicts_least_recently_used_root(tmp_path):
+    """
+    Test ID: REG-002
+    Category: Performance
+    Description: More roots requested than the registry holds
+    Expected Result: Least recently used root is evicted and its caches
+        cleared; shutdown releases all roots
+    Type: Unit
+    """
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+    registry = StorageRegistry(max_roots=2)
+
+    root_a = await registry.get(str(tmp_path / "a"))
+    root_b = await registry.get(str(tmp_path / "b"))
+    root_b.metadata_cache.set(("b", "x.txt"), {})
+    await registry.get(str(tmp_path / "a"))
+    await registry.get(str(tmp_path / "c"))
+
+    assert len(root_b.metadata_cache) == 0
+    assert await registry.get(str(tmp_path / "a")) is root_a
+    assert await registry.get(str(tmp_path / "b")) is not root_b
+
+    root_a.metadata_cache.set(("a", "x.txt"), {})
+    registry.shutdown()
+    assert len(root_a.metadata_cache) == 0
+    assert await registry.get(str(tmp_path / "a")) is not root_a
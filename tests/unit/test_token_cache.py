@@ -0,0 +1,72 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.dependencies.auth import verify_token
+from src.core.config import settings
+from src.core.exceptions import InvalidTokenError
+from src.core.token_cache import TokenCache, get_token_cache
+from tests.conftest import create_test_token
+
+
+@pytest.fixture
+def token_cache():
+    cache = get_token_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_verified_tokens_are_cached_until_rotation(token_cache, monkeypatch):
+    """
+    Test ID: AUTH-CACHE-001
+    Category: Authentication
+    Description: Verified token payloads served from the cache
+    Expected Result: The second verification is a cache hit, scope checks
+        still apply to cached tokens, and rotating the secret drops cached
+        tokens so they are verified against the new secret
+    Type: Unit
+    """
+    token = create_test_token(scopes=["files:read"])
+    hits = token_cache.hits
+    assert verify_token(token)["sub"] == "test-user"
+    assert verify_token(token)["sub"] == "test-user"
+    assert token_cache.hits == hits + 1
+
+    unscoped = create_test_token(scopes=["files:write"])
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            verify_token(unscoped)
+        assert exc_info.value.status_code == 403
+
+    monkeypatch.setattr(settings, "AUTH_SECRET_KEY", "rotated-secret-key")
+    with pytest.raises(InvalidTokenError):
+        verify_token(token)
+    assert len(token_cache) == 0
+
+
+def test_cache_entries_expire_and_are_bounded():
+    """
+    Test ID: AUTH-CACHE-002
+    Category: Authentication
+    Description: Token cache expiry and capacity
+    Expected Result: Entries are not served past the token's exp, and the
+        least recently used entry is evicted once the cache is full
+    Type: Unit
+    """
+    cache = TokenCache(max_entries=2, max_ttl=300)
+    now = time.time()
+    assert cache.get("a") is None
+    cache.put("a", {"exp": now + 60}, frozenset())
+    cache.put("b", {"exp": now + 60}, frozenset())
+    assert cache.get("a") is not None
+    cache.put("c", {"exp": now + 60}, frozenset())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    cache.put("short", {"exp": time.time() + 0.05}, frozenset())
+    cache.put("expired", {"exp": time.time() - 1}, frozenset())
+    assert cache.get("expired") is None
+    time.sleep(0.1)
+    assert cache.get("short") is None